@@ -1,23 +1,55 @@
+from collections import OrderedDict
+from typing import Any, Tuple
+
 from app.models.schemas import IntentOutput
 from app.utils.config import load_agents_config
+from app.utils import ollama
 from app.utils.ollama import call_ollama_json
+from app.utils.prompting import format_history
+
+_INTENT_SUFFIX = (
+    "\n\n"
+    "Return ONLY a single JSON object with double quotes and no markdown or extra text.\n"
+    "Required keys and values:\n"
+    '- "intent_label": string describing the user intent.\n'
+    '- "search_queries": array of strings.\n'
+    '- "success_criteria": array of strings.\n'
+    '- "context": string or null.\n\n'
+    "IMPORTANT: If the user is asking about a specific named policy or the organization's official policy "
+    '(e.g., "What is the remote work policy?" or "What is THE remote work policy?"), set the "context" '
+    'field to a JSON-like string: "specific_policy: true". If the user is asking for a general definition '
+    '(e.g., "What is a remote work policy?"), set "context" to "specific_policy: false".\n'
+)
+
+# Assumes that with temperature 0 the same model, options and prompt give the
+# same intent, so retries of a turn skip Ollama. Keyed on all three; bypassed
+# when OLLAMA_TEMPERATURE makes generation a random sample.
+INTENT_CACHE_SIZE = 256
+_intent_cache: "OrderedDict[Tuple[Any, ...], IntentOutput]" = OrderedDict()
 
 
 async def analyze_intent(conversation_history: list, user_question: str) -> IntentOutput:
     config = load_agents_config()
     system_prompt = config["agents"]["intent"]["system_prompt"]
-    prompt = (
-        f"{system_prompt}\n\nConversation history: {conversation_history}\n"
-        f"User question: {user_question}\n\n"
-        "Return ONLY a single JSON object with double quotes and no markdown or extra text.\n"
-        "Required keys and values:\n"
-        '- "intent_label": string describing the user intent.\n'
-        '- "search_queries": array of strings.\n'
-        '- "success_criteria": array of strings.\n'
-        '- "context": string or null.\n\n'
-        "IMPORTANT: If the user is asking about a specific named policy or the organization's official policy "
-        '(e.g., "What is the remote work policy?" or "What is THE remote work policy?"), set the "context" '
-        'field to a JSON-like string: "specific_policy: true". If the user is asking for a general definition '
-        '(e.g., "What is a remote work policy?"), set "context" to "specific_policy: false".\n'
+    prompt = "".join(
+        (
+            system_prompt,
+            "\n\nConversation history:\n",
+            format_history(conversation_history, config),
+            "\nUser question: ",
+            user_question,
+            _INTENT_SUFFIX,
+        )
     )
-    return await call_ollama_json(prompt, IntentOutput)
+    if ollama.OLLAMA_OPTIONS.get("temperature", 0) > 0:
+        return await call_ollama_json(prompt, IntentOutput)
+    key = (ollama.OLLAMA_MODEL, tuple(sorted(ollama.OLLAMA_OPTIONS.items())), prompt)
+    cached = _intent_cache.get(key)
+    if cached is not None:
+        _intent_cache.move_to_end(key)
+        return cached.model_copy(deep=True)
+    result = await call_ollama_json(prompt, IntentOutput)
+    _intent_cache[key] = result.model_copy(deep=True)
+    if len(_intent_cache) > INTENT_CACHE_SIZE:
+        _intent_cache.popitem(last=False)
+    return result
@@ -1,7 +1,17 @@
+from operator import itemgetter
 from typing import List, Dict
 from app.models.schemas import ResearchOutput
 from app.utils.config import load_agents_config
 from app.utils.ollama import call_ollama_json
+from app.utils.prompting import prompt_json
+
+_RESEARCH_SUFFIX = (
+    "\n\n"
+    "Return ONLY a single JSON object with double quotes and no markdown or extra text.\n"
+    "Required keys and values:\n"
+    '- "hits": array of objects with keys "doc_id", "chunk_id", "url", "title", "score", "text".\n'
+    '- "total_results": integer.\n'
+)
 
 
 def aggregate_hits_by_doc(hits: List[dict]) -> List[dict]:
@@ -10,45 +20,40 @@ def aggregate_hits_by_doc(hits: List[dict]) -> List[dict]:
     Returns a list of documents with aggregated scores and match counts.
     """
     agg = {}
+    agg_get = agg.get
     for h in hits:
-        doc_id = h.get('doc_id', '')
-        score = h.get('score', 0.0)
-        text = h.get('text', '')
-        title = h.get('title') or h.get('doc_title') or ''
-        url = h.get('url') or h.get('source_url') or ''
+        h_get = h.get
+        doc_id = h_get('doc_id', '')
+        score = h_get('score', 0.0)
+        agg_doc = agg_get(doc_id)
 
-        if doc_id not in agg:
+        if agg_doc is None:
+            text = h_get('text', '')
             agg[doc_id] = {
                 'doc_id': doc_id,
-                'title': title,
-                'url': url,
+                'title': h_get('title') or h_get('doc_title') or '',
+                'url': h_get('url') or h_get('source_url') or '',
                 'best_score': score,
                 'total_score': score,
                 'match_count': 1,
                 'snippet': text[:500] if text else ''  # Keep first 500 chars of best snippet
             }
         else:
-            agg_doc = agg[doc_id]
             agg_doc['total_score'] += score
             agg_doc['match_count'] += 1
             if score > agg_doc['best_score']:
+                text = h_get('text', '')
                 agg_doc['best_score'] = score
                 agg_doc['snippet'] = text[:500] if text else ''
 
     docs = list(agg.values())
     # Sort by best_score first, then total_score as tiebreaker
-    docs.sort(key=lambda d: (d['best_score'], d['total_score']), reverse=True)
+    docs.sort(key=itemgetter('best_score', 'total_score'), reverse=True)
     return docs
 
 
 async def summarize_research(search_results: dict) -> ResearchOutput:
     config = load_agents_config()
     system_prompt = config["agents"]["research"]["system_prompt"]
-    prompt = (
-        f"{system_prompt}\n\nSearch results: {search_results}\n\n"
-        "Return ONLY a single JSON object with double quotes and no markdown or extra text.\n"
-        "Required keys and values:\n"
-        '- "hits": array of objects with keys "doc_id", "chunk_id", "url", "title", "score", "text".\n'
-        '- "total_results": integer.\n'
-    )
+    prompt = "".join((system_prompt, "\n\nSearch results: ", prompt_json(search_results), _RESEARCH_SUFFIX))
     return await call_ollama_json(prompt, ResearchOutput)
@@ -1,12 +1,36 @@
-from app.models.schemas import SynthesisOutput
+from typing import Tuple
+
+from app.models.schemas import SynthesisOutput, SynthValidationOutput, ValidationOutput
 from app.utils.config import load_agents_config
 from app.utils.ollama import call_ollama_json
+from app.utils.prompting import compact_research, prompt_json
 
+_SYNTHESIS_SUFFIX = (
+    "\n\n"
+    "Return ONLY a single JSON object with double quotes and no markdown or extra text.\n"
+    "Required keys and values:\n"
+    '- "draft_answer": string (include inline citations like [1], [2] if applicable).\n'
+    '- "citations_used": array of strings (list of doc_ids or sources used).\n'
+)
+
+_SYNTH_VALIDATE_SUFFIX = (
+    "\n\n"
+    "Requirements:\n"
+    "- Ensure every paragraph has at least one citation like [1].\n"
+    "- Use only the provided sources; drop or rewrite any unsupported claims.\n"
+    "- If sources are missing or weak, you may ask for clarification.\n"
+    "Return ONLY a single JSON object with double quotes and no markdown or extra text.\n"
+    "Required keys and values:\n"
+    '- "draft": object with keys "draft_answer" (string with inline citations like [1], [2]) '
+    'and "citations_used" (array of strings).\n'
+    '- "validation": object with keys "status" (string, e.g. "final" or "needs_clarification"), '
+    '"final_answer" (string or null), "needs_clarification" (boolean), '
+    '"clarifying_question" (string or null) and "reasoning" (string or null).\n'
+)
 
-async def synthesize_answer(intent: dict, research: dict, docs: list = None) -> SynthesisOutput:
-    config = load_agents_config()
-    system_prompt = config["agents"]["synthesis"]["system_prompt"]
 
+def _build_source_instructions(intent: dict, docs: list = None) -> str:
+    """Build the numbered source list and policy instructions shared by synthesis prompts."""
     # Check if this is a specific policy question
     intent_context = intent.get('context', '')
     is_specific_policy = 'specific_policy: true' in str(intent_context)
@@ -21,13 +45,15 @@ async def synthesize_answer(intent: dict, research: dict, docs: list = None) ->
     # Build citation instructions
     citation_instructions = ""
     if docs:
-        citation_instructions = "\n\nAvailable sources (use these for inline citations):\n"
-        for idx, doc in enumerate(docs[:6], 1):  # Only use top 6 docs
-            citation_instructions += (
-                f"[{idx}] Title: {doc.get('title', 'Unknown')}\n"
-                f"    URL: {doc.get('url', '')}\n"
-                f"    Snippet: \"{doc.get('snippet', '')[:200]}...\"\n"
-            )
+        lines = ["\n\nAvailable sources (use these for inline citations):"]
+        lines.extend(
+            f"[{idx}] Title: {doc.get('title', 'Unknown')}\n"
+            f"    URL: {doc.get('url', '')}\n"
+            f"    Snippet: \"{(doc.get('snippet') or '')[:200]}...\""
+            for idx, doc in enumerate(docs[:6], 1)  # Only use top 6 docs
+        )
+        lines.append("")
+        citation_instructions = "\n".join(lines)
 
     policy_instruction = ""
     if is_specific_policy:
@@ -51,13 +77,59 @@ async def synthesize_answer(intent: dict, research: dict, docs: list = None) ->
                 "- The top source indicates BYU; assume BYU policy context without asking which organization.\n"
             )
 
-    prompt = (
-        f"{system_prompt}\n\nIntent: {intent}\nResearch: {research}\n"
-        f"{citation_instructions}"
-        f"{policy_instruction}\n\n"
-        "Return ONLY a single JSON object with double quotes and no markdown or extra text.\n"
-        "Required keys and values:\n"
-        '- "draft_answer": string (include inline citations like [1], [2] if applicable).\n'
-        '- "citations_used": array of strings (list of doc_ids or sources used).\n'
+    return f"{citation_instructions}{policy_instruction}"
+
+
+async def synthesize_answer(intent: dict, research: dict, docs: list = None) -> SynthesisOutput:
+    config = load_agents_config()
+    system_prompt = config["agents"]["synthesis"]["system_prompt"]
+    source_instructions = _build_source_instructions(intent, docs)
+
+    prompt = "".join(
+        (
+            system_prompt,
+            "\n\nIntent: ",
+            prompt_json(intent),
+            "\nResearch: ",
+            prompt_json(compact_research(research, config)),
+            "\n",
+            source_instructions,
+            _SYNTHESIS_SUFFIX,
+        )
     )
     return await call_ollama_json(prompt, SynthesisOutput)
+
+
+async def synthesize_and_validate(
+    question: str, intent: dict, research: dict, docs: list = None
+) -> Tuple[SynthesisOutput, ValidationOutput]:
+    """
+    Draft and self-check an answer in a single Ollama call.
+
+    The model returns {"draft": {...}, "validation": {...}}; the two halves are
+    split back into the regular SynthesisOutput/ValidationOutput models.
+    """
+    config = load_agents_config()
+    synthesis_prompt = config["agents"]["synthesis"]["system_prompt"]
+    validation_prompt = config["agents"]["validation"]["system_prompt"]
+    source_instructions = _build_source_instructions(intent, docs)
+
+    prompt = "".join(
+        (
+            "Step 1 - draft the answer:\n",
+            synthesis_prompt,
+            "\nStep 2 - validate your own draft:\n",
+            validation_prompt,
+            "\nUser question: ",
+            question,
+            "\nIntent: ",
+            prompt_json(intent),
+            "\nResearch: ",
+            prompt_json(compact_research(research, config)),
+            "\n",
+            source_instructions,
+            _SYNTH_VALIDATE_SUFFIX,
+        )
+    )
+    result = await call_ollama_json(prompt, SynthValidationOutput)
+    return result.draft, result.validation
@@ -1,12 +1,29 @@
+import re
+
 from app.models.schemas import ValidationOutput
 from app.utils.config import load_agents_config
 from app.utils.ollama import call_ollama_json
+from app.utils.prompting import compact_research, prompt_json
 
+_CITE_RE = re.compile(r'\[\d+\]')
 
-import re
-from app.models.schemas import ValidationOutput
-from app.utils.config import load_agents_config
-from app.utils.ollama import call_ollama_json
+_VALIDATION_REQUIREMENTS = (
+    "\n"
+    "Requirements:\n"
+    "- Ensure every paragraph has at least one citation like [1].\n"
+    "- Use only the provided sources; drop or rewrite any unsupported claims.\n"
+)
+
+_VALIDATION_SUFFIX = (
+    "- If sources are missing or weak, you may ask for clarification.\n"
+    "Return ONLY a single JSON object with double quotes and no markdown or extra text.\n"
+    "Required keys and values:\n"
+    '- "status": string (e.g., "final" or "needs_clarification").\n'
+    '- "final_answer": string or null.\n'
+    '- "needs_clarification": boolean.\n'
+    '- "clarifying_question": string or null.\n'
+    '- "reasoning": string or null.\n'
+)
 
 
 async def validate_answer(question: str, draft_answer: str, research: dict, intent_context: str = None) -> ValidationOutput:
@@ -14,7 +31,7 @@ async def validate_answer(question: str, draft_answer: str, research: dict, inte
     system_prompt = config["agents"]["validation"]["system_prompt"]
 
     # Check if citations are present
-    has_citations = bool(re.search(r'\[\d+\]', draft_answer))
+    has_citations = bool(_CITE_RE.search(draft_answer))
     is_specific_policy = intent_context and 'specific_policy: true' in str(intent_context)
     sources = research.get("docs") or []
     byu_source = False
@@ -26,7 +43,7 @@ async def validate_answer(question: str, draft_answer: str, research: dict, inte
             byu_source = True
 
     paragraphs = [p.strip() for p in draft_answer.split("\n\n") if p.strip()]
-    uncited_paragraphs = [p for p in paragraphs if not re.search(r'\[\d+\]', p)]
+    uncited_paragraphs = [p for p in paragraphs if not _CITE_RE.search(p)]
 
     citation_check = ""
     if is_specific_policy and not has_citations:
@@ -42,34 +59,35 @@ async def validate_answer(question: str, draft_answer: str, research: dict, inte
 
     source_context = ""
     if sources:
-        source_context = "\n\nAvailable sources for grounding:\n"
-        for idx, doc in enumerate(sources[:6], 1):
-            source_context += (
-                f"[{idx}] Title: {doc.get('title', 'Unknown')}\n"
-                f"    URL: {doc.get('url', '')}\n"
-                f"    Snippet: \"{doc.get('snippet', '')[:200]}...\"\n"
-            )
+        lines = ["\n\nAvailable sources for grounding:"]
+        lines.extend(
+            f"[{idx}] Title: {doc.get('title', 'Unknown')}\n"
+            f"    URL: {doc.get('url', '')}\n"
+            f"    Snippet: \"{(doc.get('snippet') or '')[:200]}...\""
+            for idx, doc in enumerate(sources[:6], 1)
+        )
+        lines.append("")
+        source_context = "\n".join(lines)
 
     byu_instruction = ""
     if byu_source:
         byu_instruction = "- The top source indicates BYU; do not ask which organization.\n"
 
-    prompt = (
-        f"{system_prompt}\n\nUser question: {question}\nDraft answer: {draft_answer}\n"
-        f"Research context: {research}\n"
-        f"{source_context}"
-        f"{citation_check}\n"
-        "Requirements:\n"
-        "- Ensure every paragraph has at least one citation like [1].\n"
-        "- Use only the provided sources; drop or rewrite any unsupported claims.\n"
-        f"{byu_instruction}"
-        "- If sources are missing or weak, you may ask for clarification.\n"
-        "Return ONLY a single JSON object with double quotes and no markdown or extra text.\n"
-        "Required keys and values:\n"
-        '- "status": string (e.g., "final" or "needs_clarification").\n'
-        '- "final_answer": string or null.\n'
-        '- "needs_clarification": boolean.\n'
-        '- "clarifying_question": string or null.\n'
-        '- "reasoning": string or null.\n'
+    prompt = "".join(
+        (
+            system_prompt,
+            "\n\nUser question: ",
+            question,
+            "\nDraft answer: ",
+            draft_answer,
+            "\nResearch context: ",
+            prompt_json(compact_research(research, config)),
+            "\n",
+            source_context,
+            citation_check,
+            _VALIDATION_REQUIREMENTS,
+            byu_instruction,
+            _VALIDATION_SUFFIX,
+        )
     )
     return await call_ollama_json(prompt, ValidationOutput)
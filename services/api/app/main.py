@@ -1,29 +1,54 @@
 from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder
+from starlette.types import Message, Receive, Scope, Send
 
 from app.routes import admin, chat, crawl, health, ingest_jobs
+from app.utils.auth_hints import compact_auth_hints
 from app.utils.db import init_db
 from app.utils.logging import setup_logging
-from fastapi.middleware.cors import CORSMiddleware
+from app.utils.ollama import close_ollama_client
 
-app = FastAPI()
 
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[
-        "http://localhost:5000",
-        "http://127.0.0.1:5000",
+class _SSEAwareGZipResponder(GZipResponder):
+    async def send_with_gzip(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            if content_type.startswith("text/event-stream"):
+                # Compressing an event stream buffers events inside the gzip
+                # writer; pass it through untouched like a pre-encoded body.
+                self.initial_message = message
+                self.content_encoding_set = True
+                return
+        await super().send_with_gzip(message)
+
+
+class SSEAwareGZipMiddleware(GZipMiddleware):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and "gzip" in Headers(scope=scope).get("Accept-Encoding", ""):
+            responder = _SSEAwareGZipResponder(self.app, self.minimum_size, compresslevel=self.compresslevel)
+            await responder(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
 
-        # If you ever access the frontend using your Windows IP instead of localhost:
-        "http://192.168.30.11:5000",
 
-        # If you ever access via WSL IP directly:
-        "http://172.31.225.208:5000",
-    ],
+app = FastAPI(default_response_class=ORJSONResponse)
+
+
+app.add_middleware(
+    CORSMiddleware,
+    # One compiled regex instead of a list scan per request. Covers:
+    # localhost / 127.0.0.1, the Windows host IP and the WSL IP, all on :5000.
+    allow_origin_regex=r"^http://(localhost|127\.0\.0\.1|192\.168\.30\.11|172\.31\.225\.208):5000$",
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(SSEAwareGZipMiddleware, minimum_size=1024)
 
 
 @app.on_event("startup")
@@ -32,6 +57,12 @@ async def startup() -> None:
     init_db()
 
 
+@app.on_event("shutdown")
+async def shutdown() -> None:
+    compact_auth_hints()
+    await close_ollama_client()
+
+
 app.include_router(chat.router)
 app.include_router(admin.router)
 app.include_router(crawl.router)
@@ -1,16 +1,22 @@
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class IntentOutput(BaseModel):
+class LLMOutput(BaseModel):
+    """Base for schemas parsed from model responses with `model_validate_json`."""
+
+    model_config = ConfigDict(extra="ignore", populate_by_name=True)
+
+
+class IntentOutput(LLMOutput):
     intent_label: str
     search_queries: List[str]
     success_criteria: List[str]
     context: Optional[str] = None
 
 
-class ResearchHit(BaseModel):
+class ResearchHit(LLMOutput):
     doc_id: str
     chunk_id: str
     url: str
@@ -19,7 +25,7 @@ class ResearchHit(BaseModel):
     text: str
 
 
-class AggregatedDocument(BaseModel):
+class AggregatedDocument(LLMOutput):
     doc_id: str
     title: str
     url: str
@@ -29,18 +35,18 @@ class AggregatedDocument(BaseModel):
     snippet: str = ""
 
 
-class ResearchOutput(BaseModel):
+class ResearchOutput(LLMOutput):
     hits: List[ResearchHit]
     total_results: int
     docs: List[AggregatedDocument] = Field(default_factory=list)
 
 
-class SynthesisOutput(BaseModel):
+class SynthesisOutput(LLMOutput):
     draft_answer: str
     citations_used: List[str] = Field(default_factory=list)
 
 
-class ValidationOutput(BaseModel):
+class ValidationOutput(LLMOutput):
     status: str
     final_answer: Optional[str] = None
     needs_clarification: bool
@@ -48,5 +54,10 @@ class ValidationOutput(BaseModel):
     reasoning: Optional[str] = None
 
 
-class TitleOutput(BaseModel):
+class SynthValidationOutput(LLMOutput):
+    draft: SynthesisOutput
+    validation: ValidationOutput
+
+
+class TitleOutput(LLMOutput):
     title: str
@@ -1,54 +1,158 @@
 import asyncio
-import json
+import codecs
+import copy
+import gzip
+import heapq
+import hmac
+import mmap
 import os
-import subprocess
+import re
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
 import uuid
+from collections import Counter, OrderedDict
 from datetime import datetime, timezone
+from email.utils import formatdate
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse
 
-import yaml
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse, StreamingResponse
-from qdrant_client import QdrantClient
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, ORJSONResponse, Response, StreamingResponse
+from qdrant_client import AsyncQdrantClient
 from qdrant_client.http import models as rest
+from qdrant_client.http.exceptions import ResponseHandlingException, UnexpectedResponse
 
+try:  # inotify-backed file watching; installed with uvicorn[standard]
+    from watchfiles import awatch
+except ImportError:  # pragma: no cover - fall back to polling
+    awatch = None
+
+from app.utils.artifact_index import artifact_stats, lookup_by_url, lookup_by_urls
+from app.utils.auth_hints import load_auth_hints
 from app.utils.auth_validation import (
     playwright_available,
     validate_auth_profile,
 )
-from app.utils.config import refresh_config, write_yaml_config
-from app.utils.jobs import delete_job, get_job, list_jobs, start_job
+from app.utils.config import load_yaml_cached, store_config
+from app.utils.jobs import JOB_LOG_DIR, delete_job, get_job, jobs_version, list_jobs, start_job
 from app.utils.ollama_embed import embed_text
-from app.workers.ingest_worker import DB_PATH, ensure_metadata_db_initialized, run_ingest_job
+from app.workers.ingest_worker import (
+    DB_PATH,
+    METADATA_SCHEMA_VERSION,
+    ensure_metadata_db_initialized,
+    run_ingest_job,
+)
 
-router = APIRouter(prefix="/api/admin", tags=["admin"])
+router = APIRouter(prefix="/api/admin", tags=["admin"], default_response_class=ORJSONResponse)
 
 SECRETS_PATH = Path("/app/secrets/admin_tokens")
 CONFIG_DIR = Path("/app/config")
 CANDIDATES_PATH = Path("/app/data/candidates/candidates.jsonl")
 PROCESSED_PATH = Path("/app/data/candidates/processed.json")
-AUTH_HINTS_PATH = Path("/app/data/logs/auth_hints.json")
 SUMMARY_DIR = Path("/app/data/logs/summaries")
 QUARANTINE_DIR = Path("/app/data/quarantine")
 QUARANTINE_AUDIT_LOG = Path("/app/data/logs/quarantine_audit.log")
+ADMIN_TOKEN_MAX_LENGTH = 512
+# Constant-time token comparison for deployments that require it; a set lookup otherwise
+ADMIN_TOKEN_STRICT_COMPARE = os.getenv("ADMIN_TOKEN_STRICT_COMPARE", "").lower() in ("1", "true", "yes")
+# Reset endpoints skip counting what they delete; rmtree has to walk it anyway
+FAST_RESET = os.getenv("FAST_RESET", "").lower() in ("1", "true", "yes")
 ALLOWED_URL_STATUS_TTL_SECONDS = 60
+AUTH_TEST_TTL_SECONDS = 300
+AUTH_TEST_CACHE_MAX_ENTRIES = 1024
+AUTH_PROBE_CONCURRENCY = 4
+ARTIFACT_SCAN_CONCURRENCY = 32
+ARTIFACT_CACHE_MAX_ENTRIES = 4096
+BULK_URLS_MAX = 500
+CHECK_URL_EXAMPLE_CHUNKS = 3
+QDRANT_SCROLL_PAGE_SIZE = 256
+LOG_TAIL_POLL_SECONDS = 0.2
+LOG_TAIL_HEARTBEAT_MS = 5000
+LOG_TAIL_COALESCE_MS = 10
+# Each watcher holds a thread from anyio's default limiter (shared with
+# run_in_threadpool) for as long as its tail is open; tails beyond this poll.
+LOG_TAIL_MAX_WATCHERS = 8
+LOG_TAIL_MAX_DELAY_MS = 50
+LOG_TAIL_CHUNK_SIZE = 65536
+LOG_TAIL_CONTEXT_BYTES = 8192
+LOG_EXPORT_CHUNK_SIZE = 1 << 20
+# (path, count suffix or None for a single file, marker file per subdirectory, label)
+_CRAWL_STATE_TARGETS: Tuple[Tuple[Path, Optional[str], str, str], ...] = (
+    (Path("/app/data/artifacts"), "", "artifact.json", "artifacts"),
+    (CANDIDATES_PATH, None, "", "candidates.jsonl"),
+    (PROCESSED_PATH, None, "", "processed.json"),
+    (JOB_LOG_DIR, ".log", "", "job logs"),
+    (SUMMARY_DIR, ".json", "", "summaries"),
+)
+_DELETABLE_TARGETS = _CRAWL_STATE_TARGETS + ((QUARANTINE_DIR, "", "", "quarantined artifacts"),)
 _ALLOWED_URL_STATUS_CACHE: Dict[str, Any] = {"timestamp": 0.0, "payload": None}
+# (auth profile, test url) -> (monotonic time, auth_test, ui_status)
+_AUTH_TEST_CACHE: Dict[Tuple[str, str], Tuple[float, Dict[str, Any], str]] = {}
+PLAYWRIGHT_AVAILABLE_TTL_SECONDS = 60
+_PW_AVAILABLE_CACHE: Dict[str, Any] = {"timestamp": 0.0, "value": None}
+_SEEN_TYPES = ("web", "pdf", "docx", "xlsx", "pptx")
+# Extension -> bit in a candidate's seen-type mask; bit 0 (web) covers everything else.
+_EXT_TYPE_BIT = {ext: 1 << index for index, ext in enumerate(_SEEN_TYPES) if index}
+_DIM_CACHE: Dict[Tuple[str, str], int] = {}
+_TOKENS_CACHE: Optional[Tuple[Tuple[int, int], FrozenSet[str]]] = None
+_JOBS_JSON_CACHE: Optional[Tuple[int, bytes]] = None
+_QUARANTINE_COUNT_CACHE: Optional[Tuple[int, int]] = None
+_LOG_WATCHERS_ACTIVE = 0
+# artifact.json fields the check/repair/search scans read; the cache never holds page text
+_ARTIFACT_CACHE_FIELDS = (
+    "url",
+    "final_url",
+    "doc_id",
+    "title",
+    "http_status",
+    "status_code",
+    "auth_profile",
+    "content_hash",
+    "fetched_at",
+    "captured_at",
+    "timestamp",
+)
+# artifact.json path -> (mtime_ns, cached fields), least recently used first
+_ARTIFACT_CACHE: "OrderedDict[str, Tuple[int, Dict[str, Any]]]" = OrderedDict()
+_ARTIFACT_CACHE_LOCK = threading.Lock()
+_CANDIDATES_CACHE: Optional[Tuple[Tuple[int, int], List[Dict[str, Any]]]] = None
+# Rule patterns are parsed on every allow-list request; they rarely change.
+_url_parse = lru_cache(maxsize=4096)(urlparse)
+_RULE_IDS_VERIFIED: Optional[Dict[str, Any]] = None
+_META_CONN_LOCK = threading.Lock()
+_META_CONN: Optional[Tuple[Tuple[int, int], sqlite3.Connection]] = None
+
+
+def _system_config() -> Dict[str, Any]:
+    """Parsed system.yml, shared and re-read only when the file's mtime changes."""
+    return load_yaml_cached(CONFIG_DIR / "system.yml")
 
 
 def _utcnow() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def _run_validation(command: List[str]) -> None:
-    result = subprocess.run(command, capture_output=True, text=True, check=False)
-    if result.returncode not in (0, 1):
+async def _run_validation(command: List[str]) -> None:
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await process.communicate()
+    if process.returncode not in (0, 1):
         raise HTTPException(
             status_code=500,
             detail=(
                 "Validation failed. "
-                f"stdout: {result.stdout.strip()} stderr: {result.stderr.strip()}"
+                f"stdout: {stdout.decode(errors='replace').strip()} "
+                f"stderr: {stderr.decode(errors='replace').strip()}"
             ),
         )
 
@@ -57,24 +161,71 @@ def _latest_summary(prefix: str) -> Optional[Path]:
     """
     Return the newest summary JSON file matching prefix, or None if unavailable.
     """
-    if not SUMMARY_DIR.exists():
+    best: Optional[str] = None
+    best_mtime = -1
+    try:
+        with os.scandir(SUMMARY_DIR) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.startswith(prefix) or not name.endswith(".json"):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    mtime = entry.stat().st_mtime_ns
+                except OSError:
+                    continue
+                if mtime > best_mtime:
+                    best, best_mtime = entry.path, mtime
+    except FileNotFoundError:
         return None
+    return Path(best) if best else None
 
-    summaries = sorted(
-        SUMMARY_DIR.glob(f"{prefix}*.json"),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True,
-    )
-
-    if not summaries:
-        return None
 
-    # Extra safety: ensure we only return files
-    for p in summaries:
-        if p.is_file():
-            return p
+def _count_matching(path: Path, suffix: str = "", subfile: str = "") -> int:
+    """Count entries of `path` ending in `suffix`, or subdirectories holding `subfile`."""
+    count = 0
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if subfile:
+                    if entry.is_dir(follow_symlinks=False) and os.path.isfile(os.path.join(entry.path, subfile)):
+                        count += 1
+                elif entry.name.endswith(suffix) and (not suffix or entry.is_file()):
+                    count += 1
+    except FileNotFoundError:
+        return 0
+    return count
+
+
+def _iter_artifact_files(base: Path) -> Iterator[Tuple[str, str]]:
+    """Yield (artifact_id, artifact.json path) per artifact directory; the file may be missing."""
+    with os.scandir(base) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield entry.name, os.path.join(entry.path, "artifact.json")
+
+
+def _reset_paths(targets: Tuple[Tuple[Path, Optional[str], str, str], ...], count: bool = True) -> List[str]:
+    """Empty each target directory (or remove each target file); return what was deleted.
+
+    With `count` false, directories are reported without their entry count,
+    saving a traversal of each one ahead of the rmtree.
+    """
+    deleted_items = []
+    for path, suffix, subfile, label in targets:
+        if not path.exists():
+            continue
+        if suffix is None:
+            path.unlink()
+            deleted_items.append(label)
+            continue
+        item = f"{_count_matching(path, suffix, subfile)} {label}" if count else f"{label} (count skipped)"
+        shutil.rmtree(path)
+        path.mkdir(parents=True, exist_ok=True)
+        deleted_items.append(item)
+    return deleted_items
 
-    return None
 
 def _format_crawl_summary(payload: Dict[str, Any]) -> Dict[str, Any]:
     findings = payload.get("findings", [])
@@ -124,31 +275,325 @@ def _format_ingest_summary(payload: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def _rule_matches_url(pattern: str, match_type: str, url: str) -> bool:
-    if match_type == "exact":
-        return pattern == url
-    return url.startswith(pattern)
+def _auth_hint_flags(rules: List[Any], hints: Dict[str, Any]) -> List[bool]:
+    """
+    Flag which rules have seen an auth redirect, aligned with `rules`.
 
+    Recent redirect URLs are matched against rule patterns with dict probes
+    (exact patterns directly, prefix patterns by each distinct pattern length),
+    so the cost is O(rules + recent * lengths) rather than O(rules * recent).
+    """
+    flags = [False] * len(rules)
+    exact: Dict[str, List[int]] = {}
+    prefixes: Dict[str, List[int]] = {}
+    by_domain = hints.get("by_domain", {}) or {}
+    for index, rule in enumerate(rules):
+        if not isinstance(rule, dict):
+            continue
+        pattern = rule.get("pattern", "")
+        if not pattern:
+            continue
+        target = exact if rule.get("match", "prefix") == "exact" else prefixes
+        target.setdefault(pattern, []).append(index)
+        try:
+            host = _url_parse(pattern).hostname or ""
+        except Exception:
+            host = ""
+        if host and by_domain.get(host):
+            flags[index] = True
 
-def _get_auth_hint_for_rule(rule: Dict[str, Any], hints: Dict[str, Any]) -> bool:
-    pattern = rule.get("pattern", "")
-    match_type = rule.get("match", "prefix")
-    if not pattern:
-        return False
+    lengths = sorted({len(pattern) for pattern in prefixes})
     for entry in hints.get("recent", []) or []:
         original_url = entry.get("original_url") or ""
-        if original_url and _rule_matches_url(pattern, match_type, original_url):
-            return True
-    host = ""
+        if not original_url:
+            continue
+        for index in exact.get(original_url, ()):
+            flags[index] = True
+        for length in lengths:
+            if length > len(original_url):
+                break
+            for index in prefixes.get(original_url[:length], ()):
+                flags[index] = True
+    return flags
+
+
+_AUTH_TEST_TEMPLATE: Dict[str, Any] = {
+    "profile_name": None,
+    "ok": False,
+    "final_url": "",
+    "title": "",
+    "status": None,
+    "error_reason": "",
+    "checked_at": "",
+}
+
+
+def _failed_auth_test(profile_name: str, error_reason: str, checked_at: str) -> Dict[str, Any]:
+    """An auth_test result for a profile that could not be (or failed to be) validated."""
+    return _AUTH_TEST_TEMPLATE | {"profile_name": profile_name, "error_reason": error_reason, "checked_at": checked_at}
+
+
+def _allowed_url_status_cache_fresh() -> bool:
+    return time.monotonic() - _ALLOWED_URL_STATUS_CACHE["timestamp"] < ALLOWED_URL_STATUS_TTL_SECONDS
+
+
+def _cached_auth_test(key: Tuple[str, str]) -> Optional[Tuple[Dict[str, Any], str]]:
+    entry = _AUTH_TEST_CACHE.get(key)
+    if entry is None or time.monotonic() - entry[0] >= AUTH_TEST_TTL_SECONDS:
+        return None
+    return entry[1], entry[2]
+
+
+def _store_auth_test(key: Tuple[str, str], auth_test: Dict[str, Any], ui_status: str) -> None:
+    now = time.monotonic()
+    if len(_AUTH_TEST_CACHE) >= AUTH_TEST_CACHE_MAX_ENTRIES:
+        for stale in [k for k, (ts, _, _) in _AUTH_TEST_CACHE.items() if now - ts >= AUTH_TEST_TTL_SECONDS]:
+            del _AUTH_TEST_CACHE[stale]
+        if len(_AUTH_TEST_CACHE) >= AUTH_TEST_CACHE_MAX_ENTRIES:
+            del _AUTH_TEST_CACHE[next(iter(_AUTH_TEST_CACHE))]
+    _AUTH_TEST_CACHE[key] = (now, auth_test, ui_status)
+
+
+def _clear_auth_status_caches() -> None:
+    _AUTH_TEST_CACHE.clear()
+    _ALLOWED_URL_STATUS_CACHE["timestamp"] = 0.0
+    _ALLOWED_URL_STATUS_CACHE["payload"] = None
+
+
+async def _limited(semaphore: asyncio.Semaphore, awaitable: Awaitable[Any]) -> Any:
+    async with semaphore:
+        return await awaitable
+
+
+def _playwright_available_cached() -> bool:
+    now = time.monotonic()
+    if _PW_AVAILABLE_CACHE["value"] is None or now - _PW_AVAILABLE_CACHE["timestamp"] >= PLAYWRIGHT_AVAILABLE_TTL_SECONDS:
+        _PW_AVAILABLE_CACHE["value"] = playwright_available()
+        _PW_AVAILABLE_CACHE["timestamp"] = now
+    return _PW_AVAILABLE_CACHE["value"]
+
+
+def _load_artifact(path: Path) -> Dict[str, Any]:
+    """Metadata fields of an artifact.json, re-read only when the file's mtime changes. Treat as read-only."""
+    key = str(path)
+    mtime_ns = os.stat(key).st_mtime_ns
+    with _ARTIFACT_CACHE_LOCK:
+        cached = _ARTIFACT_CACHE.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            _ARTIFACT_CACHE.move_to_end(key)
+            return cached[1]
+    with open(key, "rb") as handle:
+        data = orjson.loads(handle.read())
+    fields = {name: data[name] for name in _ARTIFACT_CACHE_FIELDS if name in data}
+    with _ARTIFACT_CACHE_LOCK:
+        # One entry per path: a rewritten file replaces its old entry
+        _ARTIFACT_CACHE[key] = (mtime_ns, fields)
+        _ARTIFACT_CACHE.move_to_end(key)
+        while len(_ARTIFACT_CACHE) > ARTIFACT_CACHE_MAX_ENTRIES:
+            _ARTIFACT_CACHE.popitem(last=False)
+    return fields
+
+
+def _content_prefilter(query: str) -> Optional["re.Pattern[bytes]"]:
+    """Bytes pattern that every file matching `query` must contain, or None if there isn't one.
+
+    re.IGNORECASE on bytes only folds ASCII, so non-ASCII queries ("École")
+    get no pre-filter and every file is decoded and checked.
+    """
+    if not query.isascii():
+        return None
+    return re.compile(re.escape(query.encode("utf-8")), re.IGNORECASE)
+
+
+def _search_content(
+    path: Path, query: str, prefilter: Optional["re.Pattern[bytes]"] = None, context: int = 100
+) -> Optional[Tuple[int, str]]:
+    """Find `query` in a content file, case-insensitively under Unicode case rules.
+
+    Returns the character offset of the first match and the `context`
+    characters either side of it, or None when the file is missing, not
+    UTF-8 or has no match. With a `prefilter`, files it finds nothing in are
+    rejected from an mmap without being read and decoded.
+    """
+    try:
+        with open(path, "rb") as handle:
+            if prefilter is not None:
+                try:
+                    with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        if prefilter.search(mapped) is None:
+                            return None
+                except ValueError:
+                    # mmap refuses empty files
+                    return None
+            raw = handle.read()
+        # Newlines normalised as in a text-mode read, so offsets count the same characters
+        text = raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    except (FileNotFoundError, UnicodeDecodeError):
+        return None
+    index = text.lower().find(query.lower())
+    if index < 0:
+        return None
+    return index, text[max(0, index - context):index + context]
+
+
+def _captured_at(artifact_data: Dict[str, Any]) -> Any:
+    return artifact_data.get("fetched_at") or artifact_data.get("captured_at") or artifact_data.get("timestamp")
+
+
+def _read_snippet(path: Path, chars: int = 500) -> str:
+    """First `chars` characters of a text file, with "..." if there is more; "" when missing."""
+    try:
+        with open(path, "rb") as handle:
+            # UTF-8 needs at most 4 bytes per character
+            raw = handle.read(chars * 4)
+            more_on_disk = os.fstat(handle.fileno()).st_size > len(raw)
+    except FileNotFoundError:
+        return ""
+    text = raw.decode("utf-8", errors="ignore" if more_on_disk else "replace")
+    return text[:chars] + ("..." if more_on_disk or len(text) > chars else "")
+
+
+def _check_artifact(artifact_file: Path, url: str) -> Optional[Dict[str, Any]]:
     try:
-        host = urlparse(pattern).hostname or ""
+        artifact_data = _load_artifact(artifact_file)
+        if artifact_data.get("url", "") != url and artifact_data.get("final_url") != url:
+            return None
+        artifact_dir = artifact_file.parent
+
+        snippet = _read_snippet(artifact_dir / "content.html")
+
+        return {
+            "artifact_id": artifact_dir.name,
+            "doc_id": artifact_data.get("doc_id"),
+            "url": artifact_data.get("url"),
+            "final_url": artifact_data.get("final_url"),
+            "http_status": artifact_data.get("http_status") or artifact_data.get("status_code"),
+            "auth_profile": artifact_data.get("auth_profile"),
+            "title": artifact_data.get("title"),
+            "captured_at": _captured_at(artifact_data),
+            "content_hash": artifact_data.get("content_hash"),
+            "snippet": snippet,
+        }
     except Exception:
-        host = ""
-    return bool(host and hints.get("by_domain", {}).get(host))
+        return None
 
 
-def _allowed_url_status_cache_fresh() -> bool:
-    return (datetime.now(timezone.utc).timestamp() - float(_ALLOWED_URL_STATUS_CACHE.get("timestamp", 0.0))) < ALLOWED_URL_STATUS_TTL_SECONDS
+def _repair_candidate(artifact_file: Path, url: str) -> Optional[Dict[str, Any]]:
+    try:
+        artifact_data = _load_artifact(artifact_file)
+    except Exception:
+        return None
+    if artifact_data.get("url") != url and artifact_data.get("final_url") != url:
+        return None
+    captured_at = _captured_at(artifact_data)
+    captured_ts = None
+    if isinstance(captured_at, (int, float)):
+        captured_ts = float(captured_at)
+    elif isinstance(captured_at, str):
+        try:
+            captured_ts = datetime.fromisoformat(captured_at.replace("Z", "+00:00")).timestamp()
+        except Exception:
+            captured_ts = None
+    if captured_ts is None:
+        try:
+            captured_ts = artifact_file.stat().st_mtime
+        except OSError:
+            return None
+    return {
+        "artifact_file": artifact_file,
+        "artifact_dir": artifact_file.parent,
+        "doc_id": artifact_data.get("doc_id"),
+        "captured_at": captured_at,
+        "captured_ts": captured_ts,
+    }
+
+
+def _search_artifact(
+    artifact_file: Path, query: str, prefilter: Optional["re.Pattern[bytes]"]
+) -> Optional[Dict[str, Any]]:
+    try:
+        # artifact.json is only parsed when the content matches
+        hit = _search_content(artifact_file.parent / "content.html", query, prefilter)
+        if hit is None:
+            return None
+        match_index, snippet = hit
+        artifact_data = _load_artifact(artifact_file)
+    except Exception:
+        return None
+    return {
+        "artifact_id": artifact_file.parent.name,
+        "url": artifact_data.get("url"),
+        "title": artifact_data.get("title"),
+        "snippet": snippet,
+        "match_index": match_index,
+    }
+
+
+async def _scan_artifacts(
+    scan: Callable[..., Optional[Dict[str, Any]]], artifact_files: List[Path], *args: Any
+) -> List[Dict[str, Any]]:
+    """Run `scan` over artifact files in the threadpool, a bounded number at a time.
+
+    Results keep the input order; files for which `scan` returns None are dropped.
+    """
+    semaphore = asyncio.Semaphore(ARTIFACT_SCAN_CONCURRENCY)
+    results = await asyncio.gather(
+        *(_limited(semaphore, run_in_threadpool(scan, artifact_file, *args)) for artifact_file in artifact_files)
+    )
+    return [result for result in results if result is not None]
+
+
+async def _first_matches(
+    scan: Callable[..., Optional[Dict[str, Any]]], artifact_files: List[Path], limit: int, *args: Any
+) -> List[Dict[str, Any]]:
+    """The first `limit` non-None results of `scan` over `artifact_files`, in input order.
+
+    Files are scanned concurrently like `_scan_artifacts`, but scanning stops
+    (and outstanding scans are cancelled) once every file ahead of the
+    `limit`-th match has finished, so the answer is the same as a serial scan's.
+    """
+    semaphore = asyncio.Semaphore(ARTIFACT_SCAN_CONCURRENCY)
+
+    async def scan_one(index: int, artifact_file: Path) -> Tuple[int, Optional[Dict[str, Any]]]:
+        return index, await _limited(semaphore, run_in_threadpool(scan, artifact_file, *args))
+
+    tasks = [asyncio.ensure_future(scan_one(index, path)) for index, path in enumerate(artifact_files)]
+    found: Dict[int, Dict[str, Any]] = {}
+    finished = set()
+    settled = 0  # files [0, settled) have all finished
+    settled_matches = 0
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            index, match = await next_done
+            finished.add(index)
+            if match is not None:
+                found[index] = match
+            while settled in finished:
+                settled_matches += settled in found
+                settled += 1
+            if settled_matches >= limit:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+    return [found[index] for index in sorted(found) if index < settled][:limit]
+
+
+@lru_cache(maxsize=None)
+def _async_qdrant_client(url: str) -> AsyncQdrantClient:
+    """One client (and HTTP connection pool) per Qdrant URL, shared across requests.
+
+    Keyed on the URL, so a host change in system.yml gets a fresh client.
+    """
+    return AsyncQdrantClient(url=url)
+
+
+async def _embedding_dimension(ollama_host: str, embedding_model: str) -> int:
+    key = (ollama_host, embedding_model)
+    if key not in _DIM_CACHE:
+        vector = await run_in_threadpool(embed_text, ollama_host, embedding_model, "dimension probe")
+        _DIM_CACHE[key] = len(vector)
+    return _DIM_CACHE[key]
 
 
 def _parse_redis_host_port() -> Dict[str, Any]:
@@ -162,10 +607,32 @@ def _parse_redis_host_port() -> Dict[str, Any]:
     return {"host": "redis", "port": 6379}
 
 
-def _load_tokens() -> List[str]:
-    if not SECRETS_PATH.exists():
-        return []
-    return [line.strip() for line in SECRETS_PATH.read_text(encoding="utf-8").splitlines() if line.strip()]
+def _load_tokens() -> FrozenSet[str]:
+    """Admin tokens as a set, re-read only when the secrets file's mtime or size changes."""
+    global _TOKENS_CACHE
+    try:
+        stat = SECRETS_PATH.stat()
+    except FileNotFoundError:
+        return frozenset()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    if _TOKENS_CACHE is not None and _TOKENS_CACHE[0] == signature:
+        return _TOKENS_CACHE[1]
+    tokens = frozenset(
+        line.strip() for line in SECRETS_PATH.read_text(encoding="utf-8").splitlines() if line.strip()
+    )
+    _TOKENS_CACHE = (signature, tokens)
+    return tokens
+
+
+def _token_matches(token: str, tokens: FrozenSet[str]) -> bool:
+    if not ADMIN_TOKEN_STRICT_COMPARE:
+        return token in tokens
+    # Compare against every token without stopping early, so timing reveals nothing
+    candidate = token.encode("utf-8")
+    matched = False
+    for known in tokens:
+        matched |= hmac.compare_digest(candidate, known.encode("utf-8"))
+    return matched
 
 
 @router.post("/unlock")
@@ -173,7 +640,9 @@ async def unlock(payload: Dict[str, str]) -> Dict[str, str]:
     token = payload.get("token")
     if not token:
         raise HTTPException(status_code=400, detail="Missing token")
-    if token not in _load_tokens():
+    if len(token) > ADMIN_TOKEN_MAX_LENGTH:
+        raise HTTPException(status_code=400, detail="Invalid token format")
+    if not _token_matches(token, await run_in_threadpool(_load_tokens)):
         raise HTTPException(status_code=403, detail="Invalid token")
     return {"status": "ok"}
 
@@ -183,50 +652,99 @@ async def get_config(name: str) -> Dict[str, Any]:
     path = CONFIG_DIR / f"{name}.yml"
     if not path.exists():
         raise HTTPException(status_code=404, detail="Config not found")
-    config = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    config = await run_in_threadpool(load_yaml_cached, path)
     if name == "allow_block" and "allow_rules" in config:
-        updated = False
-        for rule in config.get("allow_rules", []):
-            if isinstance(rule, dict):
-                if not rule.get("id"):
-                    _ensure_rule_id(rule)
-                    updated = True
-        if updated:
-            write_yaml_config(path, config)
-            refresh_config("allow_block")
+        config = await _allow_block_with_rule_ids(config)
     return config
 
 
 @router.put("/config/{name}")
 async def update_config(name: str, payload: Dict[str, Any]) -> Dict[str, str]:
-    path = CONFIG_DIR / f"{name}.yml"
     try:
-        write_yaml_config(path, payload)
+        await run_in_threadpool(store_config, name, payload)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    refresh_config(name)
+    if name == "crawler":
+        _clear_auth_status_caches()
     return {"status": "ok"}
 
 
-def _derive_allowed_domains(allow_rules: List[Dict[str, Any]]) -> List[str]:
-    """Derive allowed_domains from allow_rules patterns."""
-    domains = set()
-    for rule in allow_rules:
-        pattern = rule.get("pattern", "")
-        try:
-            parsed = urlparse(pattern)
-            if parsed.netloc:
-                domains.add(parsed.netloc)
-        except Exception:
-            continue
-    return sorted(domains)
+def _pattern_netloc(pattern: str) -> str:
+    try:
+        return _url_parse(pattern).netloc
+    except Exception:
+        return ""
+
+
+def _domain_counts(allow_rules: List[Dict[str, Any]]) -> Counter:
+    """Count how many rules reference each domain."""
+    return Counter(
+        netloc for netloc in (_pattern_netloc(rule.get("pattern") or "") for rule in allow_rules) if netloc
+    )
 
 
-def _ensure_rule_id(rule: Dict[str, Any]) -> str:
-    """Ensure a rule has an ID, generating one if missing."""
-    if "id" not in rule or not rule["id"]:
-        rule["id"] = str(uuid.uuid4())
-    return rule["id"]
+def _adjust_domain_count(counts: Counter, pattern: Optional[str], delta: int) -> None:
+    netloc = _pattern_netloc(pattern or "")
+    if netloc:
+        counts[netloc] += delta
+
+
+def _allowed_domains(counts: Counter) -> List[str]:
+    """Derive allowed_domains from the per-domain rule counts."""
+    return sorted(domain for domain, count in counts.items() if count > 0)
+
+
+def _backfill_rule_ids(config: Dict[str, Any]) -> bool:
+    """Give every allow rule an ID; return True if any were missing."""
+    global _RULE_IDS_VERIFIED
+    missing = [rule for rule in config.get("allow_rules") or [] if isinstance(rule, dict) and not rule.get("id")]
+    for rule, rule_id in zip(missing, _batch_uuids(len(missing))):
+        rule["id"] = rule_id
+    _RULE_IDS_VERIFIED = config
+    return bool(missing)
+
+
+async def _allow_block_with_rule_ids(cached: Dict[str, Any]) -> Dict[str, Any]:
+    """Return `cached`, or a saved copy of it with missing rule IDs filled in.
+
+    `cached` comes from the shared YAML cache and is never modified.
+    """
+    global _RULE_IDS_VERIFIED
+    if _rule_ids_verified(cached):
+        return cached
+    if all(not isinstance(rule, dict) or rule.get("id") for rule in cached.get("allow_rules") or []):
+        _RULE_IDS_VERIFIED = cached
+        return cached
+    config = copy.deepcopy(cached)
+    _backfill_rule_ids(config)
+    await run_in_threadpool(store_config, "allow_block", config)
+    return config
+
+
+def _batch_uuids(count: int) -> List[str]:
+    """Generate `count` random (version 4) UUID strings from a single urandom read."""
+    if not count:
+        return []
+    buf = os.urandom(16 * count)
+    return [str(uuid.UUID(bytes=buf[i : i + 16], version=4)) for i in range(0, 16 * count, 16)]
+
+
+def _rule_ids_verified(config: Dict[str, Any]) -> bool:
+    """True if `config` (by identity) is already known to have every rule ID.
+
+    load_yaml_cached returns the same object until the file changes, so the
+    rules of a cached config are walked once rather than on every request.
+    """
+    return config is _RULE_IDS_VERIFIED
+
+
+def _rules_by_id(rules: List[Dict[str, Any]]) -> Dict[str, Tuple[int, Dict[str, Any]]]:
+    """Map rule IDs to their (position, rule); the first rule wins on duplicate IDs."""
+    by_id: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+    for index, rule in enumerate(rules):
+        if isinstance(rule, dict):
+            by_id.setdefault(rule.get("id"), (index, rule))
+    return by_id
 
 
 @router.post("/allowed-urls")
@@ -258,26 +776,27 @@ async def create_allowed_url(payload: Dict[str, Any]) -> Dict[str, Any]:
         raise HTTPException(status_code=400, detail="Invalid match type (must be 'prefix' or 'exact')")
 
     # Load current config
-    path = CONFIG_DIR / "allow_block.yml"
-    config = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    cached = await run_in_threadpool(load_yaml_cached, CONFIG_DIR / "allow_block.yml")
+    config = copy.deepcopy(cached)
 
     # Ensure allow_rules exists
     if "allow_rules" not in config:
         config["allow_rules"] = []
 
     # Ensure existing rules have IDs
-    for existing_rule in config["allow_rules"]:
-        _ensure_rule_id(existing_rule)
+    if not _rule_ids_verified(cached):
+        _backfill_rule_ids(config)
 
     # Add new rule
+    domain_counts = _domain_counts(config["allow_rules"])
     config["allow_rules"].append(rule)
 
     # Update allowed_domains
-    config["allowed_domains"] = _derive_allowed_domains(config["allow_rules"])
+    _adjust_domain_count(domain_counts, rule["pattern"], 1)
+    config["allowed_domains"] = _allowed_domains(domain_counts)
 
     # Save config
-    path.write_text(yaml.safe_dump(config, sort_keys=False), encoding="utf-8")
-    refresh_config("allow_block")
+    await run_in_threadpool(store_config, "allow_block", config)
 
     return rule
 
@@ -286,34 +805,30 @@ async def create_allowed_url(payload: Dict[str, Any]) -> Dict[str, Any]:
 async def update_allowed_url(rule_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
     """Update an existing allowed URL rule."""
     # Load current config
-    path = CONFIG_DIR / "allow_block.yml"
-    config = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    cached = await run_in_threadpool(load_yaml_cached, CONFIG_DIR / "allow_block.yml")
+    config = copy.deepcopy(cached)
 
     if "allow_rules" not in config:
         raise HTTPException(status_code=404, detail="No allow rules found")
 
     # Ensure existing rules have IDs
-    for existing_rule in config["allow_rules"]:
-        _ensure_rule_id(existing_rule)
+    if not _rule_ids_verified(cached):
+        _backfill_rule_ids(config)
 
     # Find the rule to update
-    rule_index = None
-    for i, rule in enumerate(config["allow_rules"]):
-        if rule.get("id") == rule_id:
-            rule_index = i
-            break
-
-    if rule_index is None:
+    by_id = _rules_by_id(config["allow_rules"])
+    if rule_id not in by_id:
         raise HTTPException(status_code=404, detail="Rule not found")
+    rule_index, existing = by_id[rule_id]
 
     # Update the rule
     updated_rule = {
         "id": rule_id,
-        "pattern": payload.get("pattern", config["allow_rules"][rule_index].get("pattern")),
-        "match": payload.get("match", config["allow_rules"][rule_index].get("match", "prefix")),
-        "types": payload.get("types", config["allow_rules"][rule_index].get("types", {})),
-        "allow_http": payload.get("allow_http", config["allow_rules"][rule_index].get("allow_http", False)),
-        "auth_profile": payload.get("auth_profile", config["allow_rules"][rule_index].get("auth_profile")),
+        "pattern": payload.get("pattern", existing.get("pattern")),
+        "match": payload.get("match", existing.get("match", "prefix")),
+        "types": payload.get("types", existing.get("types", {})),
+        "allow_http": payload.get("allow_http", existing.get("allow_http", False)),
+        "auth_profile": payload.get("auth_profile", existing.get("auth_profile")),
     }
     updated_rule["playwright"] = bool(updated_rule.get("auth_profile"))
 
@@ -326,14 +841,16 @@ async def update_allowed_url(rule_id: str, payload: Dict[str, Any]) -> Dict[str,
         raise HTTPException(status_code=400, detail="Pattern cannot be empty")
 
     # Update the rule in config
+    domain_counts = _domain_counts(config["allow_rules"])
     config["allow_rules"][rule_index] = updated_rule
 
     # Update allowed_domains
-    config["allowed_domains"] = _derive_allowed_domains(config["allow_rules"])
+    _adjust_domain_count(domain_counts, existing.get("pattern"), -1)
+    _adjust_domain_count(domain_counts, updated_rule["pattern"], 1)
+    config["allowed_domains"] = _allowed_domains(domain_counts)
 
     # Save config
-    path.write_text(yaml.safe_dump(config, sort_keys=False), encoding="utf-8")
-    refresh_config("allow_block")
+    await run_in_threadpool(store_config, "allow_block", config)
 
     return updated_rule
 
@@ -342,29 +859,30 @@ async def update_allowed_url(rule_id: str, payload: Dict[str, Any]) -> Dict[str,
 async def delete_allowed_url(rule_id: str) -> Dict[str, str]:
     """Delete an allowed URL rule."""
     # Load current config
-    path = CONFIG_DIR / "allow_block.yml"
-    config = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    cached = await run_in_threadpool(load_yaml_cached, CONFIG_DIR / "allow_block.yml")
+    config = copy.deepcopy(cached)
 
     if "allow_rules" not in config:
         raise HTTPException(status_code=404, detail="No allow rules found")
 
     # Ensure existing rules have IDs
-    for existing_rule in config["allow_rules"]:
-        _ensure_rule_id(existing_rule)
+    if not _rule_ids_verified(cached):
+        _backfill_rule_ids(config)
 
     # Find and remove the rule
-    original_count = len(config["allow_rules"])
-    config["allow_rules"] = [rule for rule in config["allow_rules"] if rule.get("id") != rule_id]
-
-    if len(config["allow_rules"]) == original_count:
+    by_id = _rules_by_id(config["allow_rules"])
+    if rule_id not in by_id:
         raise HTTPException(status_code=404, detail="Rule not found")
+    domain_counts = _domain_counts(config["allow_rules"])
+    rule_index, removed = by_id[rule_id]
+    del config["allow_rules"][rule_index]
 
     # Update allowed_domains
-    config["allowed_domains"] = _derive_allowed_domains(config["allow_rules"])
+    _adjust_domain_count(domain_counts, removed.get("pattern"), -1)
+    config["allowed_domains"] = _allowed_domains(domain_counts)
 
     # Save config
-    path.write_text(yaml.safe_dump(config, sort_keys=False), encoding="utf-8")
-    refresh_config("allow_block")
+    await run_in_threadpool(store_config, "allow_block", config)
 
     return {"status": "ok"}
 
@@ -373,8 +891,7 @@ async def delete_allowed_url(rule_id: str) -> Dict[str, str]:
 async def update_playwright_settings(payload: Dict[str, Any]) -> Dict[str, Any]:
     """Update Playwright settings (enabled flag and auth profiles)."""
     # Load current crawler config
-    path = CONFIG_DIR / "crawler.yml"
-    config = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    config = copy.deepcopy(await run_in_threadpool(load_yaml_cached, CONFIG_DIR / "crawler.yml"))
 
     # Ensure playwright section exists
     if "playwright" not in config:
@@ -394,8 +911,8 @@ async def update_playwright_settings(payload: Dict[str, Any]) -> Dict[str, Any]:
             config["playwright"][key] = payload[key]
 
     # Save config
-    path.write_text(yaml.safe_dump(config, sort_keys=False), encoding="utf-8")
-    refresh_config("crawler")
+    await run_in_threadpool(store_config, "crawler", config)
+    _clear_auth_status_caches()
 
     return config["playwright"]
 
@@ -405,39 +922,31 @@ async def allowed_urls_auth_status() -> Dict[str, Any]:
     if _allowed_url_status_cache_fresh() and _ALLOWED_URL_STATUS_CACHE.get("payload"):
         return _ALLOWED_URL_STATUS_CACHE["payload"]
 
-    allow_block = yaml.safe_load((CONFIG_DIR / "allow_block.yml").read_text(encoding="utf-8")) or {}
-    crawler_config = yaml.safe_load((CONFIG_DIR / "crawler.yml").read_text(encoding="utf-8")) or {}
+    allow_block = await _allow_block_with_rule_ids(
+        await run_in_threadpool(load_yaml_cached, CONFIG_DIR / "allow_block.yml")
+    )
+    crawler_config = await run_in_threadpool(load_yaml_cached, CONFIG_DIR / "crawler.yml")
     playwright_config = crawler_config.get("playwright", {})
     profiles = playwright_config.get("auth_profiles", {})
 
-    auth_hints = {"by_domain": {}, "recent": []}
-    if AUTH_HINTS_PATH.exists():
-        try:
-            auth_hints = json.loads(AUTH_HINTS_PATH.read_text(encoding="utf-8")) or auth_hints
-        except json.JSONDecodeError:
-            auth_hints = {"by_domain": {}, "recent": []}
+    auth_hints = load_auth_hints()
 
     allow_rules = allow_block.get("allow_rules", []) or []
-    playwright_ok = playwright_available()
+    playwright_ok = _playwright_available_cached()
+    checked_at = _utcnow()
     rules_payload = []
+    # One probe per (profile, url), however many rules share it
+    probes: Dict[Tuple[str, str], Awaitable[Any]] = {}
+    probe_targets: List[Tuple[int, Tuple[str, str]]] = []
+    probe_limit = asyncio.Semaphore(AUTH_PROBE_CONCURRENCY)
 
-    updated = False
-    for rule in allow_rules:
-        if isinstance(rule, dict) and not rule.get("id"):
-            _ensure_rule_id(rule)
-            updated = True
-
-    if updated:
-        write_yaml_config(CONFIG_DIR / "allow_block.yml", allow_block)
-        refresh_config("allow_block")
-
-    for rule in allow_rules:
+    auth_hint_flags = _auth_hint_flags(allow_rules, auth_hints)
+    for rule, auth_required_hint in zip(allow_rules, auth_hint_flags):
         if not isinstance(rule, dict):
             continue
         rule_id = rule.get("id") or str(uuid.uuid4())
         pattern = rule.get("pattern", "")
         auth_profile = rule.get("auth_profile") or rule.get("authProfile")
-        auth_required_hint = _get_auth_hint_for_rule(rule, auth_hints)
 
         auth_test = None
         ui_status = "unknown"
@@ -446,26 +955,10 @@ async def allowed_urls_auth_status() -> Dict[str, Any]:
             profile = profiles.get(auth_profile)
             if not profile:
                 ui_status = "invalid"
-                auth_test = {
-                    "profile_name": auth_profile,
-                    "ok": False,
-                    "final_url": "",
-                    "title": "",
-                    "status": None,
-                    "error_reason": "auth profile not found",
-                    "checked_at": _utcnow(),
-                }
+                auth_test = _failed_auth_test(auth_profile, "auth profile not found", checked_at)
             elif not playwright_ok:
                 ui_status = "cannot_test"
-                auth_test = {
-                    "profile_name": auth_profile,
-                    "ok": False,
-                    "final_url": "",
-                    "title": "",
-                    "status": None,
-                    "error_reason": "playwright unavailable",
-                    "checked_at": _utcnow(),
-                }
+                auth_test = _failed_auth_test(auth_profile, "playwright unavailable", checked_at)
             else:
                 candidate_url = (
                     profile.get("test_url")
@@ -473,15 +966,23 @@ async def allowed_urls_auth_status() -> Dict[str, Any]:
                     or pattern
                     or profile.get("start_url")
                 )
-                result = await validate_auth_profile(
-                    auth_profile,
-                    profile,
-                    crawler_config,
-                    allow_block,
-                    test_url_override=candidate_url,
-                )
-                auth_test = result.to_dict()
-                ui_status = "valid" if result.ok else "invalid"
+                cache_key = (auth_profile, candidate_url)
+                cached = _cached_auth_test(cache_key)
+                if cached is not None:
+                    auth_test, ui_status = cached
+                else:
+                    probe_targets.append((len(rules_payload), cache_key))
+                    if cache_key not in probes:
+                        probes[cache_key] = _limited(
+                            probe_limit,
+                            validate_auth_profile(
+                                auth_profile,
+                                profile,
+                                crawler_config,
+                                allow_block,
+                                test_url_override=candidate_url,
+                            ),
+                        )
         else:
             if auth_required_hint:
                 ui_status = "needs_profile"
@@ -497,80 +998,119 @@ async def allowed_urls_auth_status() -> Dict[str, Any]:
             }
         )
 
+    # Playwright navigations dominate this endpoint; run them side by side.
+    results = dict(zip(probes, await asyncio.gather(*probes.values(), return_exceptions=True)))
+    for index, cache_key in probe_targets:
+        entry = rules_payload[index]
+        result = results[cache_key]
+        if isinstance(result, BaseException):
+            reason = str(result) or result.__class__.__name__
+            entry["auth_test"] = _failed_auth_test(entry["auth_profile"], reason, _utcnow())
+            entry["ui_status"] = "invalid"
+        else:
+            entry["auth_test"] = result.to_dict()
+            entry["ui_status"] = "valid" if result.ok else "invalid"
+            _store_auth_test(cache_key, entry["auth_test"], entry["ui_status"])
+
     payload = {"rules": rules_payload, "playwright_available": playwright_ok}
-    _ALLOWED_URL_STATUS_CACHE["timestamp"] = datetime.now(timezone.utc).timestamp()
+    _ALLOWED_URL_STATUS_CACHE["timestamp"] = time.monotonic()
     _ALLOWED_URL_STATUS_CACHE["payload"] = payload
     return payload
 
 
-@router.get("/candidates/recommendations")
-async def candidate_recommendations() -> Dict[str, List[Dict[str, Any]]]:
-    if not CANDIDATES_PATH.exists():
-        return {"items": []}
+@router.post("/allowed-urls/auth-status/refresh")
+async def refresh_allowed_urls_auth_status() -> Dict[str, Any]:
+    """Drop cached auth test results so the next status call re-runs every probe."""
+    cleared = len(_AUTH_TEST_CACHE)
+    _clear_auth_status_caches()
+    return {"status": "ok", "cleared": cleared}
+
+
+def _split_url(url: str) -> Optional[Tuple[str, str, str]]:
+    """Return (scheme, netloc, first path segment) without a full urlparse."""
+    scheme, sep, rest = url.partition("://")
+    if not scheme or not sep:
+        return None
+    rest = rest.partition("#")[0].partition("?")[0]
+    netloc, _, path = rest.partition("/")
+    if not netloc:
+        return None
+    return scheme.lower(), netloc, path.lstrip("/").partition("/")[0]
+
+
+def _iter_candidates() -> Iterator[Dict[str, Any]]:
+    with CANDIDATES_PATH.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        for raw in iter(mapped.readline, b""):
+            raw = raw.strip()
+            if not raw:
+                continue
+            try:
+                entry = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                continue
+            if isinstance(entry, dict):
+                yield entry
+
+
+def _recommend_candidates() -> List[Dict[str, Any]]:
+    global _CANDIDATES_CACHE
+    try:
+        stat = CANDIDATES_PATH.stat()
+    except FileNotFoundError:
+        return []
+    if not stat.st_size:
+        return []
+    key = (stat.st_mtime_ns, stat.st_size)
+    if _CANDIDATES_CACHE is not None and _CANDIDATES_CACHE[0] == key:
+        return _CANDIDATES_CACHE[1]
+    items = _aggregate_candidates()
+    _CANDIDATES_CACHE = (key, items)
+    return items
+
+
+def _aggregate_candidates() -> List[Dict[str, Any]]:
     counts: Dict[str, Dict[str, Any]] = {}
-    for line in CANDIDATES_PATH.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
-        try:
-            entry = json.loads(line)
-        except json.JSONDecodeError:
-            continue
+    counts_get = counts.get
+    for entry in _iter_candidates():
         url = entry.get("url")
         if not url:
             continue
-        parsed = urlparse(url)
-        if not parsed.scheme or not parsed.netloc:
+        split = _split_url(url)
+        if split is None:
             continue
-        path_parts = [part for part in parsed.path.split("/") if part]
-        if path_parts:
-            suggested_url = f"{parsed.scheme}://{parsed.netloc}/{path_parts[0]}/"
+        scheme, netloc, first_segment = split
+        if first_segment:
+            suggested_url = f"{scheme}://{netloc}/{first_segment}/"
         else:
-            suggested_url = f"{parsed.scheme}://{parsed.netloc}/"
-        seen_types = {
-            "web": True,
-            "pdf": False,
-            "docx": False,
-            "xlsx": False,
-            "pptx": False,
-        }
-        lower_url = url.lower()
-        if lower_url.endswith(".pdf"):
-            seen_types = {**seen_types, "web": False, "pdf": True}
-        elif lower_url.endswith(".docx"):
-            seen_types = {**seen_types, "web": False, "docx": True}
-        elif lower_url.endswith(".xlsx"):
-            seen_types = {**seen_types, "web": False, "xlsx": True}
-        elif lower_url.endswith(".pptx"):
-            seen_types = {**seen_types, "web": False, "pptx": True}
-        entry_key = suggested_url
-        if entry_key not in counts:
-            counts[entry_key] = {
+            suggested_url = f"{scheme}://{netloc}/"
+        type_bit = _EXT_TYPE_BIT.get(url.rpartition(".")[2].lower(), 1)
+        bucket = counts_get(suggested_url)
+        if bucket is None:
+            bucket = counts[suggested_url] = {
                 "suggested_url": suggested_url,
-                "host": parsed.netloc,
+                "host": netloc,
                 "count": 0,
-                "seen_types": {
-                    "web": False,
-                    "pdf": False,
-                    "docx": False,
-                    "xlsx": False,
-                    "pptx": False,
-                },
+                "seen_types": 0,
             }
-        counts[entry_key]["count"] += 1
-        for key, value in seen_types.items():
-            if value:
-                counts[entry_key]["seen_types"][key] = True
-    items = sorted(counts.values(), key=lambda item: item["count"], reverse=True)[:50]
-    return {"items": items}
+        bucket["count"] += 1
+        bucket["seen_types"] |= type_bit
+    items = heapq.nlargest(50, counts.values(), key=lambda item: item["count"])
+    for item in items:
+        mask = item["seen_types"]
+        item["seen_types"] = {name: bool(mask & (1 << index)) for index, name in enumerate(_SEEN_TYPES)}
+    return items
+
+
+@router.get("/candidates/recommendations")
+async def candidate_recommendations() -> Dict[str, List[Dict[str, Any]]]:
+    return {"items": await run_in_threadpool(_recommend_candidates)}
 
 
 @router.post("/candidates/purge")
 async def purge_candidates() -> Dict[str, str]:
     try:
-        if CANDIDATES_PATH.exists():
-            CANDIDATES_PATH.unlink()
-        if PROCESSED_PATH.exists():
-            PROCESSED_PATH.unlink()
+        await run_in_threadpool(CANDIDATES_PATH.unlink, missing_ok=True)
+        await run_in_threadpool(PROCESSED_PATH.unlink, missing_ok=True)
         return {"status": "ok"}
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -579,50 +1119,126 @@ async def purge_candidates() -> Dict[str, str]:
 @router.post("/reset_crawl")
 async def reset_crawl() -> Dict[str, Any]:
     """Reset crawl state by deleting artifacts, candidates, and job logs."""
-    import shutil
-    deleted_items = []
+    return {"status": "ok", "deleted": await run_in_threadpool(_reset_paths, _CRAWL_STATE_TARGETS, not FAST_RESET)}
 
-    # Delete artifacts
-    artifacts_path = Path("/app/data/artifacts")
-    if artifacts_path.exists():
-        artifact_count = len(list(artifacts_path.glob("*/artifact.json")))
-        shutil.rmtree(artifacts_path)
-        artifacts_path.mkdir(parents=True, exist_ok=True)
-        deleted_items.append(f"{artifact_count} artifacts")
-
-    # Delete candidates
-    if CANDIDATES_PATH.exists():
-        CANDIDATES_PATH.unlink()
-        deleted_items.append("candidates.jsonl")
-
-    if PROCESSED_PATH.exists():
-        PROCESSED_PATH.unlink()
-        deleted_items.append("processed.json")
-
-    # Delete job logs
-    job_logs_path = Path("/app/data/logs/jobs")
-    if job_logs_path.exists():
-        log_count = len(list(job_logs_path.glob("*.log")))
-        shutil.rmtree(job_logs_path)
-        job_logs_path.mkdir(parents=True, exist_ok=True)
-        deleted_items.append(f"{log_count} job logs")
-
-    # Delete summaries
-    summaries_path = Path("/app/data/logs/summaries")
-    if summaries_path.exists():
-        summary_count = len(list(summaries_path.glob("*.json")))
-        shutil.rmtree(summaries_path)
-        summaries_path.mkdir(parents=True, exist_ok=True)
-        deleted_items.append(f"{summary_count} summaries")
-
-    return {"status": "ok", "deleted": deleted_items}
 
+def _get_meta_conn() -> sqlite3.Connection:
+    """
+    Return the shared connection to the ingest metadata DB, creating the DB if needed.
+
+    Callers must hold `_META_CONN_LOCK`. The connection is reopened when the
+    database file is replaced (reset endpoints unlink it). It runs in WAL mode
+    so these reads don't block on, or stall, an ingest job writing the DB.
+    """
+    global _META_CONN
+    if not DB_PATH.exists():
+        ensure_metadata_db_initialized()
+    stat = DB_PATH.stat()
+    identity = (stat.st_dev, stat.st_ino)
+    if _META_CONN is None or _META_CONN[0] != identity:
+        _close_meta_conn()
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        # An empty or older-schema file exists but lacks the tables; bring it up to date.
+        if conn.execute("PRAGMA user_version").fetchone()[0] < METADATA_SCHEMA_VERSION:
+            ensure_metadata_db_initialized()
+        _META_CONN = (identity, conn)
+    return _META_CONN[1]
+
+
+def _close_meta_conn() -> None:
+    global _META_CONN
+    if _META_CONN is not None:
+        _META_CONN[1].close()
+        _META_CONN = None
+
+
+def _remove_metadata_db() -> bool:
+    """Delete the ingest metadata DB, dropping the shared connection first."""
+    with _META_CONN_LOCK:
+        _close_meta_conn()
+        # A leftover WAL must not be replayed into the next database at this path
+        for suffix in ("-wal", "-shm"):
+            DB_PATH.with_name(DB_PATH.name + suffix).unlink(missing_ok=True)
+        try:
+            DB_PATH.unlink()
+        except FileNotFoundError:
+            return False
+    return True
+
+
+def _meta_counts() -> Tuple[List[str], int, int, int]:
+    """Return (tables, document count, chunk count, schema version) in one round-trip."""
+    with _META_CONN_LOCK:
+        conn = _get_meta_conn()
+        tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name;")]
+        doc_count = "(SELECT COUNT(*) FROM documents)" if "documents" in tables else "0"
+        chunk_count = "(SELECT COUNT(*) FROM chunks)" if "chunks" in tables else "0"
+        row = conn.execute(
+            f"SELECT {doc_count}, {chunk_count}, (SELECT user_version FROM pragma_user_version)"
+        ).fetchone()
+    return tables, row[0], row[1], row[2]
+
+
+def _ingest_record_for_url(url: str) -> Dict[str, Any]:
+    with _META_CONN_LOCK:
+        conn = _get_meta_conn()
+        doc_row = conn.execute(
+            "SELECT doc_id, url, ingested_at, chunk_count, content_hash FROM documents WHERE url = ?",
+            (url,),
+        ).fetchone()
+        if not doc_row:
+            return {"found": False}
+        doc_id, doc_url, ingested_at, chunk_count, content_hash = doc_row
+        chunk_count_db = conn.execute("SELECT COUNT(*) FROM chunks WHERE doc_id = ?", (doc_id,)).fetchone()[0]
+    return {
+        "found": True,
+        "doc_id": doc_id,
+        "url": doc_url,
+        "chunk_count": chunk_count_db,
+        "chunk_count_recorded": chunk_count,
+        "ingested_at": ingested_at,
+        "content_hash": content_hash,
+    }
 
-@router.get("/ingest-metadata/status")
-async def get_ingest_metadata_status() -> Dict[str, Any]:
-    """Get status of the ingest metadata database."""
-    import sqlite3
 
+def _clear_ingest_records(targets: List[Tuple[str, Optional[str]]]) -> List[Tuple[Optional[str], int, int]]:
+    """Delete the metadata rows of several documents in one transaction.
+
+    `targets` are (url, doc_id) pairs; a missing doc_id is looked up by URL.
+    Returns (doc_id, documents deleted, chunks deleted) per target.
+    """
+    with _META_CONN_LOCK:
+        conn = _get_meta_conn()
+        by_url: Dict[str, str] = {}
+        unresolved = [url for url, doc_id in targets if not doc_id]
+        if unresolved:
+            marks = ",".join("?" * len(unresolved))
+            for url, doc_id in conn.execute(f"SELECT url, doc_id FROM documents WHERE url IN ({marks})", unresolved):
+                by_url.setdefault(url, doc_id)
+        doc_ids = [doc_id or by_url.get(url) for url, doc_id in targets]
+        wanted = sorted({doc_id for doc_id in doc_ids if doc_id})
+        chunk_counts: Dict[str, int] = {}
+        present = set()
+        if wanted:
+            marks = ",".join("?" * len(wanted))
+            chunk_counts = dict(
+                conn.execute(f"SELECT doc_id, COUNT(*) FROM chunks WHERE doc_id IN ({marks}) GROUP BY doc_id", wanted)
+            )
+            present = {row[0] for row in conn.execute(f"SELECT doc_id FROM documents WHERE doc_id IN ({marks})", wanted)}
+            with conn:
+                conn.execute(f"DELETE FROM chunks WHERE doc_id IN ({marks})", wanted)
+                conn.execute(f"DELETE FROM documents WHERE doc_id IN ({marks})", wanted)
+    return [
+        (doc_id, int(doc_id in present), chunk_counts.get(doc_id, 0)) if doc_id else (None, 0, 0)
+        for doc_id in doc_ids
+    ]
+
+
+def _ingest_metadata_status() -> Dict[str, Any]:
     status = {
         "db_path": str(DB_PATH),
         "exists": DB_PATH.exists(),
@@ -634,7 +1250,7 @@ async def get_ingest_metadata_status() -> Dict[str, Any]:
         "initialized": False,
     }
 
-    if not DB_PATH.exists():
+    if not status["exists"]:
         return status
 
     try:
@@ -643,110 +1259,61 @@ async def get_ingest_metadata_status() -> Dict[str, Any]:
         # Ensure schema is initialized
         ensure_metadata_db_initialized()
 
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-
-        # Check which tables exist
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name;")
-        tables = [row[0] for row in cursor.fetchall()]
+        tables, doc_count, chunk_count, schema_version = _meta_counts()
         status["tables_present"] = tables
-
-        # Get counts if tables exist
-        if "documents" in tables:
-            cursor.execute("SELECT COUNT(*) FROM documents")
-            status["doc_count"] = cursor.fetchone()[0]
-
-        if "chunks" in tables:
-            cursor.execute("SELECT COUNT(*) FROM chunks")
-            status["chunk_count"] = cursor.fetchone()[0]
-
-        # Get schema version
-        cursor.execute("PRAGMA user_version")
-        status["schema_version"] = cursor.fetchone()[0]
+        status["doc_count"] = doc_count
+        status["chunk_count"] = chunk_count
+        status["schema_version"] = schema_version
 
         # Mark as initialized if we have the expected tables
         status["initialized"] = "documents" in tables and "chunks" in tables
 
-        conn.close()
-
     except Exception as e:
         status["error"] = str(e)
 
     return status
 
 
-@router.post("/reset_ingest")
-async def reset_ingest() -> Dict[str, Any]:
-    """Reset ingest state by deleting metadata database."""
-    import sqlite3
+@router.get("/ingest-metadata/status")
+async def get_ingest_metadata_status() -> Dict[str, Any]:
+    """Get status of the ingest metadata database."""
+    return await run_in_threadpool(_ingest_metadata_status)
+
+
+def _reset_ingest_metadata() -> List[str]:
     deleted_items = []
 
     if DB_PATH.exists():
         # Count records before deleting (ensure schema exists first)
         try:
             ensure_metadata_db_initialized()
-            conn = sqlite3.connect(DB_PATH)
-            cursor = conn.cursor()
-            doc_count = cursor.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
-            chunk_count = cursor.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
-            conn.close()
+            _, doc_count, chunk_count, _ = _meta_counts()
             deleted_items.append(f"{doc_count} documents")
             deleted_items.append(f"{chunk_count} chunks")
         except Exception:
             deleted_items.append("metadata.db (corrupted or empty)")
 
-        DB_PATH.unlink()
+        _remove_metadata_db()
 
-    return {"status": "ok", "deleted": deleted_items}
+    return deleted_items
+
+
+@router.post("/reset_ingest")
+async def reset_ingest() -> Dict[str, Any]:
+    """Reset ingest state by deleting metadata database."""
+    return {"status": "ok", "deleted": await run_in_threadpool(_reset_ingest_metadata)}
 
 
 @router.post("/reset/artifacts")
 async def reset_artifacts() -> Dict[str, Any]:
     """Delete crawl artifacts, candidates, logs, and summaries."""
-    import shutil
-
-    deleted_items = []
-    artifacts_path = Path("/app/data/artifacts")
-    if artifacts_path.exists():
-        artifact_count = len(list(artifacts_path.glob("*/artifact.json")))
-        shutil.rmtree(artifacts_path)
-        artifacts_path.mkdir(parents=True, exist_ok=True)
-        deleted_items.append(f"{artifact_count} artifacts")
-
-    if CANDIDATES_PATH.exists():
-        CANDIDATES_PATH.unlink()
-        deleted_items.append("candidates.jsonl")
-
-    if PROCESSED_PATH.exists():
-        PROCESSED_PATH.unlink()
-        deleted_items.append("processed.json")
-
-    job_logs_path = Path("/app/data/logs/jobs")
-    if job_logs_path.exists():
-        log_count = len(list(job_logs_path.glob("*.log")))
-        shutil.rmtree(job_logs_path)
-        job_logs_path.mkdir(parents=True, exist_ok=True)
-        deleted_items.append(f"{log_count} job logs")
-
-    if SUMMARY_DIR.exists():
-        summary_count = len(list(SUMMARY_DIR.glob("*.json")))
-        shutil.rmtree(SUMMARY_DIR)
-        SUMMARY_DIR.mkdir(parents=True, exist_ok=True)
-        deleted_items.append(f"{summary_count} summaries")
-
-    if QUARANTINE_DIR.exists():
-        quarantine_count = len(list(QUARANTINE_DIR.glob("*")))
-        shutil.rmtree(QUARANTINE_DIR)
-        QUARANTINE_DIR.mkdir(parents=True, exist_ok=True)
-        deleted_items.append(f"{quarantine_count} quarantined artifacts")
-
-    return {"status": "ok", "deleted": deleted_items}
+    return {"status": "ok", "deleted": await run_in_threadpool(_reset_paths, _DELETABLE_TARGETS, not FAST_RESET)}
 
 
 @router.post("/reset/qdrant")
 async def reset_qdrant() -> Dict[str, Any]:
     """Reset Qdrant collection and ingest metadata database."""
-    system_config = yaml.safe_load((CONFIG_DIR / "system.yml").read_text(encoding="utf-8")) or {}
+    system_config = _system_config()
     qdrant_config = system_config.get("qdrant", {})
     ollama_config = system_config.get("ollama", {})
     collection = qdrant_config.get("collection")
@@ -755,36 +1322,48 @@ async def reset_qdrant() -> Dict[str, Any]:
     ollama_host = ollama_config.get("host")
     if not collection or not qdrant_host:
         raise HTTPException(status_code=400, detail="Missing qdrant configuration")
-    client = QdrantClient(url=qdrant_host)
+    client = _async_qdrant_client(qdrant_host)
     deleted_items = []
 
     vector_size = None
+    count_before = 0
+    exists = True
     try:
-        collections = client.get_collections().collections
-    except Exception as e:
+        info = await client.get_collection(collection)
+        vector_size = info.config.params.vectors.size
+        count_before = info.points_count
+    except UnexpectedResponse as e:
+        if e.status_code != 404:
+            raise HTTPException(status_code=500, detail=f"Error connecting to Qdrant: {e}")
+        exists = False
+    except ResponseHandlingException as e:
         raise HTTPException(status_code=500, detail=f"Error connecting to Qdrant: {e}")
+    except Exception:
+        # The collection exists but its config doesn't match the client schema.
+        pass
+    if vector_size is None and (not embedding_model or not ollama_host):
+        raise HTTPException(status_code=400, detail="Missing embedding configuration")
 
-    if any(col.name == collection for col in collections):
-        try:
-            info = client.get_collection(collection)
-            vector_size = info.config.params.vectors.size
-            count_before = info.points_count
-        except Exception:
-            count_before = 0
-        client.delete_collection(collection_name=collection)
-        deleted_items.append(f"{count_before} vectors from collection '{collection}'")
+    pending = []
+    if exists:
+        pending.append(client.delete_collection(collection_name=collection))
     if vector_size is None:
-        if not embedding_model or not ollama_host:
-            raise HTTPException(status_code=400, detail="Missing embedding configuration")
-        vector_size = len(embed_text(ollama_host, embedding_model, "dimension probe"))
-    client.create_collection(
+        pending.append(_embedding_dimension(ollama_host, embedding_model))
+    results = await asyncio.gather(*pending)
+    if vector_size is None:
+        vector_size = results[-1]
+    if exists:
+        deleted_items.append(f"{count_before} vectors from collection '{collection}'")
+
+    await client.create_collection(
         collection_name=collection,
         vectors_config=rest.VectorParams(size=vector_size, distance=rest.Distance.COSINE),
     )
-    client.create_payload_index(collection_name=collection, field_name="doc_id", field_schema="keyword")
-
-    if DB_PATH.exists():
-        DB_PATH.unlink()
+    _, db_removed = await asyncio.gather(
+        client.create_payload_index(collection_name=collection, field_name="doc_id", field_schema="keyword"),
+        run_in_threadpool(_remove_metadata_db),
+    )
+    if db_removed:
         deleted_items.append("ingest metadata.db")
 
     return {"status": "ok", "deleted": deleted_items, "collection": collection}
@@ -793,8 +1372,8 @@ async def reset_qdrant() -> Dict[str, Any]:
 @router.post("/reset/all")
 async def reset_all() -> Dict[str, Any]:
     """Delete all crawl artifacts, logs, quarantine, and reset Qdrant + ingest metadata."""
-    artifacts_result = await reset_artifacts()
-    qdrant_result = await reset_qdrant()
+    # Filesystem deletes run in the threadpool, so they overlap the Qdrant round-trips
+    artifacts_result, qdrant_result = await asyncio.gather(reset_artifacts(), reset_qdrant())
     return {
         "status": "ok",
         "deleted": (artifacts_result.get("deleted", []) + qdrant_result.get("deleted", [])),
@@ -804,10 +1383,10 @@ async def reset_all() -> Dict[str, Any]:
 @router.post("/validate/crawl")
 async def validate_crawl() -> Dict[str, Any]:
     """Run crawl artifact validation and return summary."""
-    SUMMARY_DIR.mkdir(parents=True, exist_ok=True)
+    await run_in_threadpool(SUMMARY_DIR.mkdir, parents=True, exist_ok=True)
 
     # Run the crawl validator script
-    _run_validation(
+    await _run_validation(
         [
             "python",
             "/app/tools/validate_crawl.py",
@@ -822,48 +1401,55 @@ async def validate_crawl() -> Dict[str, Any]:
     )
 
     # Read the latest summary
-    summary_path = SUMMARY_DIR / "validate_crawl_latest.json"
-    if not summary_path.is_file():
-        latest = _latest_summary("validate_crawl_")
-        if not latest or not latest.is_file():
-            raise HTTPException(status_code=500, detail="Crawl validation summary not found")
-        summary_path = latest
-
-    payload = json.loads(summary_path.read_text(encoding="utf-8"))
+    payload = await run_in_threadpool(_read_crawl_summary)
+    if payload is None:
+        raise HTTPException(status_code=500, detail="Crawl validation summary not found")
     return _format_crawl_summary(payload)
 
 
+def _read_summary(prefix: str) -> Optional[Dict[str, Any]]:
+    """Parse <prefix>latest.json, falling back to the newest <prefix>*.json."""
+    try:
+        return orjson.loads((SUMMARY_DIR / f"{prefix}latest.json").read_bytes())
+    except FileNotFoundError:
+        pass
+    latest = _latest_summary(prefix)
+    if latest is None:
+        return None
+    try:
+        return orjson.loads(latest.read_bytes())
+    except FileNotFoundError:
+        return None
+
+
+def _read_crawl_summary() -> Optional[Dict[str, Any]]:
+    return _read_summary("validate_crawl_")
+
+
 @router.get("/validate/crawl/summary")
 async def get_crawl_summary() -> Dict[str, Any]:
-    summary_path = SUMMARY_DIR / "validate_crawl_latest.json"
-
-    if not summary_path.is_file():
-        latest = _latest_summary("validate_crawl_")
-        if not latest or not latest.is_file():
-            # Return empty status instead of 404 for better UI handling
-            return {
-                "status": "empty",
-                "summary": {
-                    "total": 0,
-                    "flagged": 0,
-                    "quarantined": 0,
-                },
-                "validated": [],
-                "raw": None,
-            }
-        summary_path = latest
-
-    payload = json.loads(summary_path.read_text(encoding="utf-8"))
+    payload = await run_in_threadpool(_read_crawl_summary)
+    if payload is None:
+        # Return empty status instead of 404 for better UI handling
+        return {
+            "status": "empty",
+            "summary": {
+                "total": 0,
+                "flagged": 0,
+                "quarantined": 0,
+            },
+            "validated": [],
+            "raw": None,
+        }
     return _format_crawl_summary(payload)
 
 
 @router.post("/validate/ingest")
 async def validate_ingest() -> Dict[str, Any]:
     """Run ingest validation and return summary."""
-    SUMMARY_DIR.mkdir(parents=True, exist_ok=True)
-    summary_path = SUMMARY_DIR / "validate_ingest_latest.json"
+    await run_in_threadpool(SUMMARY_DIR.mkdir, parents=True, exist_ok=True)
     redis_info = _parse_redis_host_port()
-    _run_validation(
+    await _run_validation(
         [
             "python",
             "/app/tools/validate_ingest.py",
@@ -878,60 +1464,77 @@ async def validate_ingest() -> Dict[str, Any]:
             "/app/data/ingest/metadata.db",
         ]
     )
-    latest = _latest_summary("validate_ingest_")
-    if not latest.exists():
+    payload = await run_in_threadpool(_publish_ingest_summary)
+    if payload is None:
         raise HTTPException(status_code=500, detail="Ingest validation summary not found")
-    payload = json.loads(latest.read_text(encoding="utf-8"))
-    summary_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
     return _format_ingest_summary(payload)
 
 
+def _publish_ingest_summary() -> Optional[Dict[str, Any]]:
+    """Copy the newest ingest validator summary to validate_ingest_latest.json and return it."""
+    latest = _latest_summary("validate_ingest_")
+    if latest is None:
+        return None
+    summary_path = SUMMARY_DIR / "validate_ingest_latest.json"
+    # The prefix also matches the published copy; it is already in place then.
+    if latest != summary_path:
+        tmp_path = summary_path.with_name(summary_path.name + ".tmp")
+        shutil.copyfile(latest, tmp_path)
+        os.replace(tmp_path, summary_path)
+    return orjson.loads(summary_path.read_bytes())
+
+
+def _read_ingest_summary() -> Optional[Dict[str, Any]]:
+    return _read_summary("validate_ingest_")
+
+
 @router.get("/validate/ingest/summary")
 async def get_ingest_summary() -> Dict[str, Any]:
-    summary_path = SUMMARY_DIR / "validate_ingest_latest.json"
-    if not summary_path.exists():
-        summary_path = _latest_summary("validate_ingest_")
-    if not summary_path.exists():
+    payload = await run_in_threadpool(_read_ingest_summary)
+    if payload is None:
         raise HTTPException(status_code=404, detail="No ingest validation summary available")
-    payload = json.loads(summary_path.read_text(encoding="utf-8"))
     return _format_ingest_summary(payload)
 
 
-@router.post("/quarantine")
-async def quarantine_artifacts(payload: Dict[str, Any]) -> Dict[str, Any]:
-    ids = payload.get("ids", [])
-    if not isinstance(ids, list) or not ids:
-        raise HTTPException(status_code=400, detail="No artifact ids provided")
+def _quarantine(ids: List[Any], durable: bool) -> Tuple[List[Any], List[Any]]:
     QUARANTINE_DIR.mkdir(parents=True, exist_ok=True)
     QUARANTINE_AUDIT_LOG.parent.mkdir(parents=True, exist_ok=True)
     quarantined = []
     missing = []
-    for artifact_id in ids:
-        source_dir = Path("/app/data/artifacts") / artifact_id
-        if not source_dir.exists():
-            missing.append(artifact_id)
-            continue
-        destination = QUARANTINE_DIR / artifact_id
-        try:
-            source_dir.rename(destination)
+    with QUARANTINE_AUDIT_LOG.open("a", encoding="utf-8") as audit:
+        for artifact_id in ids:
+            source_dir = Path("/app/data/artifacts") / artifact_id
+            if not source_dir.exists():
+                missing.append(artifact_id)
+                continue
+            destination = QUARANTINE_DIR / artifact_id
+            try:
+                source_dir.rename(destination)
+            except Exception as exc:
+                missing.append(f"{artifact_id}: {exc}")
+                continue
             quarantined.append(artifact_id)
-            with QUARANTINE_AUDIT_LOG.open("a", encoding="utf-8") as handle:
-                handle.write(
-                    f"{_utcnow()} quarantine id={artifact_id} src={source_dir} dst={destination}\n"
-                )
-        except Exception as exc:
-            missing.append(f"{artifact_id}: {exc}")
+            # Hand each line to the OS as soon as its move is done, so a crash
+            # later in the batch can't lose the record of completed moves.
+            audit.write(f"{_utcnow()} quarantine id={artifact_id} src={source_dir} dst={destination}\n")
+            audit.flush()
+        if durable and quarantined:
+            os.fsync(audit.fileno())
+    return quarantined, missing
+
+
+@router.post("/quarantine")
+async def quarantine_artifacts(payload: Dict[str, Any]) -> Dict[str, Any]:
+    ids = payload.get("ids", [])
+    if not isinstance(ids, list) or not ids:
+        raise HTTPException(status_code=400, detail="No artifact ids provided")
+    quarantined, missing = await run_in_threadpool(_quarantine, ids, bool(payload.get("durable")))
     return {"status": "ok", "quarantined": quarantined, "missing": missing}
 
 
 @router.get("/crawl/auth_hints")
 async def get_auth_hints() -> Dict[str, Any]:
-    if not AUTH_HINTS_PATH.exists():
-        return {"by_domain": {}, "recent": []}
-    try:
-        return json.loads(AUTH_HINTS_PATH.read_text(encoding="utf-8")) or {"by_domain": {}, "recent": []}
-    except json.JSONDecodeError:
-        return {"by_domain": {}, "recent": []}
+    return load_auth_hints()
 
 
 @router.post("/crawl")
@@ -949,8 +1552,13 @@ async def trigger_ingest() -> Dict[str, str]:
 
 
 @router.get("/jobs")
-async def get_jobs() -> List[Dict[str, Any]]:
-    return [job.__dict__ for job in list_jobs().values()]
+async def get_jobs() -> Response:
+    global _JOBS_JSON_CACHE
+    version = jobs_version()
+    if _JOBS_JSON_CACHE is None or _JOBS_JSON_CACHE[0] != version:
+        # orjson serialises the slotted JobRecord dataclasses natively, without dict copies.
+        _JOBS_JSON_CACHE = (version, orjson.dumps(list(list_jobs().values())))
+    return Response(content=_JOBS_JSON_CACHE[1], media_type="application/json")
 
 
 @router.get("/jobs/{job_id}")
@@ -958,34 +1566,137 @@ async def get_job_detail(job_id: str) -> Dict[str, Any]:
     job = get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
-    return job.__dict__
+    return job.as_dict()
 
 
-async def _tail_log(job_id: str) -> AsyncGenerator[str, None]:
-    log_path = Path("/app/data/logs/jobs") / f"{job_id}.log"
+async def _tail_log(job_id: str, from_tail: bool = False) -> AsyncGenerator[str, None]:
+    global _LOG_WATCHERS_ACTIVE
+    log_path = JOB_LOG_DIR / f"{job_id}.log"
     if not log_path.exists():
         yield f"data: {job_id} not found\n\n"
         return
-    with log_path.open("r", encoding="utf-8") as handle:
-        while True:
-            line = handle.readline()
-            if line:
-                yield f"data: {line.strip()}\n\n"
-            else:
-                await asyncio.sleep(1.0)
+    # Wake on file modification instead of polling; the heartbeat timeout bounds the
+    # delay if an append lands before the watcher is armed. Bursts of appends are
+    # coalesced for a few ms, but a busy writer still flushes every LOG_TAIL_MAX_DELAY_MS
+    # (watchfiles' default debounce would hold them for up to 1.6 s).
+    changes = None
+    if awatch is not None and _LOG_WATCHERS_ACTIVE < LOG_TAIL_MAX_WATCHERS:
+        _LOG_WATCHERS_ACTIVE += 1
+        changes = awatch(
+            log_path,
+            step=LOG_TAIL_COALESCE_MS,
+            debounce=LOG_TAIL_MAX_DELAY_MS,
+            rust_timeout=LOG_TAIL_HEARTBEAT_MS,
+            yield_on_timeout=True,
+        )
+    try:
+        # Read bytes: a tail seek can land inside a multi-byte character, and the
+        # incremental decoder keeps characters split across reads intact.
+        with log_path.open("rb") as handle:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            pending = ""
+            if from_tail:
+                # Skip history except the last few KB of context; the first line
+                # after the seek may be cut mid-way, so drop it.
+                size = handle.seek(0, os.SEEK_END)
+                if size > LOG_TAIL_CONTEXT_BYTES:
+                    handle.seek(size - LOG_TAIL_CONTEXT_BYTES)
+                    handle.readline()
+                else:
+                    handle.seek(0)
+            while True:
+                chunk = decoder.decode(handle.read(LOG_TAIL_CHUNK_SIZE))
+                if chunk:
+                    # Emit every complete line of the backlog in one write; hold back a
+                    # trailing partial line until the writer finishes it.
+                    lines = (pending + chunk).split("\n")
+                    pending = lines.pop()
+                    if lines:
+                        yield "".join(f"data: {line.strip()}\n\n" for line in lines)
+                    continue
+                if changes is None:
+                    await asyncio.sleep(LOG_TAIL_POLL_SECONDS)
+                    continue
+                await changes.__anext__()
+                if not log_path.exists():
+                    # Job was removed; end the stream instead of tailing an orphaned handle.
+                    return
+    finally:
+        if changes is not None:
+            _LOG_WATCHERS_ACTIVE -= 1
+            await changes.aclose()
 
 
 @router.get("/jobs/{job_id}/log")
-async def stream_log(job_id: str) -> StreamingResponse:
-    return StreamingResponse(_tail_log(job_id), media_type="text/event-stream")
+async def stream_log(
+    job_id: str, start_from: str = Query("start", alias="from", pattern="^(start|tail)$")
+) -> StreamingResponse:
+    """Stream a job log over SSE, from its first line or (`from=tail`) from its last few KB."""
+    return StreamingResponse(_tail_log(job_id, from_tail=start_from == "tail"), media_type="text/event-stream")
+
+
+def _compressed_log(log_path: Path) -> Tuple[Path, os.stat_result]:
+    """Return `<log>.gz` and its stat, (re)building it when missing or older than the log."""
+    gz_path = log_path.with_name(log_path.name + ".gz")
+    if not gz_path.exists() or gz_path.stat().st_mtime_ns < log_path.stat().st_mtime_ns:
+        # A private temp name per call, so concurrent exports of one log can't share a file
+        with tempfile.NamedTemporaryFile(dir=gz_path.parent, prefix=f".{gz_path.name}.", delete=False) as tmp:
+            try:
+                with log_path.open("rb") as src, gzip.GzipFile(log_path.name, "wb", 6, tmp) as dst:
+                    shutil.copyfileobj(src, dst, LOG_TAIL_CHUNK_SIZE)
+            except BaseException:
+                os.unlink(tmp.name)
+                raise
+        os.replace(tmp.name, gz_path)
+    return gz_path, gz_path.stat()
+
+
+class _LogFileResponse(FileResponse):
+    # Starlette reads and sends files in 64 KiB pieces by default; exported logs
+    # are large and fully on disk, so fewer, bigger reads/sends are cheaper.
+    chunk_size = LOG_EXPORT_CHUNK_SIZE
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
 
 
 @router.get("/jobs/{job_id}/log/export")
-async def export_log(job_id: str) -> FileResponse:
-    log_path = Path("/app/data/logs/jobs") / f"{job_id}.log"
-    if not log_path.exists():
+async def export_log(job_id: str, request: Request) -> Response:
+    log_path = JOB_LOG_DIR / f"{job_id}.log"
+    try:
+        stat = log_path.stat()
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Log not found")
-    return FileResponse(log_path, filename=f"{job_id}.log", media_type="text/plain")
+    job = get_job(job_id)
+    finished = job is None or job.status != "running"
+    gzipped = finished and "gzip" in request.headers.get("accept-encoding", "")
+    etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}{"-gz" if gzipped else ""}"'
+    headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+        "Cache-Control": "private, max-age=0, must-revalidate",
+        "Vary": "Accept-Encoding",
+    }
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    if gzipped:
+        # A finished log never changes: compress it once and let sendfile serve the .gz.
+        gz_path, gz_stat = await run_in_threadpool(_compressed_log, log_path)
+        return _LogFileResponse(
+            gz_path,
+            filename=f"{job_id}.log",
+            media_type="text/plain",
+            headers={**headers, "Content-Encoding": "gzip"},
+            stat_result=gz_stat,
+        )
+    return _LogFileResponse(
+        log_path, filename=f"{job_id}.log", media_type="text/plain", headers=headers, stat_result=stat
+    )
 
 
 @router.get("/jobs/{job_id}/summary")
@@ -993,7 +1704,7 @@ async def get_job_summary(job_id: str) -> Dict[str, Any]:
     summary_path = Path("/app/data/logs/summaries") / f"{job_id}.json"
     if not summary_path.exists():
         raise HTTPException(status_code=404, detail="Summary not found")
-    return json.loads(summary_path.read_text(encoding="utf-8"))
+    return orjson.loads(await run_in_threadpool(summary_path.read_bytes))
 
 
 @router.delete("/jobs/{job_id}")
@@ -1002,124 +1713,109 @@ async def remove_job(job_id: str) -> Dict[str, str]:
     return {"status": "ok"}
 
 
-@router.get("/data/health")
-async def get_data_health() -> Dict[str, Any]:
-    """Get comprehensive health status for all data pipeline components."""
-    import glob
-    import sqlite3
-    from app.utils.config import load_config
+@router.post("/data/artifact_cache/clear")
+async def clear_artifact_cache() -> Dict[str, Any]:
+    with _ARTIFACT_CACHE_LOCK:
+        entries = len(_ARTIFACT_CACHE)
+        _ARTIFACT_CACHE.clear()
+    return {"status": "ok", "cleared": entries}
 
-    health = {}
 
-    # Artifacts status
-    artifacts_path = Path("/app/data/artifacts")
-    quarantine_path = Path("/app/data/quarantine")
-    artifacts_count = 0
-    quarantined_count = 0
-    last_captured_at = None
-
-    if artifacts_path.exists():
-        artifact_dirs = list(artifacts_path.glob("*/artifact.json"))
-        artifacts_count = len(artifact_dirs)
-
-        # Find most recent artifact
-        if artifact_dirs:
-            latest_artifact = max(artifact_dirs, key=lambda p: p.stat().st_mtime)
-            last_captured_at = datetime.fromtimestamp(
-                latest_artifact.stat().st_mtime, tz=timezone.utc
-            ).isoformat()
+def _quarantined_count() -> int:
+    global _QUARANTINE_COUNT_CACHE
+    try:
+        mtime_ns = QUARANTINE_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+    # Moving an artifact in or out changes the directory's mtime
+    if _QUARANTINE_COUNT_CACHE is None or _QUARANTINE_COUNT_CACHE[0] != mtime_ns:
+        _QUARANTINE_COUNT_CACHE = (mtime_ns, _count_matching(QUARANTINE_DIR))
+    return _QUARANTINE_COUNT_CACHE[1]
 
-    if quarantine_path.exists():
-        quarantined_count = len(list(quarantine_path.glob("*")))
 
-    health["artifacts"] = {
+def _artifacts_health() -> Dict[str, Any]:
+    artifacts_count, latest_mtime_ns = artifact_stats()
+    last_captured_at = None
+    if latest_mtime_ns is not None:
+        last_captured_at = datetime.fromtimestamp(latest_mtime_ns / 1e9, tz=timezone.utc).isoformat()
+    return {
         "count": artifacts_count,
-        "quarantined": quarantined_count,
+        "quarantined": _quarantined_count(),
         "last_captured_at": last_captured_at,
     }
 
-    # Crawl job status
-    jobs = list_jobs()
-    crawl_jobs = [j for j in jobs.values() if j.job_type == "crawl"]
-    last_crawl_job = None
-
-    if crawl_jobs:
-        latest_crawl = max(crawl_jobs, key=lambda j: j.started_at or "")
-        last_crawl_job = {
-            "id": latest_crawl.job_id,
-            "status": latest_crawl.status,
-            "finished_at": latest_crawl.finished_at,
-            "started_at": latest_crawl.started_at,
-        }
 
-    health["crawl"] = {"last_job": last_crawl_job}
+def _last_job(job_type: str) -> Optional[Dict[str, Any]]:
+    matching = [j for j in list_jobs().values() if j.job_type == job_type]
+    if not matching:
+        return None
+    latest = max(matching, key=lambda j: j.started_at or "")
+    return {
+        "id": latest.job_id,
+        "status": latest.status,
+        "finished_at": latest.ended_at,
+        "started_at": latest.started_at,
+    }
+
 
-    # Ingest worker and job status
+async def _ingest_worker_health() -> Dict[str, Any]:
     try:
         from app.routes.ingest_jobs import get_worker_status
-        worker_status = await get_worker_status()
-        health["ingest"] = {
-            "worker": worker_status,
-            "last_job": None,
-        }
+        return await get_worker_status()
     except Exception:
-        health["ingest"] = {
-            "worker": {"status": "unknown", "details": {}},
-            "last_job": None,
-        }
+        return {"status": "unknown", "details": {}}
 
-    ingest_jobs = [j for j in jobs.values() if j.job_type == "ingest"]
-    if ingest_jobs:
-        latest_ingest = max(ingest_jobs, key=lambda j: j.started_at or "")
-        health["ingest"]["last_job"] = {
-            "id": latest_ingest.job_id,
-            "status": latest_ingest.status,
-            "finished_at": latest_ingest.finished_at,
-            "started_at": latest_ingest.started_at,
-        }
 
-    # Qdrant status
+async def _qdrant_health() -> Dict[str, Any]:
     try:
-        system_config = load_config("system")
+        system_config = _system_config()
         qdrant_config = system_config.get("qdrant", {})
         qdrant_host = qdrant_config.get("host")
         collection_name = qdrant_config.get("collection", "ragai_chunks")
 
-        client = QdrantClient(url=qdrant_host)
-        collections_info = []
-
+        client = _async_qdrant_client(qdrant_host)
         try:
-            collection_info = client.get_collection(collection_name)
-            collections_info.append({
-                "name": collection_name,
-                "points": collection_info.points_count or 0,
-            })
+            collection_info = await client.get_collection(collection_name)
+            points = collection_info.points_count or 0
         except Exception:
-            collections_info.append({
-                "name": collection_name,
-                "points": 0,
-            })
+            points = 0
 
-        health["qdrant"] = {"collections": collections_info}
+        return {"collections": [{"name": collection_name, "points": points}]}
     except Exception as e:
-        health["qdrant"] = {"collections": [], "error": str(e)}
+        return {"collections": [], "error": str(e)}
+
 
-    # System health
+async def _system_health() -> Dict[str, Any]:
     try:
         from app.routes.health import check_health
         api_health = await check_health()
-        health["system"] = {"api_health": "ok" if api_health.get("status") == "ok" else "degraded"}
+        return {"api_health": "ok" if api_health.get("status") == "ok" else "degraded"}
     except Exception:
-        health["system"] = {"api_health": "unknown"}
+        return {"api_health": "unknown"}
 
-    return health
+
+@router.get("/data/health")
+async def get_data_health() -> Dict[str, Any]:
+    """Get comprehensive health status for all data pipeline components."""
+    # The subchecks are independent; the slowest one sets the response time
+    artifacts, worker, qdrant, system = await asyncio.gather(
+        run_in_threadpool(_artifacts_health),
+        _ingest_worker_health(),
+        _qdrant_health(),
+        _system_health(),
+    )
+    return {
+        "artifacts": artifacts,
+        "crawl": {"last_job": _last_job("crawl")},
+        "ingest": {"worker": worker, "last_job": _last_job("ingest")},
+        "qdrant": qdrant,
+        "system": system,
+    }
 
 
 @router.post("/data/check_url")
 async def check_url(payload: Dict[str, Any]) -> Dict[str, Any]:
     """Check a specific URL across artifacts, validation, ingest, and Qdrant."""
-    import sqlite3
-    from app.utils.config import load_config
 
     url = payload.get("url")
     if not url:
@@ -1137,43 +1833,9 @@ async def check_url(payload: Dict[str, Any]) -> Dict[str, Any]:
     # Check artifacts
     artifacts_path = Path("/app/data/artifacts")
     if artifacts_path.exists():
-        found_artifacts = []
-
-        # Scan all artifact.json files
-        for artifact_file in artifacts_path.glob("*/artifact.json"):
-            try:
-                artifact_data = json.loads(artifact_file.read_text(encoding="utf-8"))
-                artifact_url = artifact_data.get("url", "")
-
-                if artifact_url == url or artifact_data.get("final_url") == url:
-                    artifact_dir = artifact_file.parent
-                    captured_at = (
-                        artifact_data.get("fetched_at")
-                        or artifact_data.get("captured_at")
-                        or artifact_data.get("timestamp")
-                    )
-
-                    # Read content snippet
-                    content_file = artifact_dir / "content.html"
-                    snippet = ""
-                    if content_file.exists():
-                        content_text = content_file.read_text(encoding="utf-8")
-                        snippet = content_text[:500] + ("..." if len(content_text) > 500 else "")
-
-                    found_artifacts.append({
-                        "artifact_id": artifact_dir.name,
-                        "doc_id": artifact_data.get("doc_id"),
-                        "url": artifact_data.get("url"),
-                        "final_url": artifact_data.get("final_url"),
-                        "http_status": artifact_data.get("http_status") or artifact_data.get("status_code"),
-                        "auth_profile": artifact_data.get("auth_profile"),
-                        "title": artifact_data.get("title"),
-                        "captured_at": captured_at,
-                        "content_hash": artifact_data.get("content_hash"),
-                        "snippet": snippet,
-                    })
-            except Exception:
-                continue
+        # Only open the artifact.json files the URL index points at
+        entries = await run_in_threadpool(lookup_by_url, url)
+        found_artifacts = await _scan_artifacts(_check_artifact, [entry["path"] for entry in entries], url)
 
         if found_artifacts:
             # Sort by captured_at, most recent first
@@ -1192,7 +1854,7 @@ async def check_url(payload: Dict[str, Any]) -> Dict[str, Any]:
     latest_validation = _latest_summary("validate_crawl_")
     if latest_validation and latest_validation.exists():
         try:
-            validation_data = json.loads(latest_validation.read_text(encoding="utf-8"))
+            validation_data = orjson.loads(await run_in_threadpool(latest_validation.read_bytes))
             findings = validation_data.get("findings", [])
             url_findings = [f for f in findings if f.get("url") == url]
 
@@ -1210,51 +1872,19 @@ async def check_url(payload: Dict[str, Any]) -> Dict[str, Any]:
 
     # Check ingest status
     try:
-        # Ensure schema is initialized before querying
-        ensure_metadata_db_initialized()
-
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-
-        # Find document by URL
-        cursor.execute(
-            "SELECT doc_id, url, ingested_at, chunk_count, content_hash FROM documents WHERE url = ?",
-            (url,),
-        )
-        doc_row = cursor.fetchone()
-
-        if doc_row:
-            doc_id, doc_url, ingested_at, chunk_count, content_hash = doc_row
-            artifact_doc_id = artifact_doc_id or doc_id
-
-            # Count chunks for this document
-            cursor.execute("SELECT COUNT(*) FROM chunks WHERE doc_id = ?", (doc_id,))
-            chunk_count_db = cursor.fetchone()[0]
-
-            result["ingest"] = {
-                "found": True,
-                "doc_id": doc_id,
-                "url": doc_url,
-                "chunk_count": chunk_count_db,
-                "chunk_count_recorded": chunk_count,
-                "ingested_at": ingested_at,
-                "content_hash": content_hash,
-            }
-        else:
-            result["ingest"] = {"found": False}
-
-        conn.close()
+        result["ingest"] = await run_in_threadpool(_ingest_record_for_url, url)
+        artifact_doc_id = artifact_doc_id or result["ingest"].get("doc_id")
     except Exception as e:
         result["ingest"] = {"found": False, "error": str(e)}
 
     # Check Qdrant
     try:
-        system_config = load_config("system")
+        system_config = _system_config()
         qdrant_config = system_config.get("qdrant", {})
         qdrant_host = qdrant_config.get("host")
         collection_name = qdrant_config.get("collection", "ragai_chunks")
 
-        client = QdrantClient(url=qdrant_host)
+        client = _async_qdrant_client(qdrant_host)
 
         filters = []
         if artifact_doc_id:
@@ -1271,34 +1901,34 @@ async def check_url(payload: Dict[str, Any]) -> Dict[str, Any]:
             )
         )
         scroll_filter = rest.Filter(should=filters)
-        points_count = 0
-        try:
-            count_result = client.count(
+        count_result, search_result = await asyncio.gather(
+            client.count(
                 collection_name=collection_name,
                 count_filter=scroll_filter,
                 exact=True,
-            )
-            points_count = count_result.count or 0
-        except Exception:
-            search_result = client.scroll(
+            ),
+            # Only the example chunks are needed from the scroll
+            client.scroll(
                 collection_name=collection_name,
                 scroll_filter=scroll_filter,
-                limit=10,
-            )
-            points = search_result[0] if search_result else []
-            points_count = len(points)
-        search_result = client.scroll(
-            collection_name=collection_name,
-            scroll_filter=scroll_filter,
-            limit=10,
+                limit=CHECK_URL_EXAMPLE_CHUNKS,
+                with_payload=["text", "doc_id"],
+                with_vectors=False,
+            ),
+            return_exceptions=True,
         )
-
+        if isinstance(search_result, BaseException):
+            raise search_result
         points = search_result[0] if search_result else []
+        if isinstance(count_result, BaseException):
+            points_count = len(points)
+        else:
+            points_count = count_result.count or 0
 
         if points:
             # Extract chunk snippets
             chunks = []
-            for point in points[:3]:  # Limit to 3 examples
+            for point in points:
                 payload_data = point.payload or {}
                 chunks.append({
                     "chunk_id": point.id,
@@ -1319,107 +1949,132 @@ async def check_url(payload: Dict[str, Any]) -> Dict[str, Any]:
     return result
 
 
+def _bucket_points_by_url(points: List[Any], buckets: Dict[str, Dict[str, Any]]) -> None:
+    for point in points:
+        payload_data = point.payload or {}
+        bucket = buckets.get(payload_data.get("url"))
+        if bucket is None:
+            continue
+        bucket["points_count"] += 1
+        if len(bucket["example_chunks"]) < CHECK_URL_EXAMPLE_CHUNKS:
+            bucket["example_chunks"].append({
+                "chunk_id": point.id,
+                "text": (payload_data.get("text") or "")[:200],
+                "doc_id": payload_data.get("doc_id"),
+            })
+
+
+@router.post("/data/check_urls")
+async def check_urls(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Count Qdrant points for many URLs with one filtered scroll instead of a call per URL."""
+    urls = payload.get("urls")
+    if not isinstance(urls, list) or not urls or not all(isinstance(url, str) and url for url in urls):
+        raise HTTPException(status_code=400, detail="'urls' must be a non-empty list of URLs")
+    if len(urls) > BULK_URLS_MAX:
+        raise HTTPException(status_code=400, detail=f"At most {BULK_URLS_MAX} URLs per request")
+
+    qdrant_config = _system_config().get("qdrant", {})
+    client = _async_qdrant_client(qdrant_config.get("host"))
+    collection_name = qdrant_config.get("collection", "ragai_chunks")
+    buckets = {url: {"points_count": 0, "example_chunks": []} for url in urls}
+    scroll_filter = rest.Filter(
+        should=[rest.FieldCondition(key="url", match=rest.MatchValue(value=url)) for url in buckets]
+    )
+    try:
+        offset = None
+        while True:
+            points, offset = await client.scroll(
+                collection_name=collection_name,
+                scroll_filter=scroll_filter,
+                limit=QDRANT_SCROLL_PAGE_SIZE,
+                offset=offset,
+                with_payload=["url", "doc_id", "text"],
+                with_vectors=False,
+            )
+            _bucket_points_by_url(points, buckets)
+            if offset is None:
+                break
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Error connecting to Qdrant: {exc}") from exc
+
+    return {
+        "results": {
+            url: {"found": bucket["points_count"] > 0, **bucket} for url, bucket in buckets.items()
+        }
+    }
+
+
+async def _find_repair_artifacts(urls: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """Most recently captured artifact per URL (None where there is none), from one index lookup."""
+    if not Path("/app/data/artifacts").exists():
+        return [None] * len(urls)
+    entries = await run_in_threadpool(lookup_by_urls, urls)
+    targets = [(url, entry["path"]) for url in urls for entry in entries.get(url, [])]
+    semaphore = asyncio.Semaphore(ARTIFACT_SCAN_CONCURRENCY)
+    candidates = await asyncio.gather(
+        *(_limited(semaphore, run_in_threadpool(_repair_candidate, path, url)) for url, path in targets)
+    )
+    best: Dict[str, Dict[str, Any]] = {}
+    for (url, _), candidate in zip(targets, candidates):
+        if candidate is not None and (url not in best or candidate["captured_ts"] > best[url]["captured_ts"]):
+            best[url] = candidate
+    return [best.get(url) for url in urls]
+
+
+async def _delete_doc_vectors(doc_ids: List[str]) -> bool:
+    try:
+        qdrant_config = _system_config().get("qdrant", {})
+        client = _async_qdrant_client(qdrant_config.get("host"))
+        await client.delete(
+            collection_name=qdrant_config.get("collection", "ragai_chunks"),
+            points_selector=rest.Filter(
+                must=[rest.FieldCondition(key="doc_id", match=rest.MatchAny(any=doc_ids))]
+            ),
+        )
+        return True
+    except Exception:
+        return False
+
+
+def _repair_job(url: str, doc_id: str, artifact_match: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "job_id": f"job_{int(datetime.utcnow().timestamp())}_{uuid.uuid4().hex[:6]}",
+        "type": "ingest",
+        "artifact_paths": [str(artifact_match["artifact_file"])],
+        "chunks_estimate": 0,
+        "meta": {"repair_url": url, "doc_id": doc_id},
+    }
+
+
 @router.post("/data/repair_url")
 async def repair_url(payload: Dict[str, Any]) -> Dict[str, Any]:
     """Repair ingest state for a single URL by clearing metadata/vectors and re-queueing ingest."""
-    import sqlite3
-    from app.utils.config import load_config
     from app.utils.redis_queue import push_job
 
     url = payload.get("url")
     if not url:
         raise HTTPException(status_code=400, detail="Missing 'url' field")
 
-    artifacts_path = Path("/app/data/artifacts")
-    artifact_match = None
-    artifact_candidates = []
-    if artifacts_path.exists():
-        for artifact_file in artifacts_path.glob("*/artifact.json"):
-            try:
-                artifact_data = json.loads(artifact_file.read_text(encoding="utf-8"))
-            except Exception:
-                continue
-            artifact_url = artifact_data.get("url")
-            if artifact_url == url or artifact_data.get("final_url") == url:
-                captured_at = (
-                    artifact_data.get("fetched_at")
-                    or artifact_data.get("captured_at")
-                    or artifact_data.get("timestamp")
-                )
-                captured_ts = None
-                if isinstance(captured_at, (int, float)):
-                    captured_ts = float(captured_at)
-                elif isinstance(captured_at, str):
-                    try:
-                        captured_ts = datetime.fromisoformat(captured_at.replace("Z", "+00:00")).timestamp()
-                    except Exception:
-                        captured_ts = None
-                if captured_ts is None:
-                    captured_ts = artifact_file.stat().st_mtime
-                artifact_candidates.append({
-                    "artifact_file": artifact_file,
-                    "artifact_dir": artifact_file.parent,
-                    "doc_id": artifact_data.get("doc_id"),
-                    "captured_at": captured_at,
-                    "captured_ts": captured_ts,
-                })
-
-    if artifact_candidates:
-        artifact_match = max(artifact_candidates, key=lambda a: a["captured_ts"])
-
+    (artifact_match,) = await _find_repair_artifacts([url])
     if not artifact_match:
         raise HTTPException(status_code=404, detail="No artifact found for URL")
 
     doc_id = artifact_match["doc_id"]
     cleared = {"documents": 0, "chunks": 0, "qdrant": False}
-    ensure_metadata_db_initialized()
 
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        if not doc_id:
-            cursor.execute("SELECT doc_id FROM documents WHERE url = ?", (url,))
-            row = cursor.fetchone()
-            if row:
-                doc_id = row[0]
-        if doc_id:
-            cursor.execute("SELECT COUNT(*) FROM chunks WHERE doc_id = ?", (doc_id,))
-            cleared["chunks"] = cursor.fetchone()[0]
-            cursor.execute("DELETE FROM chunks WHERE doc_id = ?", (doc_id,))
-            cursor.execute("DELETE FROM documents WHERE doc_id = ?", (doc_id,))
-            cleared["documents"] = cursor.rowcount
-            conn.commit()
-        conn.close()
+        [(doc_id, cleared["documents"], cleared["chunks"])] = await run_in_threadpool(
+            _clear_ingest_records, [(url, doc_id)]
+        )
     except Exception:
         pass
 
-    try:
-        system_config = load_config("system")
-        qdrant_config = system_config.get("qdrant", {})
-        qdrant_host = qdrant_config.get("host")
-        collection_name = qdrant_config.get("collection", "ragai_chunks")
-        client = QdrantClient(url=qdrant_host)
-        client.delete(
-            collection_name=collection_name,
-            points_selector=rest.Filter(
-                must=[rest.FieldCondition(key="doc_id", match=rest.MatchValue(value=doc_id))]
-            ),
-        )
-        cleared["qdrant"] = True
-    except Exception:
-        cleared["qdrant"] = False
+    cleared["qdrant"] = await _delete_doc_vectors([doc_id])
 
     if not doc_id:
         raise HTTPException(status_code=404, detail="No doc_id found for URL")
 
-    job_id = f"job_{int(datetime.utcnow().timestamp())}_{uuid.uuid4().hex[:6]}"
-    job = {
-        "job_id": job_id,
-        "type": "ingest",
-        "artifact_paths": [str(artifact_match["artifact_file"])],
-        "chunks_estimate": 0,
-        "meta": {"repair_url": url, "doc_id": doc_id},
-    }
+    job = _repair_job(url, doc_id, artifact_match)
     await push_job(job)
 
     return {
@@ -1428,15 +2083,70 @@ async def repair_url(payload: Dict[str, Any]) -> Dict[str, Any]:
         "doc_id": doc_id,
         "artifact_id": artifact_match["artifact_dir"].name,
         "cleared": cleared,
-        "job_id": job_id,
+        "job_id": job["job_id"],
+    }
+
+
+@router.post("/data/repair_urls")
+async def repair_urls(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Repair many URLs with one metadata transaction, one vector delete and one queue round-trip."""
+    from app.utils.redis_queue import push_jobs
+
+    urls = payload.get("urls")
+    if not isinstance(urls, list) or not urls or not all(isinstance(url, str) and url for url in urls):
+        raise HTTPException(status_code=400, detail="'urls' must be a non-empty list of URLs")
+    if len(urls) > BULK_URLS_MAX:
+        raise HTTPException(status_code=400, detail=f"At most {BULK_URLS_MAX} URLs per request")
+    urls = list(dict.fromkeys(urls))
+
+    matches = await _find_repair_artifacts(urls)
+    results: Dict[str, Dict[str, Any]] = {}
+    found = []
+    for url, artifact_match in zip(urls, matches):
+        if artifact_match:
+            found.append((url, artifact_match))
+        else:
+            results[url] = {"status": "error", "url": url, "detail": "No artifact found for URL"}
+
+    cleared_rows: List[Tuple[Optional[str], int, int]] = [(match["doc_id"], 0, 0) for _, match in found]
+    if found:
+        try:
+            cleared_rows = await run_in_threadpool(
+                _clear_ingest_records, [(url, match["doc_id"]) for url, match in found]
+            )
+        except Exception:
+            pass
+    doc_ids = sorted({row[0] for row in cleared_rows if row[0]})
+    qdrant_cleared = await _delete_doc_vectors(doc_ids) if doc_ids else False
+
+    jobs = []
+    for (url, artifact_match), (doc_id, documents, chunks) in zip(found, cleared_rows):
+        if not doc_id:
+            results[url] = {"status": "error", "url": url, "detail": "No doc_id found for URL"}
+            continue
+        job = _repair_job(url, doc_id, artifact_match)
+        jobs.append(job)
+        results[url] = {
+            "status": "queued",
+            "url": url,
+            "doc_id": doc_id,
+            "artifact_id": artifact_match["artifact_dir"].name,
+            "cleared": {"documents": documents, "chunks": chunks, "qdrant": qdrant_cleared},
+            "job_id": job["job_id"],
+        }
+    if jobs:
+        await push_jobs(jobs)
+
+    return {
+        "status": "ok",
+        "queued": len(jobs),
+        "results": [results[url] for url in urls],
     }
 
 
 @router.post("/data/search")
 async def search_data(payload: Dict[str, Any]) -> Dict[str, Any]:
     """Search for keywords across artifacts and Qdrant."""
-    import sqlite3
-    from app.utils.config import load_config
 
     query = payload.get("query")
     limit = payload.get("limit", 10)
@@ -1455,45 +2165,16 @@ async def search_data(payload: Dict[str, Any]) -> Dict[str, Any]:
     if scope in ("all", "artifacts"):
         artifacts_path = Path("/app/data/artifacts")
         if artifacts_path.exists():
-            matches = []
-            query_lower = query.lower()
-
-            for artifact_file in artifacts_path.glob("*/artifact.json"):
-                try:
-                    artifact_dir = artifact_file.parent
-                    artifact_data = json.loads(artifact_file.read_text(encoding="utf-8"))
-
-                    # Check content
-                    content_file = artifact_dir / "content.html"
-                    if content_file.exists():
-                        content_text = content_file.read_text(encoding="utf-8")
-
-                        if query_lower in content_text.lower():
-                            # Extract snippet around first match
-                            match_index = content_text.lower().find(query_lower)
-                            start = max(0, match_index - 100)
-                            end = min(len(content_text), match_index + 100)
-                            snippet = content_text[start:end]
-
-                            matches.append({
-                                "artifact_id": artifact_dir.name,
-                                "url": artifact_data.get("url"),
-                                "title": artifact_data.get("title"),
-                                "snippet": snippet,
-                                "match_index": match_index,
-                            })
-
-                            if len(matches) >= limit:
-                                break
-                except Exception:
-                    continue
-
-            result["artifacts"] = matches
+            prefilter = _content_prefilter(query)
+            artifact_files = await run_in_threadpool(
+                lambda: [Path(path) for _, path in _iter_artifact_files(artifacts_path)]
+            )
+            result["artifacts"] = await _first_matches(_search_artifact, artifact_files, limit, query, prefilter)
 
     # Search Qdrant (semantic search)
     if scope in ("all", "qdrant"):
         try:
-            system_config = load_config("system")
+            system_config = _system_config()
             qdrant_config = system_config.get("qdrant", {})
             ollama_config = system_config.get("ollama", {})
             qdrant_host = qdrant_config.get("host")
@@ -1503,11 +2184,11 @@ async def search_data(payload: Dict[str, Any]) -> Dict[str, Any]:
 
             if ollama_host and embedding_model:
                 # Generate embedding for query
-                query_vector = embed_text(ollama_host, embedding_model, query)
+                query_vector = await run_in_threadpool(embed_text, ollama_host, embedding_model, query)
 
                 # Search Qdrant
-                client = QdrantClient(url=qdrant_host)
-                search_results = client.search(
+                client = _async_qdrant_client(qdrant_host)
+                search_results = await client.search(
                     collection_name=collection_name,
                     query_vector=query_vector,
                     limit=limit,
@@ -1535,7 +2216,7 @@ async def search_data(payload: Dict[str, Any]) -> Dict[str, Any]:
 
 @router.post("/clear_vectors")
 async def clear_vectors() -> Dict[str, Any]:
-    system_config = yaml.safe_load((CONFIG_DIR / "system.yml").read_text(encoding="utf-8")) or {}
+    system_config = _system_config()
     qdrant_config = system_config.get("qdrant", {})
     ollama_config = system_config.get("ollama", {})
     collection = qdrant_config.get("collection")
@@ -1544,9 +2225,9 @@ async def clear_vectors() -> Dict[str, Any]:
     ollama_host = ollama_config.get("host")
     if not collection or not qdrant_host:
         raise HTTPException(status_code=400, detail="Missing qdrant configuration")
-    client = QdrantClient(url=qdrant_host)
+    client = _async_qdrant_client(qdrant_host)
     try:
-        collections = client.get_collections().collections
+        collections = (await client.get_collections()).collections
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error connecting to Qdrant: {e}")
 
@@ -1554,9 +2235,10 @@ async def clear_vectors() -> Dict[str, Any]:
     count_before = 0
 
     vector_size = None
-    if any(col.name == collection for col in collections):
+    exists = any(col.name == collection for col in collections)
+    if exists:
         try:
-            info = client.get_collection(collection)
+            info = await client.get_collection(collection)
             vector_size = info.config.params.vectors.size
             count_before = info.points_count
         except AttributeError:
@@ -1568,29 +2250,37 @@ async def clear_vectors() -> Dict[str, Any]:
                 print(f"Warning: Qdrant config validation error (server schema mismatch): {e}")
             else:
                 raise HTTPException(status_code=500, detail=f"Error getting collection info: {e}")
-        client.delete_collection(collection_name=collection)
-        deleted_items.append(f"{count_before} vectors from collection '{collection}'")
+    if vector_size is None and (not embedding_model or not ollama_host):
+        raise HTTPException(status_code=400, detail="Missing embedding configuration")
+
+    # Overlap dropping the old collection with probing the embedding dimension.
+    pending = []
+    if exists:
+        pending.append(client.delete_collection(collection_name=collection))
+    if vector_size is None:
+        pending.append(_embedding_dimension(ollama_host, embedding_model))
+    results = await asyncio.gather(*pending)
     if vector_size is None:
-        if not embedding_model or not ollama_host:
-            raise HTTPException(status_code=400, detail="Missing embedding configuration")
-        vector_size = len(embed_text(ollama_host, embedding_model, "dimension probe"))
-    client.create_collection(
+        vector_size = results[-1]
+    if exists:
+        deleted_items.append(f"{count_before} vectors from collection '{collection}'")
+
+    await client.create_collection(
         collection_name=collection,
         vectors_config=rest.VectorParams(size=vector_size, distance=rest.Distance.COSINE),
     )
-    client.create_payload_index(collection_name=collection, field_name="doc_id", field_schema="keyword")
+    await client.create_payload_index(collection_name=collection, field_name="doc_id", field_schema="keyword")
 
     # Get count after recreation (should be 0)
     count_after = 0
     try:
-        info = client.get_collection(collection)
+        info = await client.get_collection(collection)
         count_after = info.points_count
     except Exception:
         pass  # If we can't get the count, assume 0
 
     # Also delete ingest metadata
-    if DB_PATH.exists():
-        DB_PATH.unlink()
+    if await run_in_threadpool(_remove_metadata_db):
         deleted_items.append("ingest metadata.db")
 
     return {
@@ -10,10 +10,10 @@ from qdrant_client import QdrantClient
 
 from app.agents.intent import analyze_intent
 from app.agents.research import summarize_research, aggregate_hits_by_doc
-from app.agents.synthesis import synthesize_answer
+from app.agents.synthesis import synthesize_and_validate, synthesize_answer
 from app.agents.validation import validate_answer
 from app.models.schemas import ResearchOutput, TitleOutput
-from app.utils.config import load_system_config
+from app.utils.config import load_agents_config, load_system_config
 from app.utils.db import (
     add_message,
     create_conversation,
@@ -222,8 +222,9 @@ async def _stream_chat(conversation_id: str, user_text: str) -> AsyncGenerator[s
             collection = config["qdrant"]["collection"]
             collections = qdrant.get_collections().collections
             if any(col.name == collection for col in collections):
-                for query in intent.search_queries:
-                    vector = await embed_text(query)
+                # Query embeddings are independent; overlap their round-trips to Ollama
+                vectors = await asyncio.gather(*(embed_text(query) for query in intent.search_queries))
+                for vector in vectors:
                     search_result = qdrant.search(collection, query_vector=vector, limit=5)
                     for hit in search_result:
                         payload = hit.payload or {}
@@ -264,16 +265,23 @@ async def _stream_chat(conversation_id: str, user_text: str) -> AsyncGenerator[s
         # Keep original dedupe for backwards compatibility, but also include aggregated docs
         citations = _dedupe_hits(hits)
 
-        yield _format_sse({"type": "status", "stage": "synthesis", "message": "Drafting answer"})
-        synthesis = await synthesize_answer(intent.model_dump(), research_output.model_dump(), aggregated_docs)
-
-        yield _format_sse({"type": "status", "stage": "validation", "message": "Verifying response"})
-        validation = await validate_answer(
-            user_text,
-            synthesis.draft_answer,
-            research_output.model_dump(),
-            intent.context
-        )
+        pipeline_config = load_agents_config().get("pipeline", {}) or {}
+        if pipeline_config.get("fuse_synthesis_validation"):
+            yield _format_sse({"type": "status", "stage": "synthesis", "message": "Drafting and verifying answer"})
+            synthesis, validation = await synthesize_and_validate(
+                user_text, intent.model_dump(), research_output.model_dump(), aggregated_docs
+            )
+        else:
+            yield _format_sse({"type": "status", "stage": "synthesis", "message": "Drafting answer"})
+            synthesis = await synthesize_answer(intent.model_dump(), research_output.model_dump(), aggregated_docs)
+
+            yield _format_sse({"type": "status", "stage": "validation", "message": "Verifying response"})
+            validation = await validate_answer(
+                user_text,
+                synthesis.draft_answer,
+                research_output.model_dump(),
+                intent.context
+            )
 
         if validation.needs_clarification and validation.clarifying_question:
             yield _format_sse({"type": "token", "text": validation.clarifying_question})
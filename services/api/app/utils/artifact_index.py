@@ -0,0 +1,267 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+
+ARTIFACT_DIR = Path("/app/data/artifacts")
+INDEX_PATH = ARTIFACT_DIR / "url_index.sqlite"
+
+# Bumped when the stored row format changes; older indexes are rebuilt from the files
+_SCHEMA_VERSION = 1
+
+_lock = threading.Lock()
+# (directory/index signature, (count, newest mtime_ns)) from the last refresh
+_stats_cache: Optional[Tuple[Tuple[int, int], Tuple[int, Optional[int]]]] = None
+# Directory/index signature as of the last refresh; lookups skip the rescan while it holds
+_refreshed_signature: Optional[Tuple[int, int]] = None
+
+
+def _connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(INDEX_PATH, timeout=10)
+    conn.row_factory = sqlite3.Row
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS artifacts (
+            artifact_id TEXT PRIMARY KEY,
+            url TEXT,
+            final_url TEXT,
+            doc_id TEXT,
+            captured_at TEXT,
+            mtime_ns INTEGER
+        );
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_artifacts_url ON artifacts(url);")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_artifacts_final_url ON artifacts(final_url);")
+    if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+        with conn:
+            conn.execute("DELETE FROM artifacts")
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+    return conn
+
+
+def _scalar(value: Any) -> Optional[Any]:
+    return value if isinstance(value, (str, int, float)) else None
+
+
+def _captured_at(value: Any) -> Optional[str]:
+    """Normalise an epoch or ISO timestamp to fixed-width UTC text, so rows sort by time.
+
+    SQLite orders every number before any text, so mixed epochs and ISO strings
+    can't share the column. Unparseable strings are kept as they are.
+    """
+    if isinstance(value, bool):
+        return None
+    try:
+        if isinstance(value, (int, float)):
+            moment = datetime.fromtimestamp(value, timezone.utc)
+        elif isinstance(value, str):
+            moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            if moment.tzinfo is None:
+                moment = moment.replace(tzinfo=timezone.utc)
+        else:
+            return None
+    except (ValueError, OverflowError, OSError):
+        return value if isinstance(value, str) else None
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _row_from_artifact(artifact_id: str, data: Dict[str, Any], mtime_ns: int) -> Tuple[Any, ...]:
+    captured_at = data.get("fetched_at") or data.get("captured_at") or data.get("timestamp")
+    return (
+        artifact_id,
+        _scalar(data.get("url")),
+        _scalar(data.get("final_url")),
+        _scalar(data.get("doc_id")),
+        _captured_at(captured_at),
+        mtime_ns,
+    )
+
+
+_UPSERT_SQL = """
+    INSERT INTO artifacts (artifact_id, url, final_url, doc_id, captured_at, mtime_ns)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(artifact_id) DO UPDATE SET
+        url = excluded.url,
+        final_url = excluded.final_url,
+        doc_id = excluded.doc_id,
+        captured_at = excluded.captured_at,
+        mtime_ns = excluded.mtime_ns
+"""
+
+
+def _refresh(conn: sqlite3.Connection) -> None:
+    known = {row["artifact_id"]: row["mtime_ns"] for row in conn.execute("SELECT artifact_id, mtime_ns FROM artifacts")}
+    seen = set()
+    upserts = []
+    with os.scandir(ARTIFACT_DIR) as entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            artifact_file = os.path.join(entry.path, "artifact.json")
+            try:
+                mtime_ns = os.stat(artifact_file).st_mtime_ns
+            except FileNotFoundError:
+                continue
+            if known.get(entry.name) == mtime_ns:
+                seen.add(entry.name)
+                continue
+            try:
+                with open(artifact_file, "rb") as handle:
+                    data = orjson.loads(handle.read())
+            except (OSError, orjson.JSONDecodeError):
+                continue
+            if not isinstance(data, dict):
+                continue
+            seen.add(entry.name)
+            upserts.append(_row_from_artifact(entry.name, data, mtime_ns))
+
+    stale = [(artifact_id,) for artifact_id in known.keys() - seen]
+    if not upserts and not stale:
+        return
+    with conn:
+        conn.executemany(_UPSERT_SQL, upserts)
+        conn.executemany("DELETE FROM artifacts WHERE artifact_id = ?", stale)
+
+
+def refresh_index() -> None:
+    """Bring the index in line with the artifacts directory.
+
+    Every artifact.json is stat'ed, but only files whose mtime differs from
+    the indexed row are opened and parsed.
+    """
+    global _refreshed_signature
+    if not ARTIFACT_DIR.is_dir():
+        return
+    with _lock:
+        conn = _connect()
+        try:
+            _refresh(conn)
+        finally:
+            conn.close()
+        _refreshed_signature = _signature()
+
+
+def _refresh_if_changed(conn: sqlite3.Connection) -> None:
+    """Refresh only if the artifacts directory or the index moved since the last refresh.
+
+    Artifacts being added or removed change the directory's mtime; in-place
+    rewrites by the crawl worker reach the index through record_artifact().
+    Callers must hold `_lock`.
+    """
+    global _refreshed_signature
+    if _refreshed_signature is not None and _refreshed_signature == _signature():
+        return
+    _refresh(conn)
+    # Taken after the refresh so its own index writes don't count as a change
+    _refreshed_signature = _signature()
+
+
+def record_artifact(artifact_id: str, data: Dict[str, Any]) -> None:
+    """Index an artifact.json the caller has just written.
+
+    Called by the crawl worker so lookups find new artifacts without
+    re-parsing them; the row's mtime matches the file, so the next
+    refresh leaves it alone.
+    """
+    global _refreshed_signature
+    artifact_file = ARTIFACT_DIR / artifact_id / "artifact.json"
+    mtime_ns = os.stat(artifact_file).st_mtime_ns
+    with _lock:
+        current = _refreshed_signature is not None and _refreshed_signature == _signature()
+        conn = _connect()
+        try:
+            with conn:
+                conn.execute(_UPSERT_SQL, _row_from_artifact(artifact_id, data, mtime_ns))
+        finally:
+            conn.close()
+        if current:
+            # The index was in sync before this row went in, and still is
+            _refreshed_signature = _signature()
+
+
+def _signature() -> Tuple[int, int]:
+    try:
+        index_mtime = os.stat(INDEX_PATH).st_mtime_ns
+    except FileNotFoundError:
+        index_mtime = 0
+    return os.stat(ARTIFACT_DIR).st_mtime_ns, index_mtime
+
+
+def artifact_stats() -> Tuple[int, Optional[int]]:
+    """Return (artifact count, newest artifact.json mtime_ns or None).
+
+    Artifact directories being added or removed change the directory's
+    mtime, and the crawl worker's record_artifact() writes change the
+    index file's; while neither has moved, the previous answer is reused
+    without touching the artifacts.
+    """
+    global _stats_cache
+    if not ARTIFACT_DIR.is_dir():
+        return 0, None
+    with _lock:
+        if _stats_cache is not None and _stats_cache[0] == _signature():
+            return _stats_cache[1]
+        conn = _connect()
+        try:
+            _refresh_if_changed(conn)
+            count, newest = conn.execute("SELECT COUNT(*), MAX(mtime_ns) FROM artifacts").fetchone()
+        finally:
+            conn.close()
+        # Taken after the refresh so its own index writes don't invalidate it
+        _stats_cache = (_signature(), (count, newest))
+    return count, newest
+
+
+# Parameters per IN (...) list; both url and final_url take one batch each
+_LOOKUP_BATCH_SIZE = 400
+
+
+def lookup_by_urls(urls: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """Map each of `urls` to its index rows (url or final_url equal to it), newest capture first.
+
+    The index is refreshed once for the whole batch, and only if the artifacts
+    directory or the index changed since the last refresh. Each row carries ``artifact_id``, ``url``,
+    ``final_url``, ``doc_id``, ``captured_at`` and ``path`` (the artifact.json location); URLs
+    without a match are absent from the result.
+    """
+    if not ARTIFACT_DIR.is_dir():
+        return {}
+    wanted = list(dict.fromkeys(urls))
+    with _lock:
+        conn = _connect()
+        try:
+            _refresh_if_changed(conn)
+            rows = []
+            for start in range(0, len(wanted), _LOOKUP_BATCH_SIZE):
+                batch = wanted[start : start + _LOOKUP_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                rows.extend(
+                    conn.execute(
+                        f"""
+                        SELECT artifact_id, url, final_url, doc_id, captured_at
+                        FROM artifacts
+                        WHERE url IN ({placeholders}) OR final_url IN ({placeholders})
+                        ORDER BY captured_at DESC
+                        """,
+                        batch + batch,
+                    ).fetchall()
+                )
+        finally:
+            conn.close()
+    found: Dict[str, List[Dict[str, Any]]] = {}
+    wanted_set = set(wanted)
+    for row in rows:
+        entry = {**dict(row), "path": ARTIFACT_DIR / row["artifact_id"] / "artifact.json"}
+        for key in {row["url"], row["final_url"]} & wanted_set:
+            found.setdefault(key, []).append(entry)
+    return found
+
+
+def lookup_by_url(url: str) -> List[Dict[str, Any]]:
+    """Return index rows whose url or final_url equals `url`, newest capture first (see lookup_by_urls)."""
+    return lookup_by_urls([url]).get(url, [])
@@ -1,23 +1,142 @@
-import json
-from datetime import datetime
+import copy
+import os
+import threading
+from collections import deque
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional, Tuple
 from urllib.parse import urlparse
 
+import orjson
+
 AUTH_HINTS_PATH = Path("/app/data/logs/auth_hints.json")
+AUTH_HINTS_LOG_PATH = AUTH_HINTS_PATH.with_suffix(".jsonl")
 MAX_RECENT_HINTS = 50
+COMPACT_EVERY_EVENTS = 100
+AUTH_HINTS_PATH.parent.mkdir(parents=True, exist_ok=True)
+
+_lock = threading.Lock()
+_state: Optional[Dict] = None
+_pending_events = 0
+_state_signature: Optional[Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]] = None
+
 
+def _empty_hints() -> Dict:
+    return {"by_domain": {}, "recent": deque(maxlen=MAX_RECENT_HINTS)}
 
-def _load_auth_hints() -> Dict:
+
+def _load_snapshot() -> Dict:
     if not AUTH_HINTS_PATH.exists():
-        return {"by_domain": {}, "recent": []}
+        return _empty_hints()
+    try:
+        data = orjson.loads(AUTH_HINTS_PATH.read_bytes()) or _empty_hints()
+    except orjson.JSONDecodeError:
+        return _empty_hints()
+    # Newest first; appendleft on a bounded deque drops the oldest entry for free.
+    data["recent"] = deque(data.get("recent") or [], maxlen=MAX_RECENT_HINTS)
+    return data
+
+
+def _as_serializable(data: Dict) -> Dict:
+    return {**data, "recent": list(data["recent"])}
+
+
+def _apply_event(data: Dict, event: Dict) -> None:
+    now = event.get("last_seen", "")
+    by_domain = data.setdefault("by_domain", {})
+    entry = by_domain.get(event["domain"], {"count": 0})
+    entry["count"] = entry.get("count", 0) + 1
+    entry["last_seen"] = now
+    entry["redirect_host"] = event.get("redirect_host", "")
+    entry["matched_auth_pattern"] = event.get("matched_auth_pattern", "")
+    by_domain[event["domain"]] = entry
+    data["recent"].appendleft(
+        {
+            "original_url": event.get("original_url", ""),
+            "redirect_location": event.get("redirect_location", ""),
+            "redirect_host": event.get("redirect_host", ""),
+            "matched_auth_pattern": event.get("matched_auth_pattern", ""),
+            "last_seen": now,
+        }
+    )
+    data["updated_at"] = now
+
+
+def _replay_log(data: Dict) -> int:
+    """Fold events from the append-only log into `data`; return the number applied."""
+    if not AUTH_HINTS_LOG_PATH.exists():
+        return 0
+    applied = 0
+    with AUTH_HINTS_LOG_PATH.open("rb") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            try:
+                event = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            if isinstance(event, dict) and event.get("domain"):
+                _apply_event(data, event)
+                applied += 1
+    return applied
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
     try:
-        return json.loads(AUTH_HINTS_PATH.read_text(encoding="utf-8")) or {"by_domain": {}, "recent": []}
-    except json.JSONDecodeError:
-        return {"by_domain": {}, "recent": []}
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _disk_signature() -> Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
+    return _file_signature(AUTH_HINTS_PATH), _file_signature(AUTH_HINTS_LOG_PATH)
+
+
+def _get_state() -> Dict:
+    """Return the in-process aggregated view. Caller must hold `_lock`.
+
+    The crawl worker records hints from another process, so the view is
+    rebuilt whenever the snapshot or log changed since this process last
+    read or wrote them.
+    """
+    global _state, _pending_events, _state_signature
+    signature = _disk_signature()
+    if _state is None or signature != _state_signature:
+        _state = _load_snapshot()
+        _pending_events = _replay_log(_state)
+        _state_signature = signature
+    return _state
+
+
+def _compact_locked() -> None:
+    global _pending_events, _state_signature
+    state = _get_state()
+    tmp_path = AUTH_HINTS_PATH.with_suffix(".json.tmp")
+    tmp_path.write_bytes(orjson.dumps(_as_serializable(state)))
+    os.replace(tmp_path, AUTH_HINTS_PATH)
+    if AUTH_HINTS_LOG_PATH.exists():
+        AUTH_HINTS_LOG_PATH.unlink()
+    _pending_events = 0
+    _state_signature = _disk_signature()
+
+
+def load_auth_hints() -> Dict:
+    """Return a copy of the aggregated auth hints (snapshot plus un-compacted events)."""
+    with _lock:
+        return copy.deepcopy(_as_serializable(_get_state()))
+
+
+def compact_auth_hints() -> None:
+    """Rewrite the snapshot from the aggregated view and truncate the event log."""
+    with _lock:
+        _get_state()
+        if _pending_events:
+            _compact_locked()
 
 
 def record_auth_hint(auth_info: Dict[str, str]) -> None:
+    global _pending_events, _state_signature
     if not auth_info:
         return
     original_url = auth_info.get("original_url")
@@ -27,28 +146,20 @@ def record_auth_hint(auth_info: Dict[str, str]) -> None:
     domain = parsed.hostname or ""
     if not domain:
         return
-    data = _load_auth_hints()
-    by_domain = data.get("by_domain", {})
-    now = datetime.utcnow().isoformat() + "Z"
-    entry = by_domain.get(domain, {"count": 0})
-    entry["count"] = entry.get("count", 0) + 1
-    entry["last_seen"] = now
-    entry["redirect_host"] = auth_info.get("redirect_host", "")
-    entry["matched_auth_pattern"] = auth_info.get("matched_auth_pattern", "")
-    by_domain[domain] = entry
-    recent = data.get("recent", [])
-    recent.insert(
-        0,
-        {
-            "original_url": original_url,
-            "redirect_location": auth_info.get("redirect_location", ""),
-            "redirect_host": auth_info.get("redirect_host", ""),
-            "matched_auth_pattern": auth_info.get("matched_auth_pattern", ""),
-            "last_seen": now,
-        },
-    )
-    data["by_domain"] = by_domain
-    data["recent"] = recent[:MAX_RECENT_HINTS]
-    data["updated_at"] = now
-    AUTH_HINTS_PATH.parent.mkdir(parents=True, exist_ok=True)
-    AUTH_HINTS_PATH.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    event = {
+        "domain": domain,
+        "original_url": original_url,
+        "redirect_location": auth_info.get("redirect_location", ""),
+        "redirect_host": auth_info.get("redirect_host", ""),
+        "matched_auth_pattern": auth_info.get("matched_auth_pattern", ""),
+        "last_seen": datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z"),
+    }
+    with _lock:
+        state = _get_state()
+        with AUTH_HINTS_LOG_PATH.open("ab") as handle:
+            handle.write(orjson.dumps(event) + b"\n")
+        _apply_event(state, event)
+        _pending_events += 1
+        _state_signature = _disk_signature()
+        if _pending_events >= COMPACT_EVERY_EVENTS:
+            _compact_locked()
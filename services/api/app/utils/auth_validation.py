@@ -8,6 +8,8 @@ from urllib.parse import urlparse
 
 import yaml
 
+from app.utils.config import YamlLoader
+
 CRAWLER_CONFIG_PATH = Path("/app/config/crawler.yml")
 ALLOW_BLOCK_PATH = Path("/app/config/allow_block.yml")
 AUTH_CACHE_TTL_SECONDS = 300
@@ -61,7 +63,8 @@ _AUTH_STATUS_CACHE: Dict[str, Dict[str, object]] = {
 
 
 def _load_config(path: Path) -> Dict:
-    return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    with path.open("rb") as handle:
+        return yaml.load(handle, Loader=YamlLoader) or {}
 
 
 def load_crawler_config() -> Dict:
@@ -1,26 +1,82 @@
+import copy
+import os
 import signal
+import stat
+import tempfile
 import threading
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 import yaml
 
+try:  # LibYAML-backed loader/dumper are several times faster than the pure-Python ones
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+
 CONFIG_DIR = Path("/app/config")
 
 _cache: Dict[str, Any] = {}
+# Parsed YAML keyed by path, invalidated when the file's mtime or size changes.
+_file_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
 
 
 def _load_yaml(path: Path) -> Dict[str, Any]:
-    with path.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle) or {}
+    # Hand libyaml the raw bytes; it detects the encoding itself.
+    with path.open("rb") as handle:
+        return yaml.load(handle, Loader=YamlLoader) or {}
+
+
+def load_yaml_cached(path: Path) -> Dict[str, Any]:
+    """Parse `path`, reusing the previous result while its mtime and size are unchanged.
+
+    The size catches a rewrite landing within the filesystem's timestamp
+    granularity. The returned dict is shared between callers; copy it
+    before mutating.
+    """
+    signature = _file_signature(path)
+    cached = _file_cache.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    data = _load_yaml(path)
+    _file_cache[path] = (signature, data)
+    return data
+
+
+def _file_signature(path: Path) -> Tuple[int, int]:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
 
 
 def write_yaml_config(path: Path, payload: Dict[str, Any]) -> None:
     try:
-        yaml.safe_dump(payload)
+        text = yaml.dump(payload, Dumper=YamlDumper, sort_keys=False)
     except yaml.YAMLError as exc:
         raise ValueError(str(exc)) from exc
-    path.write_text(yaml.safe_dump(payload, sort_keys=False), encoding="utf-8")
+    _atomic_write(path, text.encode("utf-8"))
+    _file_cache.pop(path, None)
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Replace `path` with `data` so readers never observe a half-written file."""
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = 0o644
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
 
 
 def load_config(name: str) -> Dict[str, Any]:
@@ -30,10 +86,23 @@ def load_config(name: str) -> Dict[str, Any]:
 
 
 def refresh_config(name: str) -> Dict[str, Any]:
+    _file_cache.pop(CONFIG_DIR / f"{name}.yml", None)
     _cache[name] = _load_yaml(CONFIG_DIR / f"{name}.yml")
     return _cache[name]
 
 
+def store_config(name: str, payload: Dict[str, Any]) -> None:
+    """Write `{name}.yml` and prime the caches with a copy of `payload` instead of re-parsing the file.
+
+    The copy keeps later changes the caller makes to `payload` out of the cache.
+    """
+    path = CONFIG_DIR / f"{name}.yml"
+    write_yaml_config(path, payload)
+    cached = copy.deepcopy(payload)
+    _file_cache[path] = (_file_signature(path), cached)
+    _cache[name] = cached
+
+
 def load_agents_config() -> Dict[str, Any]:
     return load_config("agents")
 
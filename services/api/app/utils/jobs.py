@@ -9,7 +9,7 @@ JOB_LOG_DIR = Path("/app/data/logs/jobs")
 JOB_LOG_DIR.mkdir(parents=True, exist_ok=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class JobRecord:
     job_id: str
     job_type: str
@@ -17,8 +17,30 @@ class JobRecord:
     started_at: str
     ended_at: Optional[str]
 
+    def as_dict(self) -> Dict[str, Optional[str]]:
+        return {
+            "job_id": self.job_id,
+            "job_type": self.job_type,
+            "status": self.status,
+            "started_at": self.started_at,
+            "ended_at": self.ended_at,
+        }
+
 
 _jobs: Dict[str, JobRecord] = {}
+# Bumped on every job add/finish/delete so callers can cache derived views.
+_jobs_version = 0
+_version_lock = threading.Lock()
+
+
+def _bump_version() -> None:
+    global _jobs_version
+    with _version_lock:
+        _jobs_version += 1
+
+
+def jobs_version() -> int:
+    return _jobs_version
 
 
 def _write_log(job_id: str, message: str) -> None:
@@ -37,6 +59,7 @@ def start_job(job_type: str, worker: Callable[[Callable[[str], None], str], None
         ended_at=None,
     )
     _jobs[job_id] = record
+    _bump_version()
 
     def run() -> None:
         try:
@@ -48,6 +71,7 @@ def start_job(job_type: str, worker: Callable[[Callable[[str], None], str], None
             raise
         finally:
             record.ended_at = datetime.utcnow().isoformat()
+            _bump_version()
 
     thread = threading.Thread(target=run, daemon=True)
     thread.start()
@@ -64,6 +88,7 @@ def get_job(job_id: str) -> Optional[JobRecord]:
 
 def delete_job(job_id: str) -> None:
     _jobs.pop(job_id, None)
-    log_path = JOB_LOG_DIR / f"{job_id}.log"
-    if log_path.exists():
-        log_path.unlink()
+    _bump_version()
+    for log_path in (JOB_LOG_DIR / f"{job_id}.log", JOB_LOG_DIR / f"{job_id}.log.gz"):
+        if log_path.exists():
+            log_path.unlink()
@@ -3,6 +3,7 @@ import json
 import logging
 import time
 import httpx
+import orjson
 import os
 from pathlib import Path
 from typing import Any, Dict, Optional, Type, TypeVar
@@ -30,6 +31,28 @@ if OLLAMA_SEED is not None:
 else:
     OLLAMA_OPTIONS["seed"] = 42
 
+# One pooled client for every generate call so concurrent agent calls reuse
+# keep-alive connections instead of opening a fresh one each time.
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0),
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=16),
+        )
+    return _client
+
+
+async def close_ollama_client() -> None:
+    """Close the shared Ollama client; called from the app shutdown hook."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 async def _maybe_async_validate(fn: Callable[[str], Awaitable[T] | T], raw: str) -> T:
     """
@@ -54,7 +77,7 @@ def _parse_resp_text_and_join(resp) -> str:
         parts: list[str] = []
         for L in lines:
             try:
-                obj = json.loads(L)
+                obj = orjson.loads(L)
             except Exception:
                 # not a JSON line — keep the raw line
                 parts.append(L)
@@ -74,7 +97,7 @@ def _parse_resp_text_and_join(resp) -> str:
         # Non-streaming path: try to parse full JSON first, else use resp.text
         body_json = None
         try:
-            body_json = json.loads(resp_text)
+            body_json = orjson.loads(resp_text)
         except Exception:
             body_json = None
 
@@ -109,9 +132,13 @@ async def call_ollama_json(prompt: str, schema: Type[T]) -> T:
     OLLAMA_URL = "http://ollama:11434/api/generate"
 
     async def _parse_and_validate(raw_text: str) -> T:
+        # pydantic v2 parses and validates straight from the JSON text in one native pass
+        if hasattr(schema, "model_validate_json"):
+            return schema.model_validate_json(raw_text)  # type: ignore[call-arg]
+
         # First parse JSON
         try:
-            parsed = json.loads(raw_text)
+            parsed = orjson.loads(raw_text)
         except Exception as e:
             raise ValueError(f"Failed to parse JSON from model response: {e}\nraw_snippet={raw_text[:1000]!r}")
 
@@ -141,83 +168,83 @@ async def call_ollama_json(prompt: str, schema: Type[T]) -> T:
             logger.exception("Failed to write ollama raw response to disk")
 
     # make the HTTP call once
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        # The exact request body / headers depend on your Ollama usage.
-        # This mirrors a typical generate call and ensures prompt is passed through.
-        try:
-            logger.info("Calling Ollama model=%s endpoint=%s", OLLAMA_MODEL, OLLAMA_URL)
-            resp = await client.post(
-                OLLAMA_URL,
-                json={"model": OLLAMA_MODEL, "prompt": prompt, "options": OLLAMA_OPTIONS},
-            )
-            resp.raise_for_status()
-        except Exception as e:
-            logger.exception("Error calling Ollama generate endpoint")
-            raise
+    client = _get_client()
+    # The exact request body / headers depend on your Ollama usage.
+    # This mirrors a typical generate call and ensures prompt is passed through.
+    try:
+        logger.info("Calling Ollama model=%s endpoint=%s", OLLAMA_MODEL, OLLAMA_URL)
+        resp = await client.post(
+            OLLAMA_URL,
+            json={"model": OLLAMA_MODEL, "prompt": prompt, "options": OLLAMA_OPTIONS},
+        )
+        resp.raise_for_status()
+    except Exception as e:
+        logger.exception("Error calling Ollama generate endpoint")
+        raise
 
-        # extract text response (assumes response body contains the model text; adjust if your API differs)
-        try:
-            raw_body = None
-
-            # full response text from httpx (Ollama streams NDJSON as plain text)
-            resp_text = resp.text or ""
-            content_type = (resp.headers.get("content-type") or "").lower()
-
-            # Heuristic: if content-type is NDJSON or response contains newline-delimited JSON lines,
-            # parse each line and stitch together any "response" fields (Ollama streaming fragments).
-            if "application/x-ndjson" in content_type or "\n{" in resp_text:
-                lines = [L for L in resp_text.splitlines() if L.strip()]
-                parts: list[str] = []
-                for L in lines:
-                    try:
-                        obj = json.loads(L)
-                    except Exception:
-                        # not a JSON line — keep the raw line
-                        parts.append(L)
-                        continue
+    # extract text response (assumes response body contains the model text; adjust if your API differs)
+    try:
+        raw_body = None
+
+        # full response text from httpx (Ollama streams NDJSON as plain text)
+        resp_text = resp.text or ""
+        content_type = (resp.headers.get("content-type") or "").lower()
+
+        # Heuristic: if content-type is NDJSON or response contains newline-delimited JSON lines,
+        # parse each line and stitch together any "response" fields (Ollama streaming fragments).
+        if "application/x-ndjson" in content_type or "\n{" in resp_text:
+            lines = [L for L in resp_text.splitlines() if L.strip()]
+            parts: list[str] = []
+            for L in lines:
+                try:
+                    obj = orjson.loads(L)
+                except Exception:
+                    # not a JSON line — keep the raw line
+                    parts.append(L)
+                    continue
 
-                    # Prefer the streaming "response" token if present (common Ollama streaming format)
-                    if isinstance(obj, dict) and "response" in obj:
-                        parts.append(obj["response"])
-                    else:
-                        # fallback: stringify the object so we don't lose info
-                        parts.append(json.dumps(obj))
+                # Prefer the streaming "response" token if present (common Ollama streaming format)
+                if isinstance(obj, dict) and "response" in obj:
+                    parts.append(obj["response"])
+                else:
+                    # fallback: stringify the object so we don't lose info
+                    parts.append(json.dumps(obj))
 
-                raw_body = "".join(parts).strip()
-                logger.debug("Detected NDJSON from Ollama: lines=%d joined_len=%d", len(lines), len(raw_body))
-            else:
-                # Non-streaming path: try to parse full JSON first, else use resp.text
+            raw_body = "".join(parts).strip()
+            logger.debug("Detected NDJSON from Ollama: lines=%d joined_len=%d", len(lines), len(raw_body))
+        else:
+            # Non-streaming path: try to parse full JSON first, else use resp.text
+            body_json = None
+            try:
+                body_json = resp.json()
+            except Exception:
                 body_json = None
-                try:
-                    body_json = resp.json()
-                except Exception:
-                    body_json = None
-
-                if isinstance(body_json, dict):
-                    if "text" in body_json and isinstance(body_json["text"], str):
-                        raw_body = body_json["text"]
-                    elif "output" in body_json and isinstance(body_json["output"], str):
-                        raw_body = body_json["output"]
-                    elif "choices" in body_json and isinstance(body_json["choices"], list):
-                        # pick first choice content (common LLM API shape)
-                        for c in body_json["choices"]:
-                            if isinstance(c, dict):
-                                if "message" in c and isinstance(c["message"], dict) and "content" in c["message"]:
-                                    raw_body = c["message"]["content"]
-                                    break
-                                if "text" in c and isinstance(c["text"], str):
-                                    raw_body = c["text"]
-                                    break
-                    else:
-                        raw_body = json.dumps(body_json)
+
+            if isinstance(body_json, dict):
+                if "text" in body_json and isinstance(body_json["text"], str):
+                    raw_body = body_json["text"]
+                elif "output" in body_json and isinstance(body_json["output"], str):
+                    raw_body = body_json["output"]
+                elif "choices" in body_json and isinstance(body_json["choices"], list):
+                    # pick first choice content (common LLM API shape)
+                    for c in body_json["choices"]:
+                        if isinstance(c, dict):
+                            if "message" in c and isinstance(c["message"], dict) and "content" in c["message"]:
+                                raw_body = c["message"]["content"]
+                                break
+                            if "text" in c and isinstance(c["text"], str):
+                                raw_body = c["text"]
+                                break
                 else:
-                    raw_body = resp_text
+                    raw_body = json.dumps(body_json)
+            else:
+                raw_body = resp_text
 
-            if raw_body is None:
-                raw_body = resp_text or ""
-        except Exception:
-            logger.exception("Failed to extract body from Ollama response")
-            raise
+        if raw_body is None:
+            raw_body = resp_text or ""
+    except Exception:
+        logger.exception("Failed to extract body from Ollama response")
+        raise
 
     # First try to parse + validate
     try:
@@ -242,7 +269,9 @@ async def call_ollama_json(prompt: str, schema: Type[T]) -> T:
 
         # Try to include schema example if possible
         try:
-            if hasattr(schema, "schema_json"):
+            if hasattr(schema, "model_json_schema"):
+                repair_prompt += orjson.dumps(schema.model_json_schema()).decode()
+            elif hasattr(schema, "schema_json"):
                 repair_prompt += schema.schema_json()
             elif hasattr(schema, "schema"):
                 repair_prompt += json.dumps(schema.schema(), indent=2)
@@ -253,70 +282,70 @@ async def call_ollama_json(prompt: str, schema: Type[T]) -> T:
             repair_prompt += f"{schema.__name__}"
 
         # call Ollama one more time with the repair prompt
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            try:
-                logger.info("Calling Ollama (repair) model=%s endpoint=%s", OLLAMA_MODEL, OLLAMA_URL)
-                resp2 = await client.post(
-                    OLLAMA_URL,
-                    json={"model": OLLAMA_MODEL, "prompt": repair_prompt, "options": OLLAMA_OPTIONS},
-                )
-                resp2.raise_for_status()
-                # reuse the same NDJSON-aware extraction logic for the repair response
-                raw_body2 = None
-                resp_text2 = resp2.text or ""
-                content_type2 = (resp2.headers.get("content-type") or "").lower()
-
-                # Same NDJSON detection heuristic as initial response
-                if "application/x-ndjson" in content_type2 or "\n{" in resp_text2:
-                    lines2 = [L for L in resp_text2.splitlines() if L.strip()]
-                    parts2: list[str] = []
-                    for L in lines2:
-                        try:
-                            obj = json.loads(L)
-                        except Exception:
-                            parts2.append(L)
-                            continue
-
-                        if isinstance(obj, dict) and "response" in obj:
-                            parts2.append(obj["response"])
-                        else:
-                            parts2.append(json.dumps(obj))
-
-                    raw_body2 = "".join(parts2).strip()
-                    logger.debug("Detected NDJSON from Ollama (repair): lines=%d joined_len=%d", len(lines2), len(raw_body2))
-                else:
-                    # Non-streaming path
-                    body_json2 = None
+        client = _get_client()
+        try:
+            logger.info("Calling Ollama (repair) model=%s endpoint=%s", OLLAMA_MODEL, OLLAMA_URL)
+            resp2 = await client.post(
+                OLLAMA_URL,
+                json={"model": OLLAMA_MODEL, "prompt": repair_prompt, "options": OLLAMA_OPTIONS},
+            )
+            resp2.raise_for_status()
+            # reuse the same NDJSON-aware extraction logic for the repair response
+            raw_body2 = None
+            resp_text2 = resp2.text or ""
+            content_type2 = (resp2.headers.get("content-type") or "").lower()
+
+            # Same NDJSON detection heuristic as initial response
+            if "application/x-ndjson" in content_type2 or "\n{" in resp_text2:
+                lines2 = [L for L in resp_text2.splitlines() if L.strip()]
+                parts2: list[str] = []
+                for L in lines2:
                     try:
-                        body_json2 = resp2.json()
+                        obj = orjson.loads(L)
                     except Exception:
-                        body_json2 = None
-
-                    if isinstance(body_json2, dict):
-                        if "text" in body_json2 and isinstance(body_json2["text"], str):
-                            raw_body2 = body_json2["text"]
-                        elif "output" in body_json2 and isinstance(body_json2["output"], str):
-                            raw_body2 = body_json2["output"]
-                        elif "choices" in body_json2 and isinstance(body_json2["choices"], list):
-                            for c in body_json2["choices"]:
-                                if isinstance(c, dict):
-                                    if "message" in c and isinstance(c["message"], dict) and "content" in c["message"]:
-                                        raw_body2 = c["message"]["content"]
-                                        break
-                                    if "text" in c and isinstance(c["text"], str):
-                                        raw_body2 = c["text"]
-                                        break
-                        else:
-                            raw_body2 = json.dumps(body_json2)
+                        parts2.append(L)
+                        continue
+
+                    if isinstance(obj, dict) and "response" in obj:
+                        parts2.append(obj["response"])
                     else:
-                        raw_body2 = resp_text2
+                        parts2.append(json.dumps(obj))
 
-                if raw_body2 is None:
-                    raw_body2 = resp_text2 or ""
+                raw_body2 = "".join(parts2).strip()
+                logger.debug("Detected NDJSON from Ollama (repair): lines=%d joined_len=%d", len(lines2), len(raw_body2))
+            else:
+                # Non-streaming path
+                body_json2 = None
+                try:
+                    body_json2 = resp2.json()
+                except Exception:
+                    body_json2 = None
 
-            except Exception:
-                logger.exception("Repair request to Ollama failed")
-                raise
+                if isinstance(body_json2, dict):
+                    if "text" in body_json2 and isinstance(body_json2["text"], str):
+                        raw_body2 = body_json2["text"]
+                    elif "output" in body_json2 and isinstance(body_json2["output"], str):
+                        raw_body2 = body_json2["output"]
+                    elif "choices" in body_json2 and isinstance(body_json2["choices"], list):
+                        for c in body_json2["choices"]:
+                            if isinstance(c, dict):
+                                if "message" in c and isinstance(c["message"], dict) and "content" in c["message"]:
+                                    raw_body2 = c["message"]["content"]
+                                    break
+                                if "text" in c and isinstance(c["text"], str):
+                                    raw_body2 = c["text"]
+                                    break
+                    else:
+                        raw_body2 = json.dumps(body_json2)
+                else:
+                    raw_body2 = resp_text2
+
+            if raw_body2 is None:
+                raw_body2 = resp_text2 or ""
+
+        except Exception:
+            logger.exception("Repair request to Ollama failed")
+            raise
 
         # Try parse + validate again
         try:
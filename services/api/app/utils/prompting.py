@@ -0,0 +1,54 @@
+from typing import Any, Dict, List
+
+import orjson
+
+_PROMPT_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def prompt_json(obj: Any) -> str:
+    """Serialize prompt context as compact JSON rather than Python repr.
+
+    Double-quoted JSON tokenizes more densely than repr output, and identical
+    inputs always render to identical prompt text.
+    """
+    return orjson.dumps(obj, default=str, option=_PROMPT_JSON_OPTIONS).decode()
+
+
+DEFAULT_MAX_HISTORY_TURNS = 6
+DEFAULT_MAX_PROMPT_DOCS = 6
+DEFAULT_MAX_PROMPT_HITS = 10
+
+_PROMPT_HIT_KEYS = ("doc_id", "title", "url", "score")
+
+
+def _pipeline_limit(config: Dict[str, Any], key: str, default: int) -> int:
+    value = (config.get("pipeline") or {}).get(key, default)
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        return default
+
+
+def format_history(conversation_history: List[Dict[str, Any]], config: Dict[str, Any]) -> str:
+    """Render the last N conversation turns as compact "U:/A:" lines."""
+    max_turns = _pipeline_limit(config, "max_history_turns", DEFAULT_MAX_HISTORY_TURNS)
+    if not max_turns:
+        return ""
+    lines = []
+    for message in conversation_history[-max_turns:]:
+        speaker = "U" if message.get("role") == "user" else "A"
+        lines.append(f"{speaker}: {message.get('content') or ''}")
+    return "\n".join(lines)
+
+
+def compact_research(research: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep the top docs and a slimmed-down list of top hits (no chunk text)."""
+    max_docs = _pipeline_limit(config, "max_prompt_docs", DEFAULT_MAX_PROMPT_DOCS)
+    max_hits = _pipeline_limit(config, "max_prompt_hits", DEFAULT_MAX_PROMPT_HITS)
+    return {
+        "docs": (research.get("docs") or [])[:max_docs],
+        "hits": [
+            {key: hit.get(key) for key in _PROMPT_HIT_KEYS}
+            for hit in (research.get("hits") or [])[:max_hits]
+        ],
+    }
@@ -1,7 +1,7 @@
 # services/api/app/utils/redis_queue.py
 import json
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 import redis.asyncio as aioredis
 from datetime import datetime
 
@@ -10,27 +10,38 @@ REDIS_URL = os.getenv("REDIS_HOST", "redis://redis:6379/0")
 redis_client = aioredis.from_url(REDIS_URL, decode_responses=True)
 
 
+def _initial_state(job: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "status": "queued",
+        "total": job.get("chunks_estimate", 0),
+        "done": 0,
+        "total_artifacts": 0,
+        "done_artifacts": 0,
+        "attempts": 0,
+        "created_at": datetime.utcnow().isoformat(),
+        "job_type": job.get("type", "ingest"),
+    }
+
+
 async def push_job(job: Dict[str, Any]):
     """Push job (JSON) to queue and init job state hash."""
     job_id = job["job_id"]
     await redis_client.lpush("jobs:queue", json.dumps(job))
     job_key = f"job:{job_id}"
-    await redis_client.hset(
-        job_key,
-        mapping={
-            "status": "queued",
-            "total": job.get("chunks_estimate", 0),
-            "done": 0,
-            "total_artifacts": 0,
-            "done_artifacts": 0,
-            "attempts": 0,
-            "created_at": datetime.utcnow().isoformat(),
-            "job_type": job.get("type", "ingest"),
-        },
-    )
+    await redis_client.hset(job_key, mapping=_initial_state(job))
     return job_id
 
 
+async def push_jobs(jobs: List[Dict[str, Any]]) -> List[str]:
+    """Queue several jobs in one round-trip; same effect as push_job on each."""
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for job in jobs:
+            pipe.lpush("jobs:queue", json.dumps(job))
+            pipe.hset(f"job:{job['job_id']}", mapping=_initial_state(job))
+        await pipe.execute()
+    return [job["job_id"] for job in jobs]
+
+
 async def set_job_status(job_id: str, status: str, **extra):
     """Update job status and optional extra fields."""
     key = f"job:{job_id}"
@@ -12,8 +12,10 @@ from urllib.parse import parse_qsl, urljoin, urlparse, urlunparse
 import httpx
 import yaml
 
-from app.utils.auth_hints import record_auth_hint
+from app.utils.artifact_index import record_artifact
+from app.utils.auth_hints import compact_auth_hints, record_auth_hint
 from app.utils.auth_validation import collect_required_profiles, detect_auth_failure, run_auth_checks
+from app.utils.config import YamlLoader
 try:
     import tiktoken  # type: ignore
 except Exception:
@@ -49,7 +51,8 @@ def _require_bs4() -> None:
 
 
 def _load_config(path: Path) -> Dict:
-    return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    with path.open("rb") as handle:
+        return yaml.load(handle, Loader=YamlLoader) or {}
 
 
 def _load_allow_block() -> Dict[str, List[str]]:
@@ -324,11 +327,20 @@ def _download_artifact(
         artifact["auth_profile"] = auth_profile
 
     # Save metadata
+    _write_artifact_json(artifact_path, artifact)
+
+    return artifact
+
+
+def _write_artifact_json(artifact_path: Path, artifact: Dict) -> None:
     (artifact_path / "artifact.json").write_text(
         json.dumps(artifact, ensure_ascii=False, indent=2), encoding="utf-8"
     )
-
-    return artifact
+    try:
+        record_artifact(artifact_path.name, artifact)
+    except Exception as exc:
+        # The index refreshes itself from disk on the next lookup
+        logging.warning("Could not index artifact %s: %s", artifact_path.name, exc)
 
 
 def _match_auth_redirect(target: str) -> str | None:
@@ -402,9 +414,7 @@ def _capture_url_http(url: str, allow_http: bool = False) -> List[str]:
         "title": title,
         "text": text,
     }
-    (artifact_path / "artifact.json").write_text(
-        json.dumps(artifact, ensure_ascii=False, indent=2), encoding="utf-8"
-    )
+    _write_artifact_json(artifact_path, artifact)
     chunking = ingest_config.get("chunking", {})
     chunks = _chunk_text(
         text,
@@ -527,9 +537,7 @@ def _capture_url_playwright(
         "http_status": status,
         "auth_profile": auth_profile,
     }
-    (artifact_path / "artifact.json").write_text(
-        json.dumps(artifact, ensure_ascii=False, indent=2), encoding="utf-8"
-    )
+    _write_artifact_json(artifact_path, artifact)
     chunking = ingest_config.get("chunking", {})
     chunks = _chunk_text(
         text,
@@ -819,6 +827,7 @@ def run_crawl_job(log, job_id: str = None) -> None:
 
     # Save summary at the end
     _save_job_summary(job_id, metrics)
+    compact_auth_hints()
 
     # Log summary
     log("=" * 60)
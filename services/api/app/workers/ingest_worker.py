@@ -1,4 +1,5 @@
 import json
+import os
 import sqlite3
 import uuid
 from datetime import datetime
@@ -9,15 +10,19 @@ import yaml
 from qdrant_client import QdrantClient
 from qdrant_client.http import models as rest
 
+from app.utils.config import YamlLoader
 from app.utils.ollama_embed import embed_text
 
 ARTIFACT_DIR = Path("/app/data/artifacts")
 CONFIG_PATH = Path("/app/config/system.yml")
 DB_PATH = Path("/app/data/ingest/metadata.db")
+# PRAGMA user_version of a fully initialized metadata DB
+METADATA_SCHEMA_VERSION = 1
 
 
 def _load_config(path: Path) -> Dict:
-    return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    with path.open("rb") as handle:
+        return yaml.load(handle, Loader=YamlLoader) or {}
 
 
 def _connect() -> sqlite3.Connection:
@@ -27,6 +32,20 @@ def _connect() -> sqlite3.Connection:
     return conn
 
 
+def _analyze_once(conn: sqlite3.Connection) -> None:
+    """Collect planner statistics the first time the documents table holds rows.
+
+    Later runs skip this; ANALYZE is only needed once for the planner to
+    trust the url/doc_id indexes over a scan.
+    """
+    has_stats = conn.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='sqlite_stat1'").fetchone()
+    if has_stats and conn.execute("SELECT 1 FROM sqlite_stat1 WHERE tbl='documents'").fetchone():
+        return
+    if conn.execute("SELECT 1 FROM documents LIMIT 1").fetchone() is None:
+        return
+    conn.execute("ANALYZE;")
+
+
 def _init_db(conn: sqlite3.Connection) -> None:
     """Initialize the ingest metadata database schema.
 
@@ -64,9 +83,10 @@ def _init_db(conn: sqlite3.Connection) -> None:
     # Create indexes for better query performance
     conn.execute("CREATE INDEX IF NOT EXISTS idx_documents_url ON documents(url);")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_chunks_doc_id ON chunks(doc_id);")
+    _analyze_once(conn)
 
     # Set schema version for tracking
-    conn.execute("PRAGMA user_version = 1;")
+    conn.execute(f"PRAGMA user_version = {METADATA_SCHEMA_VERSION};")
 
     # Commit changes
     conn.commit()
@@ -185,7 +205,15 @@ def _load_embeddings(texts: List[str], host: str, model: str) -> List[List[float
 
 
 def _doc_ids_on_disk() -> Set[str]:
-    return {path.parent.name for path in ARTIFACT_DIR.glob("*/artifact.json")}
+    try:
+        with os.scandir(ARTIFACT_DIR) as entries:
+            return {
+                entry.name
+                for entry in entries
+                if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "artifact.json"))
+            }
+    except FileNotFoundError:
+        return set()
 
 
 def _qdrant_has_points(
@@ -0,0 +1,293 @@
+import asyncio
+import gzip
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from app.routes import admin
+
+
+class AdminFileHelpersTests(unittest.TestCase):
+    def test_latest_summary_picks_newest_matching_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            for offset, name in enumerate(
+                ["validate_crawl_1.json", "validate_crawl_2.json", "validate_ingest_9.json", "validate_crawl_3.txt"]
+            ):
+                path = root / name
+                path.write_text("{}", encoding="utf-8")
+                os.utime(path, ns=(0, (offset + 1) * 1_000_000_000))
+            (root / "validate_crawl_dir.json").mkdir()
+
+            with mock.patch.object(admin, "SUMMARY_DIR", root):
+                self.assertEqual(admin._latest_summary("validate_crawl_"), root / "validate_crawl_2.json")
+                self.assertIsNone(admin._latest_summary("missing_"))
+            with mock.patch.object(admin, "SUMMARY_DIR", root / "absent"):
+                self.assertIsNone(admin._latest_summary("validate_crawl_"))
+
+    def test_read_summary_prefers_latest_copy(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            with mock.patch.object(admin, "SUMMARY_DIR", root):
+                self.assertIsNone(admin._read_crawl_summary())
+                (root / "validate_crawl_1.json").write_bytes(b'{"run": 1}')
+                self.assertEqual(admin._read_crawl_summary(), {"run": 1})
+                (root / "validate_crawl_latest.json").write_bytes(b'{"run": "latest"}')
+                self.assertEqual(admin._read_crawl_summary(), {"run": "latest"})
+
+    def test_publish_ingest_summary_copies_newest(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "validate_ingest_1.json").write_bytes(b'{"status": "ok",\n "docs": 3}')
+
+            with mock.patch.object(admin, "SUMMARY_DIR", root):
+                self.assertEqual(admin._publish_ingest_summary(), {"status": "ok", "docs": 3})
+                # The published copy now has the newest mtime and is picked up itself
+                self.assertEqual(admin._publish_ingest_summary(), {"status": "ok", "docs": 3})
+
+            self.assertEqual(
+                (root / "validate_ingest_latest.json").read_bytes(), b'{"status": "ok",\n "docs": 3}'
+            )
+            self.assertEqual(sorted(os.listdir(root)), ["validate_ingest_1.json", "validate_ingest_latest.json"])
+
+    def test_count_matching(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            for name in ["a", "b", "c"]:
+                (root / name).mkdir()
+            (root / "a" / "artifact.json").write_text("{}", encoding="utf-8")
+            (root / "b" / "artifact.json").write_text("{}", encoding="utf-8")
+            (root / "job.log").write_text("", encoding="utf-8")
+            (root / "old.log").mkdir()
+            os.symlink(root / "a", root / "link")
+
+            self.assertEqual(admin._count_matching(root, subfile="artifact.json"), 2)
+            self.assertEqual(admin._count_matching(root, ".log"), 1)
+            self.assertEqual(admin._count_matching(root), 6)
+            self.assertEqual(admin._count_matching(root / "absent"), 0)
+
+    def test_iter_artifact_files_skips_files_and_symlinks(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "a").mkdir()
+            (root / "a" / "artifact.json").write_text("{}", encoding="utf-8")
+            (root / "b").mkdir()
+            (root / "url_index.sqlite").write_text("", encoding="utf-8")
+            os.symlink(root / "a", root / "link")
+
+            found = sorted(admin._iter_artifact_files(root))
+
+            self.assertEqual(
+                found,
+                [("a", str(root / "a" / "artifact.json")), ("b", str(root / "b" / "artifact.json"))],
+            )
+
+    def test_reset_paths_empties_directories_and_removes_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            logs = root / "jobs"
+            logs.mkdir()
+            (logs / "1.log").write_text("x", encoding="utf-8")
+            (logs / "2.log").write_text("x", encoding="utf-8")
+            candidates = root / "candidates.jsonl"
+            candidates.write_text("{}\n", encoding="utf-8")
+            targets = (
+                (logs, ".log", "", "job logs"),
+                (candidates, None, "", "candidates.jsonl"),
+                (root / "absent", ".json", "", "summaries"),
+            )
+
+            deleted = admin._reset_paths(targets)
+
+            self.assertEqual(deleted, ["2 job logs", "candidates.jsonl"])
+            self.assertTrue(logs.is_dir())
+            self.assertEqual(list(logs.iterdir()), [])
+            self.assertFalse(candidates.exists())
+
+    def test_reset_paths_can_skip_counting(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logs = Path(tmpdir) / "jobs"
+            logs.mkdir()
+            (logs / "1.log").write_text("x", encoding="utf-8")
+
+            with mock.patch.object(admin, "_count_matching", side_effect=AssertionError("counted")):
+                deleted = admin._reset_paths(((logs, ".log", "", "job logs"),), count=False)
+
+            self.assertEqual(deleted, ["job logs (count skipped)"])
+            self.assertEqual(list(logs.iterdir()), [])
+
+
+class ArtifactCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        patch = mock.patch.object(admin, "_ARTIFACT_CACHE", admin.OrderedDict())
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_load_artifact_rereads_after_change(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "artifact.json"
+            path.write_text('{"url": "https://example.com/a", "text": "long page"}', encoding="utf-8")
+
+            first = admin._load_artifact(path)
+            self.assertIs(admin._load_artifact(path), first)
+            self.assertEqual(first, {"url": "https://example.com/a"})
+
+            path.write_text('{"url": "https://example.com/b"}', encoding="utf-8")
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+            self.assertEqual(admin._load_artifact(path)["url"], "https://example.com/b")
+            self.assertEqual(len(admin._ARTIFACT_CACHE), 1)
+
+    def test_least_recently_used_entries_evicted(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = []
+            for name in "abc":
+                path = Path(tmpdir) / f"{name}.json"
+                path.write_text(f'{{"url": "{name}"}}', encoding="utf-8")
+                paths.append(path)
+
+            with mock.patch.object(admin, "ARTIFACT_CACHE_MAX_ENTRIES", 2):
+                admin._load_artifact(paths[0])
+                admin._load_artifact(paths[1])
+                admin._load_artifact(paths[0])
+                admin._load_artifact(paths[2])
+
+            self.assertEqual(list(admin._ARTIFACT_CACHE), [str(paths[0]), str(paths[2])])
+
+
+class ReadSnippetTests(unittest.TestCase):
+    def test_reads_prefix_only(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "short.html").write_text("é" * 10, encoding="utf-8")
+            (root / "long.html").write_text("é" * 5000, encoding="utf-8")
+
+            self.assertEqual(admin._read_snippet(root / "short.html"), "é" * 10)
+            self.assertEqual(admin._read_snippet(root / "long.html"), "é" * 500 + "...")
+            self.assertEqual(admin._read_snippet(root / "missing.html"), "")
+
+
+class SearchContentTests(unittest.TestCase):
+    def test_case_insensitive_match_with_snippet(self) -> None:
+        prefilter = admin._content_prefilter("Tuition")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            content = root / "content.html"
+            content.write_text("é" * 150 + "<p>TUITION rates</p>", encoding="utf-8")
+            (root / "empty.html").write_bytes(b"")
+
+            index, snippet = admin._search_content(content, "Tuition", prefilter)
+
+            # A character offset, not a byte offset
+            self.assertEqual(index, 153)
+            self.assertEqual(snippet, "é" * 97 + "<p>TUITION rates</p>")
+            self.assertIsNone(admin._search_content(content, "fees", admin._content_prefilter("fees")))
+            self.assertIsNone(admin._search_content(root / "empty.html", "Tuition", prefilter))
+            self.assertIsNone(admin._search_content(root / "missing.html", "Tuition", prefilter))
+
+    def test_non_ascii_query_matches_across_case(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            content = Path(tmpdir) / "content.html"
+            content.write_text("Bienvenue à l'école\r\nÜBER uns", encoding="utf-8")
+
+            self.assertIsNone(admin._content_prefilter("École"))
+            self.assertEqual(admin._search_content(content, "École", admin._content_prefilter("École"))[0], 14)
+            self.assertEqual(admin._search_content(content, "über", admin._content_prefilter("über"))[0], 20)
+
+
+class FirstMatchesTests(unittest.TestCase):
+    def test_results_follow_input_order_regardless_of_completion(self) -> None:
+        files = [Path(str(index)) for index in range(8)]
+
+        def scan(path: Path) -> object:
+            index = int(path.name)
+            # Later files finish first
+            time.sleep((8 - index) * 0.005)
+            return {"index": index} if index % 2 else None
+
+        matches = asyncio.run(admin._first_matches(scan, files, 2))
+        self.assertEqual(matches, [{"index": 1}, {"index": 3}])
+        self.assertEqual(len(asyncio.run(admin._first_matches(scan, files, 10))), 4)
+
+
+class CompressedLogTests(unittest.TestCase):
+    def test_rebuilds_when_log_changes_without_leaving_temp_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "job.log"
+            log_path.write_text("first\n", encoding="utf-8")
+            gz_path, _ = admin._compressed_log(log_path)
+            self.assertEqual(gzip.decompress(gz_path.read_bytes()), b"first\n")
+
+            log_path.write_text("first\nsecond\n", encoding="utf-8")
+            stat = gz_path.stat()
+            os.utime(log_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            gz_path, _ = admin._compressed_log(log_path)
+
+            self.assertEqual(gzip.decompress(gz_path.read_bytes()), b"first\nsecond\n")
+            self.assertEqual(sorted(os.listdir(tmpdir)), ["job.log", "job.log.gz"])
+
+
+class TailLogTests(unittest.TestCase):
+    async def _first_event(self, job_id: str, from_tail: bool) -> str:
+        stream = admin._tail_log(job_id, from_tail=from_tail)
+        try:
+            return await stream.__anext__()
+        finally:
+            await stream.aclose()
+
+    def test_tail_seek_inside_multibyte_character(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            line = "größe → ok ✓\n"
+            body = (line * 2000).encode("utf-8")
+            (root / "job.log").write_bytes(body)
+            # Every offset into a line, so the seek hits each byte of the multi-byte characters
+            offsets = range(len(line.encode("utf-8")))
+            with mock.patch.object(admin, "JOB_LOG_DIR", root), mock.patch.object(admin, "awatch", None):
+                for offset in offsets:
+                    with self.subTest(offset=offset), mock.patch.object(
+                        admin, "LOG_TAIL_CONTEXT_BYTES", 4096 + offset
+                    ):
+                        event = asyncio.run(self._first_event("job", True))
+                        self.assertTrue(event.startswith("data: größe → ok ✓\n\n"))
+                        self.assertNotIn("\ufffd", event)
+
+                full = asyncio.run(self._first_event("job", False))
+                self.assertEqual(full.count("data: größe → ok ✓\n\n"), 2000)
+
+
+    def test_watchers_capped_and_released(self) -> None:
+        async def changes():
+            yield set()
+
+        fake_awatch = mock.Mock(side_effect=lambda path, **kwargs: changes())
+
+        async def tail_twice() -> int:
+            first = admin._tail_log("job")
+            second = admin._tail_log("job")
+            await first.__anext__()
+            await second.__anext__()
+            active = admin._LOG_WATCHERS_ACTIVE
+            await first.aclose()
+            await second.aclose()
+            return active
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "job.log").write_text("line\n", encoding="utf-8")
+            with mock.patch.object(admin, "JOB_LOG_DIR", root), mock.patch.object(
+                admin, "awatch", fake_awatch
+            ), mock.patch.object(admin, "LOG_TAIL_MAX_WATCHERS", 1), mock.patch.object(
+                admin, "_LOG_WATCHERS_ACTIVE", 0
+            ):
+                self.assertEqual(asyncio.run(tail_twice()), 1)
+                self.assertEqual(admin._LOG_WATCHERS_ACTIVE, 0)
+        self.assertEqual(fake_awatch.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
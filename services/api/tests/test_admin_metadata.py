@@ -0,0 +1,63 @@
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from app.routes import admin
+from app.workers import ingest_worker
+
+
+class MetadataConnectionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        db_path = self.root / "metadata.db"
+        self.patches = [
+            mock.patch.object(admin, "DB_PATH", db_path),
+            mock.patch.object(ingest_worker, "DB_PATH", db_path),
+            mock.patch.object(admin, "_META_CONN", None),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self) -> None:
+        admin._close_meta_conn()
+        for patch in reversed(self.patches):
+            patch.stop()
+        self.tmpdir.cleanup()
+
+    def test_existing_empty_file_gets_schema(self) -> None:
+        admin.DB_PATH.touch()
+
+        self.assertEqual(admin._ingest_record_for_url("https://example.com/a"), {"found": False})
+        with sqlite3.connect(admin.DB_PATH) as conn:
+            self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], ingest_worker.METADATA_SCHEMA_VERSION)
+
+    def test_lookup_clear_and_remove(self) -> None:
+        self.assertEqual(admin._ingest_record_for_url("https://example.com/a"), {"found": False})
+
+        with sqlite3.connect(admin.DB_PATH) as conn:
+            conn.execute("INSERT INTO documents (doc_id, url, chunk_count) VALUES ('d1', 'https://example.com/a', 2)")
+            conn.executemany("INSERT INTO chunks (chunk_id, doc_id) VALUES (?, 'd1')", [("c1",), ("c2",)])
+
+        record = admin._ingest_record_for_url("https://example.com/a")
+        self.assertEqual((record["doc_id"], record["chunk_count"]), ("d1", 2))
+
+        with sqlite3.connect(admin.DB_PATH) as conn:
+            conn.execute("INSERT INTO documents (doc_id, url) VALUES ('d2', 'https://example.com/b')")
+
+        cleared = admin._clear_ingest_records(
+            [("https://example.com/a", None), ("https://example.com/b", "d2"), ("https://example.com/c", None)]
+        )
+
+        self.assertEqual(cleared, [("d1", 1, 2), ("d2", 1, 0), (None, 0, 0)])
+        self.assertEqual(admin._ingest_record_for_url("https://example.com/a"), {"found": False})
+        self.assertEqual(admin._ingest_record_for_url("https://example.com/b"), {"found": False})
+
+        self.assertTrue(admin._remove_metadata_db())
+        self.assertEqual(list(self.root.iterdir()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
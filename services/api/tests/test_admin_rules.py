@@ -0,0 +1,171 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from fastapi import HTTPException
+
+from app.routes import admin
+
+
+class AuthHintFlagsTests(unittest.TestCase):
+    def test_flags_match_prefix_exact_and_domain_hints(self) -> None:
+        rules = [
+            {"pattern": "https://a.example.com/docs/", "match": "prefix"},
+            {"pattern": "https://a.example.com/docs/page", "match": "exact"},
+            {"pattern": "https://a.example.com/other/", "match": "prefix"},
+            {"pattern": "https://b.example.com/", "match": "prefix"},
+            {"pattern": "", "match": "prefix"},
+            "not-a-rule",
+            {"pattern": "https://a.example.com/", "match": "prefix"},
+        ]
+        hints = {
+            "recent": [
+                {"original_url": "https://a.example.com/docs/page"},
+                {"original_url": ""},
+            ],
+            "by_domain": {"b.example.com": {"count": 2}},
+        }
+
+        flags = admin._auth_hint_flags(rules, hints)
+
+        self.assertEqual(flags, [True, True, False, True, False, False, True])
+
+    def test_no_hints(self) -> None:
+        rules = [{"pattern": "https://a.example.com/"}]
+        self.assertEqual(admin._auth_hint_flags(rules, {}), [False])
+
+
+class RuleIdBackfillTests(unittest.TestCase):
+    def test_backfill_assigns_ids_and_marks_config(self) -> None:
+        config = {"allow_rules": [{"id": "keep", "pattern": "a"}, {"pattern": "b"}, "junk"]}
+        self.assertFalse(admin._rule_ids_verified(config))
+
+        self.assertTrue(admin._backfill_rule_ids(config))
+
+        self.assertEqual(config["allow_rules"][0]["id"], "keep")
+        self.assertTrue(config["allow_rules"][1]["id"])
+        self.assertTrue(admin._rule_ids_verified(config))
+        self.assertFalse(admin._rule_ids_verified(dict(config)))
+        self.assertFalse(admin._backfill_rule_ids(config))
+
+    def test_cached_config_not_mutated(self) -> None:
+        cached = {"allow_rules": [{"pattern": "a"}]}
+        with mock.patch.object(admin, "store_config") as store:
+            config = asyncio.run(admin._allow_block_with_rule_ids(cached))
+
+        self.assertEqual(cached, {"allow_rules": [{"pattern": "a"}]})
+        self.assertTrue(config["allow_rules"][0]["id"])
+        store.assert_called_once_with("allow_block", config)
+
+        complete = {"allow_rules": [{"id": "x", "pattern": "a"}]}
+        with mock.patch.object(admin, "store_config") as store:
+            self.assertIs(asyncio.run(admin._allow_block_with_rule_ids(complete)), complete)
+        store.assert_not_called()
+        self.assertTrue(admin._rule_ids_verified(complete))
+
+
+class TokenLoadingTests(unittest.TestCase):
+    def test_tokens_reloaded_when_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "admin_tokens"
+            with mock.patch.object(admin, "SECRETS_PATH", path), mock.patch.object(admin, "_TOKENS_CACHE", None):
+                self.assertEqual(admin._load_tokens(), frozenset())
+
+                path.write_text("alpha\n\n  beta  \n", encoding="utf-8")
+                first = admin._load_tokens()
+                self.assertEqual(first, frozenset({"alpha", "beta"}))
+                self.assertIs(admin._load_tokens(), first)
+
+                stat = path.stat()
+                path.write_text("alpha\ngamma\n", encoding="utf-8")
+                os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+                self.assertEqual(admin._load_tokens(), frozenset({"alpha", "gamma"}))
+
+
+class UnlockTests(unittest.TestCase):
+    def _unlock(self, token: str) -> None:
+        asyncio.run(admin.unlock({"token": token}))
+
+    def test_accepts_known_tokens_in_both_modes(self) -> None:
+        tokens = frozenset({"alpha", "beta"})
+        for strict in (False, True):
+            with mock.patch.object(admin, "ADMIN_TOKEN_STRICT_COMPARE", strict), mock.patch.object(
+                admin, "_load_tokens", return_value=tokens
+            ):
+                self._unlock("beta")
+                with self.assertRaises(HTTPException) as ctx:
+                    self._unlock("gamma")
+                self.assertEqual(ctx.exception.status_code, 403)
+
+    def test_rejects_oversized_token_before_loading(self) -> None:
+        with mock.patch.object(admin, "_load_tokens", side_effect=AssertionError("loaded")):
+            with self.assertRaises(HTTPException) as ctx:
+                self._unlock("x" * (admin.ADMIN_TOKEN_MAX_LENGTH + 1))
+        self.assertEqual(ctx.exception.status_code, 400)
+
+
+class AuthTestCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.configs = configs = {
+            "allow_block.yml": {"allow_rules": [{"id": "r1", "pattern": "https://a.example.com/", "auth_profile": "sso"}]},
+            "crawler.yml": {"playwright": {"auth_profiles": {"sso": {"test_url": "https://a.example.com/t"}}}},
+        }
+        result = mock.Mock(ok=True)
+        result.to_dict.return_value = {"profile_name": "sso", "status": 200}
+        self.validate = mock.AsyncMock(return_value=result)
+        self.patches = [
+            mock.patch.object(admin, "_AUTH_TEST_CACHE", {}),
+            mock.patch.object(admin, "_ALLOWED_URL_STATUS_CACHE", {"timestamp": 0.0, "payload": None}),
+            mock.patch.object(admin, "load_yaml_cached", side_effect=lambda path: configs[path.name]),
+            mock.patch.object(admin, "load_auth_hints", return_value={}),
+            mock.patch.object(admin, "store_config"),
+            mock.patch.object(admin, "_playwright_available_cached", return_value=True),
+            mock.patch.object(admin, "validate_auth_profile", self.validate),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self) -> None:
+        for patch in reversed(self.patches):
+            patch.stop()
+
+    def _status(self) -> dict:
+        admin._ALLOWED_URL_STATUS_CACHE["timestamp"] = 0.0
+        return asyncio.run(admin.allowed_urls_auth_status())
+
+    def test_probe_result_reused_until_flushed(self) -> None:
+        first = self._status()
+        second = self._status()
+        self.assertEqual(self.validate.await_count, 1)
+        self.assertEqual(second["rules"][0]["ui_status"], "valid")
+        self.assertEqual(second["rules"][0]["auth_test"], first["rules"][0]["auth_test"])
+
+        self.assertEqual(asyncio.run(admin.refresh_allowed_urls_auth_status())["cleared"], 1)
+        self._status()
+        self.assertEqual(self.validate.await_count, 2)
+
+    def test_rules_sharing_a_profile_probe_once(self) -> None:
+        rules = self.configs["allow_block.yml"]["allow_rules"]
+        rules.append({"id": "r2", "pattern": "https://a.example.com/b/", "auth_profile": "sso"})
+
+        payload = self._status()
+
+        self.assertEqual(self.validate.await_count, 1)
+        self.assertEqual([rule["ui_status"] for rule in payload["rules"]], ["valid", "valid"])
+
+    def test_expired_entries_evicted_when_full(self) -> None:
+        stale = time.monotonic() - admin.AUTH_TEST_TTL_SECONDS - 1
+        with mock.patch.object(admin, "AUTH_TEST_CACHE_MAX_ENTRIES", 2):
+            admin._AUTH_TEST_CACHE[("old", "u")] = (stale, {}, "valid")
+            admin._store_auth_test(("a", "u"), {}, "valid")
+            admin._store_auth_test(("b", "u"), {}, "invalid")
+        self.assertEqual(set(admin._AUTH_TEST_CACHE), {("a", "u"), ("b", "u")})
+        self.assertEqual(admin._cached_auth_test(("b", "u")), ({}, "invalid"))
+
+
+if __name__ == "__main__":
+    unittest.main()
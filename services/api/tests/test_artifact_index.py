@@ -0,0 +1,158 @@
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from app.utils import artifact_index
+
+
+class ArtifactIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.patches = [
+            mock.patch.object(artifact_index, "ARTIFACT_DIR", self.root),
+            mock.patch.object(artifact_index, "INDEX_PATH", self.root / "url_index.sqlite"),
+            mock.patch.object(artifact_index, "_stats_cache", None),
+            mock.patch.object(artifact_index, "_refreshed_signature", None),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self) -> None:
+        for patch in reversed(self.patches):
+            patch.stop()
+        self.tmpdir.cleanup()
+
+    def _write(self, artifact_id: str, payload: dict, mtime_offset: int = 0) -> Path:
+        artifact_dir = self.root / artifact_id
+        artifact_dir.mkdir(exist_ok=True)
+        path = artifact_dir / "artifact.json"
+        path.write_text(json.dumps(payload), encoding="utf-8")
+        if mtime_offset:
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset))
+        return path
+
+    def test_lookup_matches_url_and_final_url(self) -> None:
+        self._write("a", {"url": "https://example.com/a", "doc_id": "doc-a", "fetched_at": "2024-01-01"})
+        self._write("b", {"url": "https://example.com/old", "final_url": "https://example.com/a", "doc_id": "doc-b"})
+        self._write("c", {"url": "https://example.com/c", "doc_id": "doc-c"})
+        (self.root / "empty").mkdir()
+
+        rows = artifact_index.lookup_by_url("https://example.com/a")
+
+        self.assertEqual(sorted(row["artifact_id"] for row in rows), ["a", "b"])
+        row_a = next(row for row in rows if row["artifact_id"] == "a")
+        self.assertEqual(row_a["doc_id"], "doc-a")
+        self.assertEqual(row_a["captured_at"], "2024-01-01T00:00:00.000000Z")
+        self.assertEqual(row_a["path"], self.root / "a" / "artifact.json")
+
+    def test_lookup_follows_rewrites_and_removals(self) -> None:
+        self._write("a", {"url": "https://example.com/a"})
+        self._write("b", {"url": "https://example.com/a"})
+        self.assertEqual(len(artifact_index.lookup_by_url("https://example.com/a")), 2)
+
+        self._write("a", {"url": "https://example.com/moved"}, mtime_offset=1_000_000)
+        shutil.rmtree(self.root / "b")
+
+        self.assertEqual(artifact_index.lookup_by_url("https://example.com/a"), [])
+        self.assertEqual(
+            [row["artifact_id"] for row in artifact_index.lookup_by_url("https://example.com/moved")], ["a"]
+        )
+
+    def test_record_artifact_is_visible_without_reparse(self) -> None:
+        self._write("a", {"url": "https://example.com/a", "fetched_at": "2024-01-01"})
+        artifact_index.refresh_index()
+        payload = {"url": "https://example.com/a", "doc_id": "doc-b", "fetched_at": "2024-02-01"}
+        self._write("b", payload)
+        artifact_index.record_artifact("b", payload)
+
+        with mock.patch.object(artifact_index.orjson, "loads", side_effect=AssertionError("re-parsed")):
+            rows = artifact_index.lookup_by_url("https://example.com/a")
+
+        self.assertEqual([row["artifact_id"] for row in rows], ["b", "a"])
+        self.assertEqual(rows[0]["doc_id"], "doc-b")
+
+    def test_stats_reuse_until_directory_or_index_changes(self) -> None:
+        self._write("a", {"url": "https://example.com/a"})
+        newest = self._write("b", {"url": "https://example.com/b"}, mtime_offset=1_000_000)
+
+        self.assertEqual(artifact_index.artifact_stats(), (2, newest.stat().st_mtime_ns))
+        with mock.patch.object(artifact_index, "_refresh", side_effect=AssertionError("rescanned")):
+            self.assertEqual(artifact_index.artifact_stats()[0], 2)
+
+        shutil.rmtree(self.root / "a")
+        self.assertEqual(artifact_index.artifact_stats()[0], 1)
+
+        payload = {"url": "https://example.com/b", "fetched_at": "2024-03-01"}
+        rewritten = self._write("b", payload, mtime_offset=2_000_000)
+        artifact_index.record_artifact("b", payload)
+        self.assertEqual(artifact_index.artifact_stats(), (1, rewritten.stat().st_mtime_ns))
+
+    def test_batch_lookup_refreshes_once(self) -> None:
+        self._write("a", {"url": "https://example.com/a", "fetched_at": "2024-01-01"})
+        self._write("b", {"url": "https://example.com/b", "final_url": "https://example.com/a", "fetched_at": "2024-02-01"})
+        self._write("c", {"url": "https://example.com/c"})
+
+        with mock.patch.object(artifact_index, "_refresh", wraps=artifact_index._refresh) as refresh:
+            found = artifact_index.lookup_by_urls(
+                ["https://example.com/a", "https://example.com/b", "https://example.com/missing"]
+            )
+
+        self.assertEqual(refresh.call_count, 1)
+        self.assertEqual([row["artifact_id"] for row in found["https://example.com/a"]], ["b", "a"])
+        self.assertEqual([row["artifact_id"] for row in found["https://example.com/b"]], ["b"])
+        self.assertNotIn("https://example.com/missing", found)
+
+    def test_epoch_and_iso_captures_sort_together(self) -> None:
+        self._write("old", {"url": "https://example.com/a", "fetched_at": "2024-01-01T10:00:00+02:00"})
+        self._write("mid", {"url": "https://example.com/a", "fetched_at": 1704110400})  # 2024-01-01T12:00Z
+        self._write("new", {"url": "https://example.com/a", "fetched_at": "2024-03-01T00:00:00Z"})
+
+        rows = artifact_index.lookup_by_url("https://example.com/a")
+
+        self.assertEqual([row["artifact_id"] for row in rows], ["new", "mid", "old"])
+        self.assertEqual(rows[1]["captured_at"], "2024-01-01T12:00:00.000000Z")
+
+    def test_index_from_older_schema_is_rebuilt(self) -> None:
+        self._write("a", {"url": "https://example.com/a", "fetched_at": 1704110400})
+        artifact_index.refresh_index()
+        conn = sqlite3.connect(artifact_index.INDEX_PATH)
+        with conn:
+            conn.execute("UPDATE artifacts SET captured_at = 1704110400")
+            conn.execute("PRAGMA user_version = 0")
+        conn.close()
+
+        rows = artifact_index.lookup_by_url("https://example.com/a")
+
+        self.assertEqual(rows[0]["captured_at"], "2024-01-01T12:00:00.000000Z")
+
+    def test_repeat_lookup_skips_rescan_until_directory_changes(self) -> None:
+        self._write("a", {"url": "https://example.com/a"})
+        self.assertEqual(len(artifact_index.lookup_by_url("https://example.com/a")), 1)
+
+        with mock.patch.object(artifact_index.os, "scandir", side_effect=AssertionError("rescanned")):
+            self.assertEqual(len(artifact_index.lookup_by_url("https://example.com/a")), 1)
+
+        payload = {"url": "https://example.com/a", "doc_id": "doc-a2"}
+        self._write("a", payload, mtime_offset=1_000_000)
+        artifact_index.record_artifact("a", payload)
+        with mock.patch.object(artifact_index.os, "scandir", side_effect=AssertionError("rescanned")):
+            rows = artifact_index.lookup_by_url("https://example.com/a")
+        self.assertEqual(rows[0]["doc_id"], "doc-a2")
+
+        self._write("b", {"url": "https://example.com/a"})
+        self.assertEqual(len(artifact_index.lookup_by_url("https://example.com/a")), 2)
+
+    def test_missing_directory(self) -> None:
+        with mock.patch.object(artifact_index, "ARTIFACT_DIR", self.root / "absent"):
+            self.assertEqual(artifact_index.lookup_by_url("https://example.com/a"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from app.utils import auth_hints
+
+
+class AuthHintsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        snapshot = Path(self.tmpdir.name) / "auth_hints.json"
+        self.patches = [
+            mock.patch.object(auth_hints, "AUTH_HINTS_PATH", snapshot),
+            mock.patch.object(auth_hints, "AUTH_HINTS_LOG_PATH", snapshot.with_suffix(".jsonl")),
+            mock.patch.object(auth_hints, "_state", None),
+            mock.patch.object(auth_hints, "_pending_events", 0),
+            mock.patch.object(auth_hints, "_state_signature", None),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self) -> None:
+        for patch in reversed(self.patches):
+            patch.stop()
+        self.tmpdir.cleanup()
+
+    def _record(self, url: str) -> None:
+        auth_hints.record_auth_hint({"original_url": url, "redirect_host": "cas.example.com"})
+
+    def test_records_append_to_log_without_snapshot(self) -> None:
+        self._record("https://example.com/a")
+        self._record("https://example.com/b")
+
+        self.assertFalse(auth_hints.AUTH_HINTS_PATH.exists())
+        lines = auth_hints.AUTH_HINTS_LOG_PATH.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(len(lines), 2)
+
+        hints = auth_hints.load_auth_hints()
+        self.assertEqual(hints["by_domain"]["example.com"]["count"], 2)
+        self.assertEqual(hints["recent"][0]["original_url"], "https://example.com/b")
+
+    def test_compact_writes_snapshot_and_truncates_log(self) -> None:
+        self._record("https://example.com/a")
+        auth_hints.compact_auth_hints()
+
+        self.assertFalse(auth_hints.AUTH_HINTS_LOG_PATH.exists())
+        snapshot = json.loads(auth_hints.AUTH_HINTS_PATH.read_text(encoding="utf-8"))
+        self.assertEqual(snapshot["by_domain"]["example.com"]["count"], 1)
+
+    def test_replays_log_on_cold_start(self) -> None:
+        self._record("https://example.com/a")
+        auth_hints.compact_auth_hints()
+        self._record("https://other.example.org/b")
+
+        with mock.patch.object(auth_hints, "_state", None):
+            hints = auth_hints.load_auth_hints()
+        self.assertEqual(set(hints["by_domain"]), {"example.com", "other.example.org"})
+        self.assertEqual(len(hints["recent"]), 2)
+
+    def test_picks_up_events_written_by_another_process(self) -> None:
+        self._record("https://example.com/a")
+        self.assertEqual(set(auth_hints.load_auth_hints()["by_domain"]), {"example.com"})
+
+        event = {"domain": "other.example.org", "original_url": "https://other.example.org/x"}
+        with auth_hints.AUTH_HINTS_LOG_PATH.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(event) + "\n")
+
+        hints = auth_hints.load_auth_hints()
+        self.assertEqual(set(hints["by_domain"]), {"example.com", "other.example.org"})
+        self.assertEqual(hints["recent"][0]["original_url"], "https://other.example.org/x")
+
+    def test_recent_is_capped_newest_first(self) -> None:
+        for idx in range(auth_hints.MAX_RECENT_HINTS + 5):
+            self._record(f"https://example.com/{idx}")
+        auth_hints.compact_auth_hints()
+
+        with mock.patch.object(auth_hints, "_state", None):
+            hints = auth_hints.load_auth_hints()
+        self.assertEqual(len(hints["recent"]), auth_hints.MAX_RECENT_HINTS)
+        last = auth_hints.MAX_RECENT_HINTS + 4
+        self.assertEqual(hints["recent"][0]["original_url"], f"https://example.com/{last}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,11 @@
+import os
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
-from app.utils.config import _load_yaml, write_yaml_config
+from app.utils import config
+from app.utils.config import _load_yaml, load_yaml_cached, write_yaml_config
 
 
 class ConfigIOTests(unittest.TestCase):
@@ -17,6 +20,47 @@ class ConfigIOTests(unittest.TestCase):
             loaded = _load_yaml(path)
         self.assertEqual(loaded, payload)
 
+    def test_write_replaces_file_atomically(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "crawler.yml"
+            path.write_text("old: true\n", encoding="utf-8")
+            os.chmod(path, 0o640)
+            write_yaml_config(path, {"new": True})
+            self.assertEqual(_load_yaml(path), {"new": True})
+            self.assertEqual(os.stat(path).st_mode & 0o777, 0o640)
+            self.assertEqual(os.listdir(tmpdir), ["crawler.yml"])
+
+    def test_cached_load_reparses_after_change(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "system.yml"
+            path.write_text("qdrant:\n  collection: a\n", encoding="utf-8")
+            first = load_yaml_cached(path)
+            self.assertIs(load_yaml_cached(path), first)
+
+            path.write_text("qdrant:\n  collection: b\n", encoding="utf-8")
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            self.assertEqual(load_yaml_cached(path)["qdrant"]["collection"], "b")
+
+            write_yaml_config(path, {"qdrant": {"collection": "c"}})
+            self.assertEqual(load_yaml_cached(path)["qdrant"]["collection"], "c")
+
+            # Same mtime, different size: still re-parsed
+            stat = path.stat()
+            path.write_text("qdrant:\n  collection: dd\n", encoding="utf-8")
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            self.assertEqual(load_yaml_cached(path)["qdrant"]["collection"], "dd")
+
+    def test_store_config_caches_a_copy(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with mock.patch.object(config, "CONFIG_DIR", Path(tmpdir)), mock.patch.dict(config._cache):
+                payload = {"allow_rules": [{"id": "a"}]}
+                config.store_config("allow_block", payload)
+                payload["allow_rules"].append({"id": "unsaved"})
+
+                self.assertEqual(load_yaml_cached(Path(tmpdir) / "allow_block.yml"), {"allow_rules": [{"id": "a"}]})
+                self.assertEqual(config.load_config("allow_block"), {"allow_rules": [{"id": "a"}]})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,70 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from app.agents import intent
+from app.models.schemas import IntentOutput
+
+CONFIG = {"agents": {"intent": {"system_prompt": "Classify the question."}}}
+
+
+class IntentCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.patches = [
+            mock.patch.object(intent, "_intent_cache", intent.OrderedDict()),
+            mock.patch.object(intent, "load_agents_config", return_value=CONFIG),
+            mock.patch.dict(intent.ollama.OLLAMA_OPTIONS, {"temperature": 0.0, "seed": 42}),
+        ]
+        for patch in self.patches:
+            patch.start()
+        self.call = mock.AsyncMock(
+            return_value=IntentOutput(intent_label="policy", search_queries=["q"], success_criteria=[])
+        )
+        call_patch = mock.patch.object(intent, "call_ollama_json", self.call)
+        call_patch.start()
+        self.patches.append(call_patch)
+
+    def tearDown(self) -> None:
+        for patch in reversed(self.patches):
+            patch.stop()
+
+    def test_identical_turn_is_served_from_cache(self) -> None:
+        history = [{"role": "user", "content": "hi"}]
+        first = asyncio.run(intent.analyze_intent(history, "What is the policy?"))
+        second = asyncio.run(intent.analyze_intent(history, "What is the policy?"))
+
+        self.assertEqual(self.call.await_count, 1)
+        self.assertEqual(first, second)
+
+    def test_different_question_calls_model(self) -> None:
+        asyncio.run(intent.analyze_intent([], "What is the policy?"))
+        asyncio.run(intent.analyze_intent([], "Who approves leave?"))
+
+        self.assertEqual(self.call.await_count, 2)
+
+    def test_model_and_options_are_part_of_the_key(self) -> None:
+        asyncio.run(intent.analyze_intent([], "What is the policy?"))
+        with mock.patch.object(intent.ollama, "OLLAMA_MODEL", "other:latest"):
+            asyncio.run(intent.analyze_intent([], "What is the policy?"))
+        with mock.patch.dict(intent.ollama.OLLAMA_OPTIONS, {"seed": 7}):
+            asyncio.run(intent.analyze_intent([], "What is the policy?"))
+
+        self.assertEqual(self.call.await_count, 3)
+
+    def test_sampling_temperature_bypasses_cache(self) -> None:
+        with mock.patch.dict(intent.ollama.OLLAMA_OPTIONS, {"temperature": 0.7}):
+            asyncio.run(intent.analyze_intent([], "What is the policy?"))
+            asyncio.run(intent.analyze_intent([], "What is the policy?"))
+
+        self.assertEqual(self.call.await_count, 2)
+        self.assertEqual(len(intent._intent_cache), 0)
+
+    def test_cache_is_bounded(self) -> None:
+        with mock.patch.object(intent, "INTENT_CACHE_SIZE", 2):
+            for question in ("a", "b", "c"):
+                asyncio.run(intent.analyze_intent([], question))
+        self.assertEqual(len(intent._intent_cache), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
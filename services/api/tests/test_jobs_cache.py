@@ -0,0 +1,46 @@
+import asyncio
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import orjson
+
+from app.routes import admin
+from app.utils import jobs
+
+
+class JobsListingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.patches = [
+            mock.patch.object(jobs, "_jobs", {}),
+            mock.patch.object(admin, "_JOBS_JSON_CACHE", None),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self) -> None:
+        for patch in reversed(self.patches):
+            patch.stop()
+
+    def _listing(self) -> bytes:
+        return asyncio.run(admin.get_jobs()).body
+
+    def test_listing_is_reused_until_jobs_change(self) -> None:
+        jobs._jobs["a"] = jobs.JobRecord("a", "crawl", "running", "2024-01-01T00:00:00", None)
+        jobs._bump_version()
+
+        first = self._listing()
+        self.assertIs(self._listing(), first)
+        self.assertEqual(orjson.loads(first)[0]["status"], "running")
+
+        jobs._jobs["a"].status = "completed"
+        jobs._bump_version()
+        self.assertEqual(orjson.loads(self._listing())[0]["status"], "completed")
+
+        with mock.patch.object(jobs, "JOB_LOG_DIR", Path("/nonexistent")):
+            jobs.delete_job("a")
+        self.assertEqual(orjson.loads(self._listing()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
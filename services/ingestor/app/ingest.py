@@ -4,13 +4,13 @@ import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
-import yaml
 from qdrant_client import QdrantClient
 from qdrant_client.http import models as rest
 
 from app.utils.db import connect
 from app.utils.ollama_embed import embed_text
 from app.utils.qdrant import delete_by_doc_id, ensure_collection, upsert_vectors
+from app.utils.yaml_io import load_yaml
 
 ARTIFACT_DIR = Path("/app/data/artifacts")
 CONFIG_PATH = Path("/app/config/system.yml")
@@ -28,7 +28,7 @@ MIN_CHUNK_LENGTH = 40
 
 
 def _load_config(path: Path) -> Dict:
-    return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    return load_yaml(path)
 
 
 def _load_embeddings(texts: List[str], host: str, model: str) -> List[List[float]]:
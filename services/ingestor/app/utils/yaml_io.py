@@ -0,0 +1,15 @@
+from pathlib import Path
+from typing import Any, Dict
+
+import yaml
+
+try:  # LibYAML-backed loader is several times faster than the pure-Python one
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
+
+
+def load_yaml(path: Path) -> Dict[str, Any]:
+    """Parse a YAML config file; an empty file yields {}."""
+    with path.open("rb") as handle:
+        return yaml.load(handle, Loader=YamlLoader) or {}
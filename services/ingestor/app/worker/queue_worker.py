@@ -10,7 +10,6 @@ from typing import Dict, List, Set, Tuple
 
 import httpx
 import redis.asyncio as aioredis
-import yaml
 from qdrant_client import QdrantClient
 from qdrant_client.http import models as rest
 
@@ -20,6 +19,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from app.utils.db import connect, init_db
 from app.utils.ollama_embed import embed_text, embed_texts_async
 from app.utils.qdrant import delete_by_doc_id, ensure_collection, upsert_vectors
+from app.utils.yaml_io import load_yaml
 
 REDIS_URL = os.getenv("REDIS_HOST", "redis://redis:6379/0")
 ARTIFACT_DIR = Path("/app/data/artifacts")
@@ -46,7 +46,7 @@ MIN_CHUNK_LENGTH = 40
 def _load_config(path: Path) -> Dict:
     if not path.exists():
         return {}
-    return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    return load_yaml(path)
 
 
 def _utcnow() -> str:
@@ -40,6 +40,11 @@ from urllib.parse import urlparse
 import yaml
 from playwright.sync_api import sync_playwright
 
+try:
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+
 
 # ---------- Heuristics ----------
 
@@ -87,7 +92,8 @@ def load_yaml(path: Path) -> dict[str, Any]:
     if not path.exists():
         return {}
     try:
-        return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        with path.open("rb") as handle:
+            return yaml.load(handle, Loader=YamlLoader) or {}
     except Exception as e:
         raise SystemExit(f"Failed to read YAML {path}: {e}")
 
@@ -95,7 +101,7 @@ def load_yaml(path: Path) -> dict[str, Any]:
 def save_yaml(path: Path, data: dict[str, Any]) -> None:
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+        path.write_text(yaml.dump(data, Dumper=YamlDumper, sort_keys=False), encoding="utf-8")
     except Exception as e:
         raise SystemExit(f"Failed to write YAML {path}: {e}")
 